@@ -377,6 +377,25 @@ class CrossFilter(object):
         filter_index = left_index * self.right_filter.num_bins + right_index
         return filter_index
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the CrossFilter for an array of bins.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of 2-tuple
+            The bins to find indices for. Each bin takes the same form as the
+            filter_bin parameter of :meth:`CrossFilter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices in the Tally data array for the filter bins
+
+        """
+
+        return np.array([self.get_bin_index(b) for b in filter_bins],
+                        dtype=int)
+
     def get_pandas_dataframe(self, data_size, summary=None):
         """Builds a Pandas DataFrame for the CrossFilter's bins.
 
@@ -752,6 +771,25 @@ class AggregateFilter(object):
         else:
             return self.bins.index(filter_bin)
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the AggregateFilter for an array of bins.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of Integral or Iterable of tuple
+            The bins to find indices for. Each bin takes the same form as the
+            filter_bin parameter of :meth:`AggregateFilter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices in the Tally data array for the filter bins
+
+        """
+
+        return np.array([self.get_bin_index(b) for b in filter_bins],
+                        dtype=int)
+
     def get_pandas_dataframe(self, data_size, summary=None, **kwargs):
         """Builds a Pandas DataFrame for the AggregateFilter's bins.
 
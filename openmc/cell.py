@@ -11,7 +11,7 @@ import numpy as np
 import openmc
 import openmc.checkvalue as cv
 from openmc.surface import Halfspace
-from openmc.region import Region, Intersection, Complement
+from openmc.region import Region, Intersection, Complement, _Observable
 
 
 # A static variable for auto-generated Cell IDs
@@ -24,7 +24,7 @@ def reset_auto_cell_id():
     AUTO_CELL_ID = 10000
 
 
-class Cell(object):
+class Cell(_Observable):
     r"""A region of space defined as the intersection of half-space created by
     quadric surfaces.
 
@@ -113,7 +113,7 @@ class Cell(object):
         if self.region is None:
             return True
         else:
-            return point in self.region
+            return point in self._compiled_region()
 
     def __eq__(self, other):
         if not isinstance(other, Cell):
@@ -269,6 +269,8 @@ class Cell(object):
                 raise ValueError(msg)
 
         self._fill = fill
+        self._watch()
+        self._notify(False)
 
     @rotation.setter
     def rotation(self, rotation):
@@ -279,6 +281,7 @@ class Cell(object):
         cv.check_type('cell rotation', rotation, Iterable, Real)
         cv.check_length('cell rotation', rotation, 3)
         self._rotation = np.asarray(rotation)
+        self._notify(False)
 
         # Save rotation matrix
         phi, theta, psi = self.rotation*(-pi/180.)
@@ -295,6 +298,7 @@ class Cell(object):
         cv.check_type('cell translation', translation, Iterable, Real)
         cv.check_length('cell translation', translation, 3)
         self._translation = np.asarray(translation)
+        self._notify(False)
 
     @temperature.setter
     def temperature(self, temperature):
@@ -326,6 +330,9 @@ class Cell(object):
         if region is not None:
             cv.check_type('cell region', region, Region)
         self._region = region
+        self._program = None
+        self._watch()
+        self._notify()
 
     @volume.setter
     def volume(self, volume):
@@ -388,6 +395,64 @@ class Cell(object):
             else:
                 self.region = Intersection(self.region, region)
 
+    def _compiled_region(self):
+        """Return the region of the cell compiled into a postfix program.
+
+        The program is compiled on first use and reused until the region is
+        modified. The cell is notified of modifications to the regions it is
+        composed of, including changes to their lists of nodes, and discards
+        the program.
+
+        Returns
+        -------
+        openmc.CompiledRegion
+            Compiled region of the cell
+
+        """
+        if self._program is None:
+            self._program = self.region.compile()
+        return self._program
+
+    def _watch(self):
+        """Register the cell with the regions and surfaces it is composed of
+        and with the universe or lattice filling it."""
+        for node in getattr(self, '_watched', ()):
+            node._remove_observer(self)
+
+        self._watched = []
+        seen = set()
+        stack = [getattr(self, name, None) for name in ('_region', '_fill')]
+        stack = [node for node in stack if isinstance(node, _Observable)]
+        while stack:
+            node = stack.pop()
+            if id(node) not in seen:
+                seen.add(id(node))
+                node._add_observer(self)
+                self._watched.append(node)
+                stack.extend(node._children())
+
+    def _on_change(self, source, bounds):
+        """Discard data derived from the part of the geometry that was
+        modified and notify the universes containing the cell.
+
+        Parameters
+        ----------
+        source : object
+            Modified region, surface, universe, or lattice
+        bounds : bool
+            Whether the extent of the modified part may have changed
+
+        """
+        if isinstance(source, Region):
+            self._program = None
+            self._watch()
+        self._notify(bounds)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for node in getattr(self, '_watched', ()):
+            node._add_observer(self)
+
     def add_volume_information(self, volume_calc):
         """Add volume information to a cell.
 
@@ -28,3 +28,5 @@ from .library import *
 from .fission_energy import *
 from .resonance import *
 from .multipole import *
+from .conversion import *
+from .cache import *
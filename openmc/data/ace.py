@@ -16,7 +16,8 @@ generates ACE-format cross sections.
 """
 
 from __future__ import division, unicode_literals
-from os import SEEK_CUR
+import mmap
+import os
 import struct
 import sys
 
@@ -25,6 +26,9 @@ import numpy as np
 
 from openmc.mixin import EqualityMixin
 
+# Number of lines of XSS data parsed at once when reading ASCII tables
+_ASCII_CHUNK_LINES = 8192
+
 
 def ascii_to_binary(ascii_file, binary_file):
     """Convert an ACE file in ASCII format (type 1) to binary format (type 2).
@@ -100,6 +104,121 @@ def ascii_to_binary(ascii_file, binary_file):
     binary.close()
 
 
+def _is_binary(filename):
+    """Determine whether an ACE library is in binary (Type 2) format."""
+    with open(filename, 'rb') as fh:
+        sb = b''.join([fh.readline() for i in range(10)])
+    try:
+        sb.decode('ascii')
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+def _read_headers(filename):
+    """Return the name, temperature and position of each table in an ACE
+    library.
+
+    Only the header of each table is read; the XSS data is skipped over. The
+    position of a table can be passed to :func:`_read_table` to read the
+    table without reading the tables preceding it.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the ACE library
+
+    Returns
+    -------
+    list of tuple
+        Name, temperature in MeV, and position in the file of each table in
+        the library
+
+    """
+    headers = []
+
+    if _is_binary(filename):
+        with open(filename, 'rb') as fh:
+            size = os.fstat(fh.fileno()).st_size
+            position = 0
+            while position < size:
+                fh.seek(position)
+                name, atomic_weight_ratio, temperature = \
+                    struct.unpack(str('=10sdd'), fh.read(26))
+                fh.seek(position + 308)
+                length, = struct.unpack(str('=i'), fh.read(4))
+                headers.append((name.decode().strip(), temperature,
+                                position))
+
+                # Skip the header record and the records holding XSS
+                position += 4096*((length + 511)//512 + 1)
+        return headers
+
+    with open(filename, 'r') as fh:
+        while True:
+            position = fh.tell()
+            lines = [fh.readline() for i in range(2)]
+            if lines[0].strip() == '':
+                break
+
+            # Determine the number of header lines, which includes comment
+            # lines for a 2.0 style header
+            words = lines[0].split()
+            if words[0][1] == '.':
+                name = words[1]
+                words = lines[1].split()
+                temperature = float(words[1])
+                n_header = 12 + int(words[3])
+            else:
+                name = words[0]
+                temperature = float(words[2])
+                n_header = 12
+            lines += [fh.readline() for i in range(n_header - 2)]
+
+            datastr = ' '.join(lines[n_header - 6:n_header - 4])
+            nxs = np.fromstring(datastr, sep=' ', dtype=int)
+            for i in range((nxs[0] + 3)//4):
+                fh.readline()
+            headers.append((name, temperature, position))
+
+    return headers
+
+
+def _read_table(filename, name, position):
+    """Read a single table of an ACE library starting at its header.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the ACE library
+    name : str
+        Name of the table, e.g. '92235.71c'
+    position : int
+        Position of the header of the table in the file as returned by
+        :func:`_read_headers`
+
+    Returns
+    -------
+    openmc.data.ace.Table
+        ACE table with the specified name
+
+    """
+    library = Library.__new__(Library)
+    library.tables = []
+    if _is_binary(filename):
+        with open(filename, 'rb') as fh:
+            library._read_binary(fh, {name}, start_position=position)
+    else:
+        with open(filename, 'r') as fh:
+            fh.seek(position)
+            library._read_ascii(fh, {name})
+
+    if not library.tables or library.tables[0].name != name:
+        raise ValueError('Could not find ACE table with name: {}'
+                         .format(name))
+    return library.tables[0]
+
+
 def get_table(filename, name=None):
     """Read a single table from an ACE file
 
@@ -180,7 +299,7 @@ class Library(EqualityMixin):
                 self._read_binary(fh, table_names, verbose)
 
     def _read_binary(self, ace_file, table_names, verbose=False,
-                     recl_length=4096, entries=512):
+                     recl_length=4096, entries=512, start_position=0):
         """Read a binary (Type 2) ACE table.
 
         Parameters
@@ -197,29 +316,34 @@ class Library(EqualityMixin):
         entries : int, optional
             Number of entries per record. The default is 512 corresponding to a
             record length of 4096 bytes with double precision data.
+        start_position : int, optional
+            Position in the file of the header of the first table to read
 
         """
 
-        while True:
-            start_position = ace_file.tell()
-
-            # Check for end-of-file
-            if len(ace_file.read(1)) == 0:
-                return
-            ace_file.seek(start_position)
+        # Map the file into memory so that the XSS array of each table is a
+        # view of the file's contents rather than a copy. The mapping is
+        # copy-on-write so that tables can still be modified in memory.
+        if os.fstat(ace_file.fileno()).st_size == 0:
+            return
+        data = mmap.mmap(ace_file.fileno(), 0, access=mmap.ACCESS_COPY)
 
+        while start_position < len(data):
             # Read name, atomic mass ratio, temperature, date, comment, and
             # material
             name, atomic_weight_ratio, temperature, date, comment, mat = \
-                struct.unpack(str('=10sdd10s70s10s'), ace_file.read(116))
+                struct.unpack_from(str('=10sdd10s70s10s'), data,
+                                   start_position)
             name = name.decode().strip()
 
             # Read ZAID/awr combinations
-            data = struct.unpack(str('=' + 16*'id'), ace_file.read(192))
-            pairs = list(zip(data[::2], data[1::2]))
+            values = struct.unpack_from(str('=' + 16*'id'), data,
+                                        start_position + 116)
+            pairs = list(zip(values[::2], values[1::2]))
 
             # Read NXS
-            nxs = list(struct.unpack(str('=16i'), ace_file.read(64)))
+            nxs = list(struct.unpack_from(str('=16i'), data,
+                                          start_position + 308))
 
             # Determine length of XSS and number of records
             length = nxs[0]
@@ -227,7 +351,7 @@ class Library(EqualityMixin):
 
             # verify that we are supposed to read this table in
             if (table_names is not None) and (name not in table_names):
-                ace_file.seek(start_position + recl_length*(n_records + 1))
+                start_position += recl_length*(n_records + 1)
                 continue
 
             if verbose:
@@ -235,14 +359,10 @@ class Library(EqualityMixin):
                 print("Loading nuclide {0} at {1} K".format(name, kelvin))
 
             # Read JXS
-            jxs = list(struct.unpack(str('=32i'), ace_file.read(128)))
-
-            # Read XSS
-            ace_file.seek(start_position + recl_length)
-            xss = list(struct.unpack(str('={0}d'.format(length)),
-                                     ace_file.read(length*8)))
+            jxs = list(struct.unpack_from(str('=32i'), data,
+                                          start_position + 372))
 
-            # Insert zeros at beginning of NXS, JXS, and XSS arrays so that the
+            # Insert zeros at beginning of NXS and JXS arrays so that the
             # indexing will be the same as Fortran. This makes it easier to
             # follow the ACE format specification.
             nxs.insert(0, 0)
@@ -251,8 +371,12 @@ class Library(EqualityMixin):
             jxs.insert(0, 0)
             jxs = np.array(jxs, dtype=int)
 
-            xss.insert(0, 0.0)
-            xss = np.array(xss)
+            # XSS starts at the second record. The view starts one value
+            # earlier, in the padding of the first record, so that it has the
+            # same Fortran-style indexing as NXS and JXS.
+            xss = np.frombuffer(data, dtype=np.float64, count=length + 1,
+                                offset=start_position + recl_length - 8)
+            xss[0] = 0.0
 
             # Create ACE table with data read in
             table = Table(name, atomic_weight_ratio, temperature, pairs,
@@ -260,7 +384,7 @@ class Library(EqualityMixin):
             self.tables.append(table)
 
             # Advance to next record
-            ace_file.seek(start_position + recl_length*(n_records + 1))
+            start_position += recl_length*(n_records + 1)
 
     def _read_ascii(self, ace_file, table_names, verbose=False):
         """Read an ASCII (Type 1) ACE table.
@@ -310,27 +434,20 @@ class Library(EqualityMixin):
             nxs = np.fromstring(datastr, sep=' ', dtype=int)
 
             n_lines = (nxs[1] + 3)//4
-            n_bytes = len(lines[-1]) * (n_lines - 2) + 1
 
             # Ensure that we have more tables to read in
             if (table_names is not None) and (table_names < tables_seen):
                 break
             tables_seen.add(name)
 
-            # verify that we are suppossed to read this table in
+            # verify that we are suppossed to read this table in. The first
+            # line of XSS has already been read.
             if (table_names is not None) and (name not in table_names):
-                ace_file.seek(n_bytes, SEEK_CUR)
-                ace_file.readline()
+                for i in range(n_lines - 1):
+                    ace_file.readline()
                 lines = [ace_file.readline() for i in range(13)]
                 continue
 
-            # read and fix over-shoot
-            lines += ace_file.readlines(n_bytes)
-            if 12 + n_lines < len(lines):
-                goback = sum([len(line) for line in lines[12+n_lines:]])
-                lines = lines[:12+n_lines]
-                ace_file.seek(-goback, SEEK_CUR)
-
             if verbose:
                 kelvin = round(temperature * 1e6 / 8.617342e-5)
                 print("Loading nuclide {0} at {1} K".format(name, kelvin))
@@ -341,8 +458,25 @@ class Library(EqualityMixin):
             datastr = '0 ' + ' '.join(lines[8:12])
             jxs = np.fromstring(datastr, dtype=int, sep=' ')
 
-            datastr = '0.0 ' + ''.join(lines[12:12+n_lines])
-            xss = np.fromstring(datastr, sep=' ')
+            # Parse XSS in blocks of lines directly into its final array
+            xss = np.empty(nxs[1] + 1)
+            xss[0] = 0.0
+            position = 1
+            block = lines[12:]
+            n_remaining = n_lines - 1
+            while True:
+                values = np.fromstring(''.join(block), sep=' ')
+                xss[position:position + values.size] = values
+                position += values.size
+                if n_remaining == 0:
+                    break
+                n_block = min(n_remaining, _ASCII_CHUNK_LINES)
+                block = [ace_file.readline() for i in range(n_block)]
+                n_remaining -= n_block
+            if position != xss.size:
+                raise ValueError('Expected {} values in the XSS array of ACE '
+                                 'table {} but found {}.'.format(
+                                     nxs[1], name, position - 1))
 
             table = Table(name, atomic_weight_ratio, temperature, pairs,
                           nxs, jxs, xss)
@@ -0,0 +1,182 @@
+from collections import OrderedDict
+from numbers import Integral
+import os
+
+from six import string_types
+
+import openmc.checkvalue as cv
+from .library import DataLibrary
+from .neutron import IncidentNeutron
+from .thermal import ThermalScattering
+
+
+class DataCache(object):
+    """Cache of nuclear data libraries and files shared within a process.
+
+    Data are keyed on the path of the file, its modification time, and the
+    temperatures that were read, so that a file that changes on disk is read
+    again. Incident neutron data are read lazily (see
+    :meth:`IncidentNeutron.from_hdf5`). When the total size of the cached
+    data libraries and data exceeds the memory budget, the least recently used
+    entries are evicted.
+
+    The memory budget is approximate. The size of each entry is taken to be
+    the size of the file it was read from, which may differ considerably
+    from the memory used by the objects, e.g., for lazily read data.
+
+    Cached objects are shared between all callers and should not be modified.
+
+    Parameters
+    ----------
+    memory_budget : int
+        Maximum total size in bytes of the files of the cached entries
+
+    Attributes
+    ----------
+    memory_budget : int
+        Maximum total size in bytes of the files of the cached entries
+    size : int
+        Total size in bytes of the files of the cached entries
+
+    """
+
+    def __init__(self, memory_budget=2**30):
+        self.memory_budget = memory_budget
+        self._data = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def memory_budget(self):
+        return self._memory_budget
+
+    @property
+    def size(self):
+        return self._size
+
+    @memory_budget.setter
+    def memory_budget(self, memory_budget):
+        cv.check_type('memory budget', memory_budget, Integral)
+        cv.check_greater_than('memory budget', memory_budget, 0, True)
+        self._memory_budget = memory_budget
+        if hasattr(self, '_data'):
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used data until the budget is respected."""
+        while self._size > self.memory_budget and len(self._data) > 1:
+            key, (size, data) = self._data.popitem(last=False)
+            self._size -= size
+
+    def _get(self, cls, path, temperatures, load):
+        """Return data from the cache, reading the file if necessary.
+
+        Parameters
+        ----------
+        cls : type
+            Class of the data
+        path : str
+            Path of the file
+        temperatures : tuple of str or None
+            Temperatures that are read
+        load : callable
+            Function that reads the data given the path
+
+        Returns
+        -------
+        object
+            The cached data
+
+        """
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        key = (cls.__name__, path, stat.st_mtime, temperatures)
+
+        if key in self._data:
+            # Mark the entry as most recently used
+            entry = self._data.pop(key)
+        else:
+            entry = (stat.st_size, load(path))
+            self._size += entry[0]
+        self._data[key] = entry
+        self._evict()
+        return entry[1]
+
+    def get_library(self, path=None):
+        """Return the data library described by a cross_sections.xml file.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path to the XML file. If not provided, the `OPENMC_CROSS_SECTIONS`
+            environment variable is used.
+
+        Returns
+        -------
+        openmc.data.DataLibrary
+            Data library read from the XML file
+
+        """
+        if path is None:
+            path = os.environ.get('OPENMC_CROSS_SECTIONS')
+        if path is None:
+            raise ValueError("Either path or OPENMC_CROSS_SECTIONS "
+                             "environmental variable must be set")
+        cv.check_type('path', path, string_types)
+
+        return self._get(DataLibrary, path, None, DataLibrary.from_xml)
+
+    def get_neutron(self, path, temperatures=None):
+        """Return incident neutron data, reading them only on first use.
+
+        Parameters
+        ----------
+        path : str
+            Path to the HDF5 file
+        temperatures : Iterable of str, optional
+            Temperatures to read, e.g., '294K'. If not given, data at all
+            temperatures are read.
+
+        Returns
+        -------
+        openmc.data.IncidentNeutron
+            Incident neutron data that are loaded lazily
+
+        """
+        if temperatures is not None:
+            if isinstance(temperatures, string_types):
+                temperatures = [temperatures]
+            temperatures = tuple(sorted(set(temperatures)))
+
+        def load(path):
+            return IncidentNeutron.from_hdf5(path, temperatures, lazy=True)
+
+        return self._get(IncidentNeutron, path, temperatures, load)
+
+    def get_thermal(self, path):
+        """Return thermal scattering data, reading them only on first use.
+
+        Parameters
+        ----------
+        path : str
+            Path to the HDF5 file
+
+        Returns
+        -------
+        openmc.data.ThermalScattering
+            Thermal scattering data
+
+        """
+        return self._get(ThermalScattering, path, None,
+                         ThermalScattering.from_hdf5)
+
+    def clear(self):
+        """Remove all data from the cache."""
+        self._data.clear()
+        self._size = 0
+
+
+# Cache shared by the Python API
+DATA_CACHE = DataCache()
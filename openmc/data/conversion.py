@@ -0,0 +1,234 @@
+from __future__ import division, print_function, unicode_literals
+from collections import OrderedDict
+import multiprocessing
+from numbers import Integral
+import os
+from warnings import warn
+
+from six import string_types
+import h5py
+
+from .ace import _read_headers, _read_table
+from .data import K_BOLTZMANN, EV_PER_MEV
+from .fission_energy import FissionEnergyRelease
+from .library import DataLibrary
+from .neutron import IncidentNeutron, _get_metadata
+from .thermal import ThermalScattering, get_thermal_name
+import openmc.checkvalue as cv
+
+
+def _temperature_name(temperature):
+    """Return the HDF5 name of a temperature given in MeV, e.g. '294K'."""
+    kT = temperature*EV_PER_MEV
+    return '{}K'.format(int(round(kT / K_BOLTZMANN)))
+
+
+def _is_converted(path, name, temperatures):
+    """Determine whether an HDF5 file holds data at the given temperatures.
+
+    Parameters
+    ----------
+    path : str
+        Path of the HDF5 file
+    name : str
+        Name of the nuclide or thermal scattering material
+    temperatures : list of str
+        Temperatures that must be present, e.g. '294K'
+
+    Returns
+    -------
+    bool
+        Whether the file exists and contains all the temperatures
+
+    """
+    if not os.path.isfile(path):
+        return False
+    try:
+        with h5py.File(path, 'r') as f:
+            return name in f and set(temperatures) <= set(f[name]['kTs'])
+    except (IOError, OSError, KeyError):
+        return False
+
+
+def _convert_tables(args):
+    """Convert the ACE tables of one nuclide or material to an HDF5 file.
+
+    This function is executed by the worker processes of
+    :func:`ace_to_hdf5`. The file is first written under a temporary name so
+    that an interrupted conversion never leaves a partial file behind. Each
+    table is read starting from the position of its header, so the tables
+    preceding it in the ACE library are not parsed again.
+
+    Parameters
+    ----------
+    args : tuple
+        Name of the nuclide or material, type of data ('neutron' or
+        'thermal'), list of (ACE library, table name, position) tuples, path
+        of the HDF5 file to write, metastable scheme, and path of the fission
+        energy release library or None
+
+    Returns
+    -------
+    name : str
+        Name of the nuclide or material
+    converted : list of str
+        Names of the tables that were converted
+    errors : list of str
+        Messages describing tables that could not be converted
+
+    """
+    name, filetype, tables, path, metastable_scheme, \
+        fission_energy_release = args
+
+    data = None
+    converted = []
+    errors = []
+    for filename, table_name, position in tables:
+        try:
+            table = _read_table(filename, table_name, position)
+            if filetype == 'neutron':
+                if data is None:
+                    data = IncidentNeutron.from_ace(table, metastable_scheme)
+                else:
+                    data.add_temperature_from_ace(table, metastable_scheme)
+            else:
+                if data is None:
+                    data = ThermalScattering.from_ace(table)
+                else:
+                    data.add_temperature_from_ace(table)
+        except Exception as e:
+            errors.append('Failed to convert {}: {}'.format(table_name, e))
+        else:
+            converted.append(table_name)
+
+    if data is None:
+        return name, converted, errors
+
+    # Fission energy release data, if available
+    if filetype == 'neutron' and fission_energy_release is not None:
+        fer = FissionEnergyRelease.from_compact_hdf5(
+            fission_energy_release, data)
+        if fer is not None:
+            data.fission_energy = fer
+
+    partial = path + '.part'
+    data.export_to_hdf5(partial, 'w')
+    if os.path.exists(path):
+        os.remove(path)
+    os.rename(partial, path)
+
+    return name, converted, errors
+
+
+def ace_to_hdf5(libraries, destination='.', metastable_scheme='nndc',
+                fission_energy_release=None, processes=None, overwrite=False,
+                verbose=True):
+    """Convert ACE libraries to an HDF5 data library.
+
+    Tables are grouped by nuclide or thermal scattering material, and all
+    temperatures of a group are written to a single HDF5 file. Groups are
+    converted concurrently by a pool of worker processes. A
+    cross_sections.xml file listing the HDF5 files is written to the
+    destination directory.
+
+    Parameters
+    ----------
+    libraries : str or iterable of str
+        Paths of the ACE libraries to convert
+    destination : str, optional
+        Directory in which the HDF5 files are written
+    metastable_scheme : {'nndc', 'mcnp'}
+        Determine how ZAID identifiers are to be interpreted in the case of
+        a metastable nuclide. See :meth:`IncidentNeutron.from_ace`.
+    fission_energy_release : str or None, optional
+        HDF5 file containing a library of fission energy release data
+    processes : int or None, optional
+        Number of worker processes. If None, the number of CPUs is used.
+    overwrite : bool, optional
+        Whether to convert nuclides whose HDF5 file already contains data at
+        every temperature being converted. By default, such nuclides are
+        skipped, which allows an interrupted conversion to be resumed.
+    verbose : bool, optional
+        Whether to print the progress of the conversion
+
+    Returns
+    -------
+    openmc.data.DataLibrary
+        Data library of the HDF5 files
+
+    """
+    if isinstance(libraries, string_types):
+        libraries = [libraries]
+    cv.check_iterable_type('ACE libraries', libraries, string_types)
+    cv.check_type('destination', destination, string_types)
+    cv.check_value('metastable scheme', metastable_scheme, ['nndc', 'mcnp'])
+    if processes is not None:
+        cv.check_type('number of processes', processes, Integral)
+        cv.check_greater_than('number of processes', processes, 0)
+
+    if not os.path.isdir(destination):
+        os.makedirs(destination)
+
+    # Group the tables by the nuclide or material they describe
+    groups = OrderedDict()
+    for filename in libraries:
+        if not os.path.exists(filename):
+            warn("ACE library '{}' does not exist.".format(filename))
+            continue
+
+        for table_name, temperature, position in _read_headers(filename):
+            zaid, xs = table_name.split('.')
+            if xs.endswith('c'):
+                filetype = 'neutron'
+                name = _get_metadata(int(zaid), metastable_scheme)[0]
+            elif xs.endswith('t'):
+                filetype = 'thermal'
+                name = get_thermal_name(zaid)
+            else:
+                continue
+
+            if name not in groups:
+                path = os.path.join(destination,
+                                    name.replace('.', '_') + '.h5')
+                groups[name] = (filetype, path, [], [])
+            groups[name][2].append((filename, table_name, position))
+            groups[name][3].append(_temperature_name(temperature))
+
+    # Determine which groups still need to be converted
+    jobs = []
+    for name, (filetype, path, tables, temperatures) in groups.items():
+        if not overwrite and _is_converted(path, name, temperatures):
+            if verbose:
+                print('Skipping {} (already converted)'.format(name))
+            continue
+        jobs.append((name, filetype, tables, path, metastable_scheme,
+                     fission_energy_release))
+
+    n_workers = min(len(jobs), processes or multiprocessing.cpu_count())
+    pool = multiprocessing.Pool(n_workers) if n_workers > 1 else None
+
+    try:
+        if pool is None:
+            results = (_convert_tables(job) for job in jobs)
+        else:
+            results = pool.imap_unordered(_convert_tables, jobs)
+
+        for i, (name, converted, errors) in enumerate(results):
+            for message in errors:
+                warn(message)
+            if verbose and converted:
+                print('[{}/{}] Converted {} (ACE) to {} (HDF5)'.format(
+                    i + 1, len(jobs), ', '.join(converted), name))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # Register files in a deterministic order
+    library = DataLibrary()
+    for name, (filetype, path, tables, temperatures) in groups.items():
+        if os.path.isfile(path):
+            library.register_file(path)
+    library.export_to_xml(os.path.join(destination, 'cross_sections.xml'))
+
+    return library
@@ -9,10 +9,13 @@ http://www-nds.iaea.org/ndspub/documents/endf/endf102/endf102.pdf
 from __future__ import print_function, division, unicode_literals
 
 import io
+import mmap
 import re
 import os
+import tempfile
+import zipfile
 from math import pi
-from collections import OrderedDict, Iterable
+from collections import OrderedDict, Iterable, MutableMapping
 
 from six import string_types
 import numpy as np
@@ -48,6 +51,20 @@ SUM_RULES = {1: [2, 3],
 
 _ENDF_FLOAT_RE = re.compile(r'([\s\-\+]?\d*\.\d+)([\+\-]\d+)')
 
+# Suffix of the section index cached next to an ENDF file
+_INDEX_SUFFIX = '.idx'
+
+# os.replace is not available in Python 2, where os.rename overwrites the
+# destination atomically on POSIX systems
+_replace = getattr(os, 'replace', os.rename)
+
+# Number of bytes of an ENDF file scanned at once when building an index
+_INDEX_CHUNK_SIZE = 1 << 26
+
+_INDEX_DTYPE = np.dtype([('material', np.int64), ('MAT', np.int64),
+                         ('MF', np.int64), ('MT', np.int64),
+                         ('offset', np.int64), ('length', np.int64)])
+
 
 def float_endf(s):
     """Convert string of floating point number in ENDF to float.
@@ -72,6 +89,74 @@ def float_endf(s):
     return float(_ENDF_FLOAT_RE.sub(r'\1e\2', s))
 
 
+def _float_endf_array(fields):
+    """Convert an array of 11-character ENDF fields to floats.
+
+    This is a vectorized version of :func:`float_endf`. The 'e' of each 'e-less'
+    number is inserted by locating its exponent sign, i.e. a '+' or '-' that
+    follows a digit or a decimal point.
+
+    Parameters
+    ----------
+    fields : numpy.ndarray
+        Array of fields with a bytes dtype, e.g. 'S11'
+
+    Returns
+    -------
+    numpy.ndarray
+        The numbers
+
+    """
+    n, width = len(fields), fields.dtype.itemsize
+    chars = np.frombuffer(fields.tobytes(), dtype=np.uint8).reshape(n, width)
+
+    # Find the exponent sign of each field, if any
+    sign = (chars[:, 1:] == ord('+')) | (chars[:, 1:] == ord('-'))
+    previous = chars[:, :-1]
+    mantissa = ((previous >= ord('0')) & (previous <= ord('9'))) | \
+        (previous == ord('.'))
+    exponent = sign & mantissa
+    has_exponent = exponent.any(axis=1)
+    position = np.where(has_exponent, exponent.argmax(axis=1) + 1, width)
+
+    # Shift the exponent of each field right by one character and put an 'e'
+    # (or a trailing space if there is no exponent) in the gap
+    columns = np.arange(width + 1)
+    source = np.where(columns < position[:, np.newaxis], columns, columns - 1)
+    source = np.minimum(source, width - 1)
+    result = chars[np.arange(n)[:, np.newaxis], source]
+    gap = columns == position[:, np.newaxis]
+    result[gap] = np.where(has_exponent, ord('e'), ord(' '))
+
+    return result.view('S{}'.format(width + 1)).ravel().astype(float)
+
+
+def _get_fields(file_obj, n_values):
+    """Read 11-character fields from consecutive lines of an ENDF-6 file.
+
+    Parameters
+    ----------
+    file_obj : file-like object
+        ENDF-6 file to read from
+    n_values : int
+        Number of fields to read. Each line holds six fields.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the fields as bytes with dtype 'S11'
+
+    """
+    if n_values == 0:
+        return np.empty(0, dtype='S11')
+
+    n_lines = (n_values + 5)//6
+    lines = [file_obj.readline()[:66].rstrip('\r\n').ljust(66)
+             for i in range(n_lines)]
+    data = ''.join(lines).encode('ascii')
+    return np.frombuffer(data, dtype='S11')[:n_values]
+
+
 def get_text_record(file_obj):
     """Return data from a TEXT record in an ENDF-6 file.
 
@@ -165,12 +250,7 @@ def get_list_record(file_obj):
     NPL = items[4]
 
     # read items
-    b = []
-    for i in range((NPL - 1)//6 + 1):
-        line = file_obj.readline()
-        n = min(6, NPL - 6*i)
-        for j in range(n):
-            b.append(float_endf(line[11*j:11*(j + 1)]))
+    b = _float_endf_array(_get_fields(file_obj, NPL)).tolist()
 
     return (items, b)
 
@@ -202,30 +282,14 @@ def get_tab1_record(file_obj):
     params = [C1, C2, L1, L2]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for i in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for j in range(to_read):
-            breakpoints[m] = int(line[0:11])
-            interpolation[m] = int(line[11:22])
-            line = line[22:]
-            m += 1
+    regions = _get_fields(file_obj, 2*n_regions).astype(int)
+    breakpoints = regions[0::2]
+    interpolation = regions[1::2]
 
     # Read tabulated pairs x(n) and y(n)
-    x = np.zeros(n_pairs)
-    y = np.zeros(n_pairs)
-    m = 0
-    for i in range((n_pairs - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_pairs - m)
-        for j in range(to_read):
-            x[m] = float_endf(line[:11])
-            y[m] = float_endf(line[11:22])
-            line = line[22:]
-            m += 1
+    pairs = _float_endf_array(_get_fields(file_obj, 2*n_pairs))
+    x = pairs[0::2].copy()
+    y = pairs[1::2].copy()
 
     return params, Tabulated1D(x, y, breakpoints, interpolation)
 
@@ -236,23 +300,211 @@ def get_tab2_record(file_obj):
     n_regions = params[4]
 
     # Read the interpolation region data, namely NBT and INT
-    breakpoints = np.zeros(n_regions, dtype=int)
-    interpolation = np.zeros(n_regions, dtype=int)
-    m = 0
-    for i in range((n_regions - 1)//3 + 1):
-        line = file_obj.readline()
-        to_read = min(3, n_regions - m)
-        for j in range(to_read):
-            breakpoints[m] = int(line[0:11])
-            interpolation[m] = int(line[11:22])
-            line = line[22:]
-            m += 1
+    regions = _get_fields(file_obj, 2*n_regions).astype(int)
+    breakpoints = regions[0::2]
+    interpolation = regions[1::2]
 
     return params, Tabulated2D(breakpoints, interpolation)
 
+def _control_numbers(chars):
+    """Convert a matrix of right-justified integer characters to integers."""
+    digits = (chars >= ord('0')) & (chars <= ord('9'))
+    values = np.where(digits, chars.astype(np.int64) - ord('0'), 0)
+    powers = 10**np.arange(chars.shape[1] - 1, -1, -1)
+    sign = np.where((chars == ord('-')).any(axis=1), -1, 1)
+    return sign*values.dot(powers)
+
+
+def _index_sections(data):
+    """Locate each section in the memory-mapped contents of an ENDF file.
+
+    Parameters
+    ----------
+    data : mmap.mmap or bytes
+        Contents of an ENDF-6 formatted file
+
+    Returns
+    -------
+    numpy.ndarray
+        Structured array with one entry per section
+
+    """
+    size = len(data)
+    starts, ends, control = [], [], []
+
+    # Scan the file in chunks of whole lines so that temporary arrays stay
+    # bounded in size for large tapes
+    position = 0
+    while position < size:
+        stop = data.find(b'\n', min(position + _INDEX_CHUNK_SIZE, size) - 1)
+        stop = size if stop == -1 else stop + 1
+        buf = np.frombuffer(data[position:stop], dtype=np.uint8)
+
+        line_ends = np.flatnonzero(buf == ord('\n'))
+        if line_ends.size == 0 or line_ends[-1] != buf.size - 1:
+            line_ends = np.append(line_ends, buf.size)
+        line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+
+        # Only lines long enough to hold MAT/MF/MT are records
+        record = line_ends - line_starts >= 75
+        line_starts = line_starts[record]
+        line_ends = line_ends[record]
+        chars = buf[line_starts[:, np.newaxis] + np.arange(66, 75)]
+
+        starts.append(line_starts + position)
+        ends.append(line_ends + position + 1)
+        control.append(chars)
+        position = stop
+
+    if not starts:
+        return np.empty(0, dtype=_INDEX_DTYPE)
+    starts = np.concatenate(starts)
+    ends = np.minimum(np.concatenate(ends), size)
+    control = np.concatenate(control)
+    MAT = _control_numbers(control[:, 0:4])
+    MF = _control_numbers(control[:, 4:6])
+    MT = _control_numbers(control[:, 6:9])
+
+    # Materials are delimited by MEND records, which have all of MAT, MF, and
+    # MT equal to zero. Data following the TEND record is ignored.
+    tend = np.flatnonzero(MAT == -1)
+    n_records = tend[0] if tend.size > 0 else MAT.size
+    mend = (MAT == 0) & (MF == 0) & (MT == 0)
+    material = np.cumsum(mend) - mend
+
+    # Group consecutive lines belonging to the same section
+    lines = np.flatnonzero((MAT[:n_records] > 0) & (MF[:n_records] > 0) &
+                           (MT[:n_records] > 0))
+    if lines.size == 0:
+        return np.empty(0, dtype=_INDEX_DTYPE)
+    first = np.ones(lines.size, dtype=bool)
+    first[1:] = ((np.diff(lines) > 1) |
+                 (np.diff(material[lines]) != 0) |
+                 (np.diff(MF[lines]) != 0) |
+                 (np.diff(MT[lines]) != 0))
+    head = lines[first]
+    tail = lines[np.concatenate((np.flatnonzero(first)[1:] - 1,
+                                 [lines.size - 1]))]
+
+    index = np.empty(head.size, dtype=_INDEX_DTYPE)
+    index['material'] = np.unique(material[head], return_inverse=True)[1]
+    index['MAT'] = MAT[head]
+    index['MF'] = MF[head]
+    index['MT'] = MT[head]
+    index['offset'] = starts[head]
+    index['length'] = ends[tail] - starts[head]
+    return index
+
+
+def _map_file(filename):
+    """Memory-map an ENDF file for reading."""
+    with open(filename, 'rb') as fh:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _MappedFile(object):
+    """Memory map of an ENDF file shared by the evaluations read from it.
+
+    Each mapping holds a file descriptor, so all materials of a file share one
+    mapping. It is unmapped once the last of its users has released it.
+
+    Parameters
+    ----------
+    filename : str
+        Path to ENDF-6 formatted file
+
+    """
+    def __init__(self, filename):
+        self.data = _map_file(filename)
+        self._users = 0
+
+    def acquire(self):
+        """Register a user of the mapping and return the mapped file."""
+        self._users += 1
+        return self.data
+
+    def release(self):
+        """Unregister a user, unmapping the file after the last one."""
+        self._users -= 1
+        if self._users == 0 and self.data is not None:
+            self.data.close()
+            self.data = None
+
+
+def get_section_index(filename, cache=True):
+    """Return the location of each section within an ENDF file.
+
+    Building the index requires a single pass over the file. When `cache` is
+    True, the index is saved next to the file with a '.idx' suffix and is
+    reused until the file is modified. The cache is written to a temporary
+    file that then replaces the old cache, so concurrent readers never see a
+    partially written index. A cache that cannot be read is rebuilt.
+
+    Parameters
+    ----------
+    filename : str
+        Path to ENDF-6 formatted file
+    cache : bool
+        Whether to read and write a cached index
+
+    Returns
+    -------
+    numpy.ndarray
+        Structured array with fields 'material' (position of the material
+        within the file starting from zero), 'MAT', 'MF', 'MT', 'offset', and
+        'length', the latter two giving the section's location in bytes
+
+    """
+    stat = os.stat(filename)
+    index_file = filename + _INDEX_SUFFIX
+
+    if cache and os.path.isfile(index_file):
+        try:
+            with np.load(index_file) as cached:
+                if (cached['size'] == stat.st_size and
+                        cached['mtime'] == stat.st_mtime):
+                    return cached['index']
+        except (IOError, OSError, EOFError, KeyError, ValueError,
+                zipfile.BadZipfile):
+            pass
+
+    data = _map_file(filename)
+    try:
+        index = _index_sections(data)
+    finally:
+        data.close()
+
+    if cache:
+        _write_index(index_file, index, stat)
+
+    return index
+
+
+def _write_index(index_file, index, stat):
+    """Atomically write the cached section index of an ENDF file."""
+    try:
+        fd, partial = tempfile.mkstemp(
+            suffix=_INDEX_SUFFIX, dir=os.path.dirname(index_file) or '.')
+    except (IOError, OSError):
+        return
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            np.savez(fh, index=index, size=stat.st_size, mtime=stat.st_mtime)
+        os.chmod(partial, stat.st_mode & 0o666)
+        _replace(partial, index_file)
+    except (IOError, OSError):
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+
+
 def get_evaluations(filename):
     """Return a list of all evaluations within an ENDF file.
 
+    Sections of each evaluation are read from the file only when they are
+    accessed, using the index returned by :func:`get_section_index`.
+
     Parameters
     ----------
     filename : str
@@ -264,21 +516,84 @@ def get_evaluations(filename):
         A list of :class:`openmc.data.endf.Evaluation` instances.
 
     """
-    evaluations = []
-    with open(filename, 'r') as fh:
-        while True:
-            pos = fh.tell()
-            line = fh.readline()
-            if line[66:70] == '  -1':
-                break
-            fh.seek(pos)
-            evaluations.append(Evaluation(fh))
-    return evaluations
+    index = get_section_index(filename)
+
+    # Hold the mapping while the evaluations are created so that it is
+    # released if there are none or one of them cannot be read
+    mapped = _MappedFile(filename)
+    mapped.acquire()
+    try:
+        return [Evaluation._from_index(mapped, index[index['material'] == i])
+                for i in np.unique(index['material'])]
+    finally:
+        mapped.release()
+
+
+class _Sections(MutableMapping):
+    """Mapping of (MF, MT) to the text of sections in a memory-mapped file.
+
+    The text of a section is decoded the first time it is accessed.
+
+    Parameters
+    ----------
+    mapped : openmc.data.endf._MappedFile
+        Shared memory map of the ENDF file
+    index : numpy.ndarray
+        Entries of the file's index for a single material
+
+    """
+    def __init__(self, mapped, index):
+        self._mapped = mapped
+        self._data = mapped.acquire()
+        self._sections = OrderedDict(
+            ((int(mf), int(mt)), (int(offset), int(length)))
+            for mf, mt, offset, length in
+            zip(index['MF'], index['MT'], index['offset'], index['length']))
+
+    def __getitem__(self, key):
+        value = self._sections[key]
+        if isinstance(value, tuple):
+            if self._data is None:
+                raise ValueError('Unable to read section {} since the ENDF '
+                                 'file has been closed.'.format(key))
+            offset, length = value
+            value = self._data[offset:offset + length].decode('ascii')
+            if '\r' in value:
+                value = value.replace('\r\n', '\n')
+            self._sections[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._sections[key] = value
+
+    def __delitem__(self, key):
+        del self._sections[key]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def close(self):
+        """Release the mapped file, which is unmapped once no other material
+        uses it. Sections that were already read remain available."""
+        if self._data is not None:
+            self._data = None
+            self._mapped.release()
 
 
 class Evaluation(object):
     """ENDF material evaluation with multiple files/sections
 
+    When a path is given, the file is memory-mapped and the text of each
+    section is read only when it is first accessed. The location of each
+    section is taken from an index cached next to the file (see
+    :func:`get_section_index`). The mapping is released by :meth:`close`, when
+    the evaluation is used as a context manager, or when it is garbage
+    collected. Evaluations returned by :func:`get_evaluations` share one
+    mapping, which is unmapped when the last of them is released.
+
     Parameters
     ----------
     filename_or_obj : str or file-like
@@ -298,19 +613,82 @@ class Evaluation(object):
         List of sections in the evaluation. The entries of the tuples are the
         file (MF), section (MT), number of records (NC), and modification
         indicator (MOD).
+    section : Mapping
+        Text of each section in the evaluation indexed by (MF, MT).
 
     """
     def __init__(self, filename_or_obj):
-        if isinstance(filename_or_obj, string_types):
-            fh = open(filename_or_obj, 'r')
-        else:
-            fh = filename_or_obj
-        self.section = {}
         self.info = {}
         self.target = {}
         self.projectile = {}
         self.reaction_list = []
 
+        if isinstance(filename_or_obj, string_types):
+            index = get_section_index(filename_or_obj)
+            index = index[index['material'] == 0]
+            if index.size == 0:
+                raise ValueError('No ENDF material was found in {}.'
+                                 .format(filename_or_obj))
+            self.material = int(index['MAT'][0])
+            self.section = _Sections(_MappedFile(filename_or_obj), index)
+        else:
+            self._read_sections(filename_or_obj)
+
+        self._read_header()
+
+    @classmethod
+    def _from_index(cls, mapped, index):
+        """Create an evaluation whose sections are read from a mapped file.
+
+        Parameters
+        ----------
+        mapped : openmc.data.endf._MappedFile
+            Shared memory map of the ENDF file
+        index : numpy.ndarray
+            Entries of the file's index for a single material
+
+        Returns
+        -------
+        openmc.data.endf.Evaluation
+            Evaluation of the material
+
+        """
+        ev = cls.__new__(cls)
+        ev.info = {}
+        ev.target = {}
+        ev.projectile = {}
+        ev.reaction_list = []
+        ev.material = int(index['MAT'][0])
+        ev.section = _Sections(mapped, index)
+        ev._read_header()
+        return ev
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Release the memory-mapped ENDF file. A file shared with other
+        evaluations is unmapped when the last of them is released.
+
+        Sections that have already been accessed remain available after the
+        evaluation is closed.
+
+        """
+        if isinstance(getattr(self, 'section', None), _Sections):
+            self.section.close()
+
+    def _read_sections(self, fh):
+        self.section = {}
+
         # Determine MAT number for this evaluation
         MF = 0
         while MF == 0:
@@ -337,16 +715,14 @@ class Evaluation(object):
                 fh.readline()
                 break
 
-            section_data = ''
+            section_data = []
             while True:
                 line = fh.readline()
                 if line[72:75] == '  0':
                     break
                 else:
-                    section_data += line
-            self.section[MF, MT] = section_data
-
-        self._read_header()
+                    section_data.append(line)
+            self.section[MF, MT] = ''.join(section_data)
 
     def _read_header(self):
         file_obj = io.StringIO(self.section[1, 451])
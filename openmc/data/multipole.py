@@ -33,6 +33,9 @@ _FIT_T = 0       # Total
 _FIT_A = 1       # Absorption
 _FIT_F = 2       # Fission
 
+# Number of energies evaluated together by WindowedMultipole
+_EVALUATE_CHUNK_SIZE = 8192
+
 
 def _faddeeva(z):
     r"""Evaluate the complex Faddeeva function.
@@ -63,21 +66,20 @@ def _faddeeva(z):
 
     Parameters
     ----------
-    z : complex
+    z : complex or numpy.ndarray of complex
         Argument to the Faddeeva function.
 
     Returns
     -------
-    complex
+    complex or numpy.ndarray of complex
         :math:`\frac{i}{\pi} \int_{-\infty}^{\infty} \frac{1}{z - t} \exp(-t^2)
         \text{d}t`
 
     """
     from scipy.special import wofz
-    if np.angle(z) > 0:
-        return wofz(z)
-    else:
-        return -np.conj(wofz(z))
+    upper = np.imag(z) > 0
+    w = wofz(np.where(upper, z, np.conj(z)))
+    return np.where(upper, w, -np.conj(w))
 
 
 def _broaden_wmp_polynomials(E, dopp, n):
@@ -88,7 +90,7 @@ def _broaden_wmp_polynomials(E, dopp, n):
 
     Parameters
     ----------
-    E : Real
+    E : Real or numpy.ndarray
         Energy to evaluate at.
     dopp : Real
         sqrt(atomic weight ratio / kT) in units of eV.
@@ -98,37 +100,38 @@ def _broaden_wmp_polynomials(E, dopp, n):
     Returns
     -------
     numpy.ndarray
-        The value of each Doppler-broadened curvefit polynomial term.
+        The value of each Doppler-broadened curvefit polynomial term. The
+        first axis indexes the terms and any remaining axes match the shape of
+        the energy.
 
     """
+    from scipy.special import erf
+
+    E = np.asarray(E, dtype=float)
     sqrtE = np.sqrt(E)
     beta = sqrtE * dopp
     half_inv_dopp2 = 0.5 / dopp**2
     quarter_inv_dopp4 = half_inv_dopp2**2
 
-    if beta > 6.0:
-        # Save time, ERF(6) is 1 to machine precision.
-        # beta/sqrtpi*exp(-beta**2) is also approximately 1 machine epsilon.
-        erf_beta = 1.0
-        exp_m_beta2 = 0.0
-    else:
-        erf_beta = np.erf(beta)
-        exp_m_beta2 = np.exp(-beta**2)
+    # Save time, ERF(6) is 1 to machine precision.
+    # beta/sqrtpi*exp(-beta**2) is also approximately 1 machine epsilon.
+    erf_beta = np.where(beta > 6.0, 1.0, erf(beta))
+    exp_m_beta2 = np.where(beta > 6.0, 0.0, np.exp(-beta**2))
 
     # Assume that, for sure, we'll use a second order (1/E, 1/V, const)
     # fit, and no less.
 
-    factors = np.zeros(n)
+    factors = np.zeros((n,) + E.shape)
 
     factors[0] = erf_beta / E
     factors[1] = 1.0 / sqrtE
     factors[2] = (factors[0] * (half_inv_dopp2 + E)
                   + exp_m_beta2 / (beta * np.sqrt(np.pi)))
 
-    # Perform recursive broadening of high order components.  range(1, n-4)
-    # replaces a do i = 1, n=3.  All indices are reduced by one due to the
+    # Perform recursive broadening of high order components.  range(1, n-2)
+    # replaces a do i = 1, n-3.  All indices are reduced by one due to the
     # 1-based vs. 0-based indexing.
-    for i in range(1, n-4):
+    for i in range(1, n-2):
         if i != 1:
             factors[i+2] = (-factors[i-2] * (i - 1.0) * i * quarter_inv_dopp4
                 + factors[i] * (E + (1.0 + 2.0 * i) * half_inv_dopp2))
@@ -504,23 +507,56 @@ class WindowedMultipole(EqualityMixin):
     def _evaluate(self, E, T):
         """Compute total, absorption, and fission cross sections.
 
+        Energies are evaluated in blocks. Within a block, every energy is
+        paired with each pole of its window so that the pole contributions
+        are computed with a single call to the Faddeeva function.
+
         Parameters
         ----------
-        E : Real
-            Energy of the incident neutron in eV.
+        E : numpy.ndarray
+            One-dimensional array of energies of the incident neutron in eV.
         T : Real
             Temperature of the target in K.
 
         Returns
         -------
-        3-tuple of Real
+        3-tuple of numpy.ndarray
             Total, absorption, and fission microscopic cross sections at the
-            given energy and temperature.
+            given energies and temperature.
 
         """
 
-        if E < self.start_E: return (0, 0, 0)
-        if E >= self.end_E: return (0, 0, 0)
+        sigT = np.zeros(E.shape)
+        sigA = np.zeros(E.shape)
+        sigF = np.zeros(E.shape)
+
+        # Energies outside of the library have zero cross sections
+        inside = np.flatnonzero((E >= self.start_E) & (E < self.end_E))
+        for i in range(0, inside.size, _EVALUATE_CHUNK_SIZE):
+            index = inside[i:i + _EVALUATE_CHUNK_SIZE]
+            sigT[index], sigA[index], sigF[index] = \
+                self._evaluate_chunk(E[index], T)
+
+        return sigT, sigA, sigF
+
+    def _evaluate_chunk(self, E, T):
+        """Compute cross sections at energies within the library.
+
+        Parameters
+        ----------
+        E : numpy.ndarray
+            One-dimensional array of energies of the incident neutron in eV,
+            all of which lie within [start_E, end_E).
+        T : Real
+            Temperature of the target in K.
+
+        Returns
+        -------
+        3-tuple of numpy.ndarray
+            Total, absorption, and fission microscopic cross sections at the
+            given energies and temperature.
+
+        """
 
         # ======================================================================
         # Bookkeeping
@@ -529,107 +565,87 @@ class WindowedMultipole(EqualityMixin):
         sqrtkT = np.sqrt(K_BOLTZMANN * T)
         sqrtE = np.sqrt(E)
         invE = 1.0 / E
-        dopp = self.sqrtAWR / sqrtkT
 
         # Locate us.  The i_window calc omits a + 1 present in F90 because of
         # the 1-based vs. 0-based indexing.  Similarly startw needs to be
         # decreased by 1.  endw does not need to be decreased because
         # range(startw, endw) does not include endw.
-        i_window = int(np.floor((sqrtE - np.sqrt(self.start_E)) / self.spacing))
+        i_window = np.floor((sqrtE - np.sqrt(self.start_E))
+                            / self.spacing).astype(int)
         startw = self.w_start[i_window] - 1
         endw = self.w_end[i_window]
 
         # Fill in factors.  Because of the unique interference dips in scatering
         # resonances, the total cross section has a special "factor" that does
         # not appear in the absorption and fission equations.
-        if startw <= endw:
-            twophi = np.zeros(self.num_l, dtype=np.float)
-            sigT_factor = np.zeros(self.num_l, dtype=np.cfloat)
-
-            for iL in range(self.num_l):
-                twophi[iL] = self.pseudo_k0RS[iL] * sqrtE
-                if iL == 1:
-                    twophi[iL] = twophi[iL] - np.arctan(twophi[iL])
-                elif iL == 2:
-                    arg = 3.0 * twophi[iL] / (3.0 - twophi[iL]**2)
-                    twophi[iL] = twophi[iL] - np.arctan(arg)
-                elif iL == 3:
-                    arg = (twophi[iL] * (15.0 - twophi[iL]**2)
-                           / (15.0 - 6.0 * twophi[iL]**2))
-                    twophi[iL] = twophi[iL] - np.arctan(arg)
-
-            twophi = 2.0 * twophi
-            sigT_factor = np.cos(twophi) - 1j*np.sin(twophi)
-
-        # Initialize the ouptut cross sections.
-        sigT = 0.0
-        sigA = 0.0
-        sigF = 0.0
+        twophi = np.outer(self.pseudo_k0RS, sqrtE)
+        if self.num_l > 1:
+            twophi[1] = twophi[1] - np.arctan(twophi[1])
+        if self.num_l > 2:
+            arg = 3.0 * twophi[2] / (3.0 - twophi[2]**2)
+            twophi[2] = twophi[2] - np.arctan(arg)
+        if self.num_l > 3:
+            arg = (twophi[3] * (15.0 - twophi[3]**2)
+                   / (15.0 - 6.0 * twophi[3]**2))
+            twophi[3] = twophi[3] - np.arctan(arg)
+
+        twophi = 2.0 * twophi
+        sigT_factor = np.cos(twophi) - 1j*np.sin(twophi)
 
         # ======================================================================
         # Add the contribution from the curvefit polynomial.
 
-        if sqrtkT != 0 and self.broaden_poly[i_window]:
-            # Broaden the curvefit.
-            broadened_polynomials = _broaden_wmp_polynomials(E, dopp,
-                                                             self.fit_order + 1)
-            for i_poly in range(self.fit_order+1):
-                sigT += (self.curvefit[i_window, i_poly, _FIT_T]
-                         * broadened_polynomials[i_poly])
-                sigA += (self.curvefit[i_window, i_poly, _FIT_A]
-                         * broadened_polynomials[i_poly])
-                sigF += (self.curvefit[i_window, i_poly, _FIT_F]
-                         * broadened_polynomials[i_poly])
-        else:
-            temp = invE
-            for i_poly in range(self.fit_order+1):
-                sigT += self.curvefit[i_window, i_poly, _FIT_T] * temp
-                sigA += self.curvefit[i_window, i_poly, _FIT_A] * temp
-                sigF += self.curvefit[i_window, i_poly, _FIT_F] * temp
-                temp *= sqrtE
+        # Unbroadened polynomial terms, 1/E, 1/sqrt(E), 1, sqrt(E), ...
+        polynomials = invE * sqrtE**np.arange(self.fit_order + 1)[:, None]
+        if sqrtkT != 0:
+            # Broaden the curvefit in windows that require it.
+            dopp = self.sqrtAWR / sqrtkT
+            broaden = self.broaden_poly[i_window]
+            if broaden.any():
+                polynomials[:, broaden] = _broaden_wmp_polynomials(
+                    E[broaden], dopp, self.fit_order + 1)
+
+        curvefit = self.curvefit[i_window]
+        sigT = np.einsum('ij,ji->i', curvefit[:, :, _FIT_T], polynomials)
+        sigA = np.einsum('ij,ji->i', curvefit[:, :, _FIT_A], polynomials)
+        sigF = np.einsum('ij,ji->i', curvefit[:, :, _FIT_F], polynomials)
 
         # ======================================================================
         # Add the contribution from the poles in this window.
 
+        # Pair each energy with every pole in its window
+        n_poles = np.maximum(endw - startw, 0)
+        i_energy = np.repeat(np.arange(E.size), n_poles)
+        first = np.cumsum(n_poles) - n_poles
+        i_pole = (np.arange(i_energy.size)
+                  + np.repeat(startw - first, n_poles))
+        if i_pole.size == 0:
+            return sigT, sigA, sigF
+
+        data = self.data[i_pole]
+        factor = sigT_factor[self.l_value[i_pole] - 1, i_energy]
         if sqrtkT == 0.0:
             # If at 0K, use asymptotic form.
-            for i_pole in range(startw, endw):
-                psi_chi = -1j / (self.data[i_pole, _MP_EA] - sqrtE)
-                c_temp = psi_chi / E
-                if self.formalism == 'MLBW':
-                    sigT += ((self.data[i_pole, _MLBW_RT] * c_temp *
-                              sigT_factor[self.l_value[i_pole]-1]).real
-                             + (self.data[i_pole, _MLBW_RX] * c_temp).real)
-                    sigA += (self.data[i_pole, _MLBW_RA] * c_temp).real
-                    sigF += (self.data[i_pole, _MLBW_RF] * c_temp).real
-                elif self.formalism == 'RM':
-                    sigT += (self.data[i_pole, _RM_RT] * c_temp *
-                             sigT_factor[self.l_value[i_pole]-1]).real
-                    sigA += (self.data[i_pole, _RM_RA] * c_temp).real
-                    sigF += (self.data[i_pole, _RM_RF] * c_temp).real
-                else:
-                    raise ValueError('Unrecognized/Unsupported R-matrix'
-                                     ' formalism')
-
+            w_val = -1j / (data[:, _MP_EA] - sqrtE[i_energy]) * invE[i_energy]
         else:
             # At temperature, use Faddeeva function-based form.
-            for i_pole in range(startw, endw):
-                Z = (sqrtE - self.data[i_pole, _MP_EA]) * dopp
-                w_val = _faddeeva(Z) * dopp * invE * np.sqrt(np.pi)
-                if self.formalism == 'MLBW':
-                    sigT += ((self.data[i_pole, _MLBW_RT] *
-                              sigT_factor[self.l_value[i_pole]-1] +
-                              self.data[i_pole, _MLBW_RX]) * w_val).real
-                    sigA += (self.data[i_pole, _MLBW_RA] * w_val).real
-                    sigF += (self.data[i_pole, _MLBW_RF] * w_val).real
-                elif self.formalism == 'RM':
-                    sigT += (self.data[i_pole, _RM_RT] * w_val *
-                             sigT_factor[self.l_value[i_pole]-1]).real
-                    sigA += (self.data[i_pole, _RM_RA] * w_val).real
-                    sigF += (self.data[i_pole, _RM_RF] * w_val).real
-                else:
-                    raise ValueError('Unrecognized/Unsupported R-matrix'
-                                     ' formalism')
+            Z = (sqrtE[i_energy] - data[:, _MP_EA]) * dopp
+            w_val = _faddeeva(Z) * dopp * invE[i_energy] * np.sqrt(np.pi)
+
+        if self.formalism == 'MLBW':
+            total = (data[:, _MLBW_RT] * factor + data[:, _MLBW_RX]) * w_val
+            absorption = data[:, _MLBW_RA] * w_val
+            fission = data[:, _MLBW_RF] * w_val
+        elif self.formalism == 'RM':
+            total = data[:, _RM_RT] * w_val * factor
+            absorption = data[:, _RM_RA] * w_val
+            fission = data[:, _RM_RF] * w_val
+        else:
+            raise ValueError('Unrecognized/Unsupported R-matrix formalism')
+
+        sigT += np.bincount(i_energy, total.real, E.size)
+        sigA += np.bincount(i_energy, absorption.real, E.size)
+        sigF += np.bincount(i_energy, fission.real, E.size)
 
         return sigT, sigA, sigF
 
@@ -640,16 +656,33 @@ class WindowedMultipole(EqualityMixin):
         ----------
         E : Real or Iterable of Real
             Energy of the incident neutron in eV.
-        T : Real
-            Temperature of the target in K.
+        T : Real or Iterable of Real
+            Temperature of the target in K. Temperatures are broadcast against
+            the energies following NumPy rules, so, e.g., a column of
+            temperatures and a row of energies yield a 2D table.
 
         Returns
         -------
         3-tuple of Real or 3-tuple of numpy.ndarray
             Total, absorption, and fission microscopic cross sections at the
-            given energy and temperature.
+            given energies and temperatures.
 
         """
 
-        fun = np.vectorize(lambda x: self._evaluate(x, T))
-        return fun(E)
+        E, T = np.broadcast_arrays(np.asarray(E, dtype=float),
+                                   np.asarray(T, dtype=float))
+        shape = E.shape
+        E = E.ravel()
+        T = T.ravel()
+
+        sigT = np.zeros(E.shape)
+        sigA = np.zeros(E.shape)
+        sigF = np.zeros(E.shape)
+        for temperature in np.unique(T):
+            index = np.flatnonzero(T == temperature)
+            sigT[index], sigA[index], sigF[index] = \
+                self._evaluate(E[index], temperature)
+
+        if shape == ():
+            return sigT[0], sigA[0], sigF[0]
+        return sigT.reshape(shape), sigA.reshape(shape), sigF.reshape(shape)
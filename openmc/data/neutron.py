@@ -1,6 +1,7 @@
 from __future__ import division, unicode_literals
 import sys
 from collections import OrderedDict, Iterable, Mapping, MutableMapping
+from functools import partial
 from itertools import chain
 from numbers import Integral, Real
 from warnings import warn
@@ -90,6 +91,275 @@ def _get_metadata(zaid, metastable_scheme='nndc'):
     return (name, element, Z, mass_number, metastable)
 
 
+class _LazyDict(MutableMapping):
+    """Dictionary whose values are created when they are first accessed.
+
+    Parameters
+    ----------
+    loaders : collections.OrderedDict
+        Callables without arguments that create each value, indexed by key
+
+    """
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._values = {}
+
+    def __contains__(self, key):
+        return key in self._loaders
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        if key not in self._loaders:
+            self._loaders[key] = None
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        del self._loaders[key]
+        self._values.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+def _read_reaction(group, rx_group, energy, temperatures, lazy):
+    """Read a reaction of an incident neutron HDF5 group.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        HDF5 group of the nuclide
+    rx_group : h5py.Group
+        HDF5 group of the reaction
+    energy : dict
+        Energy grid at each temperature
+    temperatures : Iterable of str or None
+        Temperatures at which cross sections are read
+    lazy : bool
+        Whether to defer reading the reaction products
+
+    Returns
+    -------
+    openmc.data.Reaction
+        Reaction data
+
+    """
+    rx = Reaction.from_hdf5(rx_group, energy, temperatures, lazy)
+
+    # Read total nu data if available
+    if rx.mt in (18, 19, 20, 21, 38) and 'total_nu' in group:
+        tgroup = group['total_nu']
+        rx.derived_products.append(Product.from_hdf5(tgroup))
+
+    return rx
+
+
+def _summed_reaction(data, group, mt_sum, mts):
+    """Build a summed reaction from the reactions that make it up.
+
+    Parameters
+    ----------
+    data : openmc.data.IncidentNeutron
+        Nuclide containing the reactions
+    group : h5py.Group
+        HDF5 group of the nuclide
+    mt_sum : int
+        MT number of the summed reaction
+    mts : list of int
+        MT numbers of the reactions that are summed
+
+    Returns
+    -------
+    openmc.data.Reaction
+        Summed reaction
+
+    """
+    rx = Reaction(mt_sum)
+    if rx.mt == 18 and 'total_nu' in group:
+        tgroup = group['total_nu']
+        rx.derived_products.append(Product.from_hdf5(tgroup))
+    rxs = [data[mt] for mt in mts]
+    for T in data.temperatures:
+        rx.xs[T] = Sum([rx_i.xs[T] for rx_i in rxs])
+    return rx
+
+
+# Distance in units of the thermal velocity beyond which the Doppler
+# broadening kernel is neglected
+_BROADEN_CUTOFF = 4.0
+
+# Maximum number of (energy, grid interval) pairs evaluated at once when
+# Doppler broadening
+_BROADEN_CHUNK_SIZE = 1 << 18
+
+
+def _gaussian_moments(a, b):
+    r"""Integrate powers of z against a Gaussian over [a, b].
+
+    Returns :math:`H_n = \frac{1}{\sqrt{\pi}} \int_a^b z^n e^{-z^2} dz` for
+    :math:`n = 0, \ldots, 4` using the recursion of the SIGMA1 method.
+
+    Parameters
+    ----------
+    a, b : numpy.ndarray
+        Lower and upper limits of integration
+
+    Returns
+    -------
+    list of numpy.ndarray
+        Integrals for each power of z
+
+    """
+    from scipy.special import erf, erfc
+
+    # Choose the form of the error function difference that avoids
+    # cancellation in the tails
+    H0 = np.where(a >= 0.0, 0.5*(erfc(a) - erfc(b)),
+                  np.where(b <= 0.0, 0.5*(erfc(-b) - erfc(-a)),
+                           0.5*(erf(b) - erf(a))))
+
+    ea = np.exp(-a*a)/(2.0*np.sqrt(np.pi))
+    eb = np.exp(-b*b)/(2.0*np.sqrt(np.pi))
+    H1 = ea - eb
+    H2 = 0.5*H0 + a*ea - b*eb
+    H3 = H1 + a*a*ea - b*b*eb
+    H4 = 1.5*H2 + a**3*ea - b**3*eb
+    return [H0, H1, H2, H3, H4]
+
+
+def _broaden_segments(x, y, xs, cut, sign):
+    """Integrate piecewise-linear cross sections against the Doppler kernel.
+
+    Each interval of the grid is paired with every energy whose kernel
+    overlaps it. Cross sections are linear in energy, i.e. in :math:`x^2`,
+    within an interval and are extended as :math:`1/v` below the grid and as a
+    constant above it.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Square root of the reduced energies of the grid
+    y : numpy.ndarray
+        Square root of the reduced energies at which to evaluate
+    xs : numpy.ndarray
+        Cross sections on the grid, one reaction per row
+    cut : float
+        Cutoff of the kernel
+    sign : {1, -1}
+        Whether to integrate the :math:`e^{-(x - y)^2}` or the
+        :math:`e^{-(x + y)^2}` term of the kernel
+
+    Returns
+    -------
+    numpy.ndarray
+        Integral for each reaction and energy, not yet divided by
+        :math:`y^2`
+
+    """
+    n = x.size
+    result = np.zeros((xs.shape[0], y.size))
+    if y.size == 0:
+        return result
+    center = sign*y
+
+    # Intervals overlapping [center - cut, center + cut]. Interval -1 extends
+    # the grid down to zero and interval n - 1 extends it to infinity.
+    lo = np.searchsorted(x, center - cut, 'right') - 1
+    hi = np.searchsorted(x, center + cut, 'left')
+    counts = np.maximum(hi - lo, 0)
+    first = np.cumsum(counts) - counts
+
+    # Divide energies into blocks with a limited number of pairs
+    bounds = np.searchsorted(np.cumsum(counts),
+                             np.arange(0, counts.sum(), _BROADEN_CHUNK_SIZE),
+                             'right')
+    bounds = np.unique(np.append(bounds, [0, y.size]))
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        c = counts[start:stop]
+        i = np.repeat(np.arange(start, stop), c)
+        k = np.arange(c.sum()) + np.repeat(lo[start:stop] - first[start:stop]
+                                           + first[start], c)
+        if k.size == 0:
+            continue
+        yc = center[i]
+
+        # Limits of integration relative to the center of the kernel
+        x_lo = np.where(k >= 0, x[np.maximum(k, 0)], 0.0)
+        x_hi = np.where(k < n - 1, x[np.minimum(k + 1, n - 1)], np.inf)
+        a = np.clip(x_lo - yc, -cut, cut)
+        b = np.clip(x_hi - yc, -cut, cut)
+        H = _gaussian_moments(a, b)
+
+        # Cross section at x = yc + z is s + 2*c*yc*z + c*z^2, where s is the
+        # interval's linear cross section extrapolated to yc
+        kk = np.clip(k, 0, n - 2)
+        x0 = x[kk]
+        slope = (xs[:, kk + 1] - xs[:, kk])/((x[kk + 1] - x0)*(x[kk + 1] + x0))
+        slope[:, k == n - 1] = 0.0
+        s = xs[:, kk] + slope*(yc - x0)*(yc + x0)
+        s[:, k == n - 1] = xs[:, -1:]
+
+        # Multiply by x^2 = yc^2 + 2*yc*z + z^2 to get polynomial in z
+        terms = (yc*yc*s*H[0] + 2.0*yc*(s + slope*yc*yc)*H[1]
+                 + (s + 5.0*slope*yc*yc)*H[2] + 4.0*slope*yc*H[3]
+                 + slope*H[4])
+
+        # Below the grid the cross section is s0*x0/x, so x^2 times the cross
+        # section is s0*x0*(yc + z)
+        below = (k == -1)
+        if below.any():
+            s0x0 = xs[:, :1]*x[0]
+            terms[:, below] = s0x0*(yc[below]*H[0][below] + H[1][below])
+
+        for j in range(xs.shape[0]):
+            result[j, start:stop] = np.bincount(i - start, terms[j],
+                                                stop - start)
+
+    return result
+
+
+def _broaden(energy, xs, awr, kT):
+    """Doppler broaden pointwise cross sections.
+
+    The cross sections are assumed to be linear in energy between grid points
+    and are integrated exactly against the free-gas kernel as in the SIGMA1
+    method (Cullen and Weisbin, Nucl. Sci. Eng. 60, 199, 1976).
+
+    Parameters
+    ----------
+    energy : numpy.ndarray
+        Energy grid in eV
+    xs : numpy.ndarray
+        Cross sections on the energy grid, one reaction per row
+    awr : float
+        Atomic weight ratio of the target
+    kT : float
+        Difference between the final and initial temperatures in eV
+
+    Returns
+    -------
+    numpy.ndarray
+        Broadened cross sections on the same energy grid
+
+    """
+    alpha = awr/kT
+    x = np.sqrt(alpha*energy)
+    result = _broaden_segments(x, x, xs, _BROADEN_CUTOFF, 1)
+
+    # The second term of the kernel only matters at low energies
+    low = np.flatnonzero(x < _BROADEN_CUTOFF)
+    result[:, low] -= _broaden_segments(x, x[low], xs, _BROADEN_CUTOFF, -1)
+
+    return result/(x*x)
+
+
 class IncidentNeutron(EqualityMixin):
     """Continuous-energy neutron interaction data.
 
@@ -343,6 +613,94 @@ class IncidentNeutron(EqualityMixin):
         if strT in data.urr:
             self.urr[strT] = data.urr[strT]
 
+    def broaden(self, temperature, source=None):
+        """Doppler broaden cross sections to a new temperature.
+
+        Cross sections at a lower temperature are broadened on their energy
+        grid with the free-gas kernel, and the result is added to the data as
+        a new temperature. Unresolved resonance probability tables are copied
+        from the lower temperature.
+
+        Parameters
+        ----------
+        temperature : float
+            Temperature in K to broaden to
+        source : str, optional
+            Temperature, e.g. '0K', of the cross sections that are broadened.
+            Defaults to the highest available temperature below the requested
+            one.
+
+        """
+        cv.check_type('temperature', temperature, Real)
+        kT = temperature*K_BOLTZMANN
+        strT = '{}K'.format(int(round(temperature)))
+        if strT in self.temperatures:
+            warn('Cross sections at T={} already exist.'.format(strT))
+            return
+
+        if source is None:
+            lower = [(kT_i, T) for kT_i, T in zip(self.kTs, self.temperatures)
+                     if kT_i < kT]
+            if not lower:
+                raise ValueError('No cross sections below T={} to broaden.'
+                                 .format(strT))
+            kT_source, source = max(lower)
+        else:
+            cv.check_value('source temperature', source, self.temperatures)
+            kT_source = self.kTs[self.temperatures.index(source)]
+            if kT_source >= kT:
+                raise ValueError('Source temperature must be below T={}.'
+                                 .format(strT))
+        if source not in self.energy:
+            raise ValueError('No energy grid at T={} to broaden.'
+                             .format(source))
+
+        # Gather the distinct tabulated cross sections on the common energy
+        # grid, including those that only appear within summed cross sections
+        tabulated = OrderedDict()
+
+        def gather(f):
+            if isinstance(f, Tabulated1D):
+                tabulated.setdefault(id(f), f)
+                return True
+            elif isinstance(f, Sum):
+                return all([gather(f_i) for f_i in f.functions])
+            return False
+
+        rxs = [rx for rx in chain(self.reactions.values(),
+                                  self.summed_reactions.values())
+               if source in rx.xs and gather(rx.xs[source])]
+        energy = self.energy[source]
+        xs = np.zeros((len(tabulated), energy.size))
+        for i, f in enumerate(tabulated.values()):
+            xs[i, getattr(f, '_threshold_idx', 0):] = f.y
+
+        broadened = _broaden(energy, xs, self.atomic_weight_ratio,
+                             kT - kT_source)
+
+        # Create the broadened cross sections before modifying the data so
+        # that a failure leaves the data unchanged
+        new_xs = {}
+        for i, (key, f) in enumerate(tabulated.items()):
+            threshold_idx = getattr(f, '_threshold_idx', 0)
+            new_xs[key] = Tabulated1D(energy[threshold_idx:],
+                                      broadened[i, threshold_idx:])
+            new_xs[key]._threshold_idx = threshold_idx
+
+        def rebuild(f):
+            if id(f) not in new_xs:
+                new_xs[id(f)] = Sum([rebuild(f_i) for f_i in f.functions])
+            return new_xs[id(f)]
+
+        rx_xs = [(rx, rebuild(rx.xs[source])) for rx in rxs]
+
+        self.kTs.append(kT)
+        self.energy[strT] = energy
+        for rx, f in rx_xs:
+            rx.xs[strT] = f
+        if source in self.urr:
+            self.urr[strT] = self.urr[source]
+
     def get_reaction_components(self, mt):
         """Determine what reactions make up summed reaction.
 
@@ -437,7 +795,7 @@ class IncidentNeutron(EqualityMixin):
         f.close()
 
     @classmethod
-    def from_hdf5(cls, group_or_filename):
+    def from_hdf5(cls, group_or_filename, temperatures=None, lazy=False):
         """Generate continuous-energy neutron interaction data from HDF5 group
 
         Parameters
@@ -446,6 +804,14 @@ class IncidentNeutron(EqualityMixin):
             HDF5 group containing interaction data. If given as a string, it is
             assumed to be the filename for the HDF5 file, and the first group is
             used to read from.
+        temperatures : Iterable of str, optional
+            Temperatures to read, e.g., '294K'. If not given, data at all
+            temperatures in the group are read.
+        lazy : bool, optional
+            If True, reactions, their products, and probability tables are read
+            only when they are first accessed, and summed reactions are built
+            only when they are first accessed. The HDF5 file is kept open
+            while the data are in use.
 
         Returns
         -------
@@ -480,9 +846,22 @@ class IncidentNeutron(EqualityMixin):
         metastable = group.attrs['metastable']
         atomic_weight_ratio = group.attrs['atomic_weight_ratio']
         kTg = group['kTs']
+
+        # Determine which temperatures to read
+        if temperatures is not None:
+            if isinstance(temperatures, string_types):
+                temperatures = [temperatures]
+            cv.check_iterable_type('temperatures', temperatures, string_types)
+            for T in temperatures:
+                if T not in kTg:
+                    raise ValueError('Data for {} are not available at T={}.'
+                                     .format(name, T))
+            temperatures = [T for T in kTg if T in temperatures]
+
         kTs = []
         for temp in kTg:
-            kTs.append(kTg[temp].value)
+            if temperatures is None or temp in temperatures:
+                kTs.append(kTg[temp].value)
 
         data = cls(name, atomic_number, mass_number, metastable,
                    atomic_weight_ratio, kTs)
@@ -490,38 +869,53 @@ class IncidentNeutron(EqualityMixin):
         # Read energy grid
         e_group = group['energy']
         for temperature, dset in e_group.items():
-            data.energy[temperature] = dset.value
+            if temperatures is None or temperature in temperatures:
+                data.energy[temperature] = dset.value
 
         # Read reaction data
         rxs_group = group['reactions']
+        loaders = OrderedDict()
         for name, obj in sorted(rxs_group.items()):
             if name.startswith('reaction_'):
-                rx = Reaction.from_hdf5(obj, data.energy)
-                data.reactions[rx.mt] = rx
-
-                # Read total nu data if available
-                if rx.mt in (18, 19, 20, 21, 38) and 'total_nu' in group:
-                    tgroup = group['total_nu']
-                    rx.derived_products.append(Product.from_hdf5(tgroup))
+                loaders[obj.attrs['mt']] = partial(
+                    _read_reaction, group, obj, data.energy, temperatures,
+                    lazy)
+        if lazy:
+            data.reactions = _LazyDict(loaders)
+        else:
+            for mt, loader in loaders.items():
+                data.reactions[mt] = loader()
 
         # Build summed reactions.  Start from the highest MT number because
         # high MTs never depend on lower MTs.
+        present = set(loaders)
+        loaders = OrderedDict()
         for mt_sum in sorted(SUM_RULES, reverse=True):
-            if mt_sum not in data:
-                rxs = [data[mt] for mt in SUM_RULES[mt_sum] if mt in data]
-                if len(rxs) > 0:
-                    data.summed_reactions[mt_sum] = rx = Reaction(mt_sum)
-                    if rx.mt == 18 and 'total_nu' in group:
-                        tgroup = group['total_nu']
-                        rx.derived_products.append(Product.from_hdf5(tgroup))
-                    for T in data.temperatures:
-                        rx.xs[T] = Sum([rx_i.xs[T] for rx_i in rxs])
+            if mt_sum not in present:
+                mts = [mt for mt in SUM_RULES[mt_sum] if mt in present]
+                if len(mts) > 0:
+                    loaders[mt_sum] = partial(
+                        _summed_reaction, data, group, mt_sum, mts)
+                    present.add(mt_sum)
+        if lazy:
+            data.summed_reactions = _LazyDict(loaders)
+        else:
+            for mt_sum, loader in loaders.items():
+                data.summed_reactions[mt_sum] = loader()
 
         # Read unresolved resonance probability tables
         if 'urr' in group:
             urr_group = group['urr']
+            loaders = OrderedDict()
             for temperature, tgroup in urr_group.items():
-                data.urr[temperature] = ProbabilityTables.from_hdf5(tgroup)
+                if temperatures is None or temperature in temperatures:
+                    loaders[temperature] = partial(
+                        ProbabilityTables.from_hdf5, tgroup)
+            if lazy:
+                data._urr = _LazyDict(loaders)
+            else:
+                for temperature, loader in loaders.items():
+                    data.urr[temperature] = loader()
 
         # Read fission energy release data
         if 'fission_energy_release' in group:
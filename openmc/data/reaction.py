@@ -742,6 +742,11 @@ class Reaction(EqualityMixin):
 
     @property
     def products(self):
+        # Read products that were deferred by a lazy from_hdf5()
+        if self._products is None:
+            self._products = [Product.from_hdf5(pgroup)
+                              for pgroup in self._product_groups]
+            del self._product_groups
         return self._products
 
     @property
@@ -812,7 +817,7 @@ class Reaction(EqualityMixin):
             p.to_hdf5(pgroup)
 
     @classmethod
-    def from_hdf5(cls, group, energy):
+    def from_hdf5(cls, group, energy, temperatures=None, lazy=False):
         """Generate reaction from an HDF5 group
 
         Parameters
@@ -822,6 +827,12 @@ class Reaction(EqualityMixin):
         energy : dict
             Dictionary whose keys are temperatures (e.g., '300K') and values are
             arrays of energies at which cross sections are tabulated at.
+        temperatures : Iterable of str, optional
+            Temperatures at which cross sections are read, e.g., '294K'. If not
+            given, cross sections at all temperatures are read.
+        lazy : bool, optional
+            If True, reaction products are read only when
+            :attr:`Reaction.products` is first accessed.
 
         Returns
         -------
@@ -838,6 +849,8 @@ class Reaction(EqualityMixin):
         # Read cross section at each temperature
         for T, Tgroup in group.items():
             if T.endswith('K'):
+                if temperatures is not None and T not in temperatures:
+                    continue
                 if 'xs' in Tgroup:
                     # Make sure temperature has associated energy grid
                     if T not in energy:
@@ -858,9 +871,13 @@ class Reaction(EqualityMixin):
                 n_product += 1
 
         # Read reaction products
-        for i in range(n_product):
-            pgroup = group['product_{}'.format(i)]
-            rx.products.append(Product.from_hdf5(pgroup))
+        pgroups = [group['product_{}'.format(i)] for i in range(n_product)]
+        if lazy:
+            rx._products = None
+            rx._product_groups = pgroups
+        else:
+            for pgroup in pgroups:
+                rx.products.append(Product.from_hdf5(pgroup))
 
         return rx
 
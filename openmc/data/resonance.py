@@ -1,5 +1,8 @@
 from collections import defaultdict, MutableSequence, Iterable
+from functools import partial
 import io
+from multiprocessing.pool import ThreadPool
+from numbers import Integral, Real
 
 import numpy as np
 from numpy.polynomial import Polynomial
@@ -15,6 +18,13 @@ except ImportError:
     _reconstruct = False
 import openmc.checkvalue as cv
 
+# Number of points in the initial grid of ResonanceRange.linearize
+_LINEARIZE_INITIAL_POINTS = 100
+
+# Relative width below which intervals are no longer bisected
+_LINEARIZE_MIN_SPACING = 1e-9
+
+
 class Resonances(object):
     """Resolved and unresolved resonance data
 
@@ -160,6 +170,7 @@ class ResonanceRange(object):
 
         self._prepared = False
         self._parameter_matrix = {}
+        self._reconstruct = None
 
     @classmethod
     def from_endf(cls, ev, file_obj, items):
@@ -201,13 +212,17 @@ class ResonanceRange(object):
 
         return cls(target_spin, energy_min, energy_max, {0: a}, {0: ap})
 
-    def reconstruct(self, energies):
+    def reconstruct(self, energies, threads=1):
         """Evaluate cross section at specified energies.
 
         Parameters
         ----------
         energies : float or Iterable of float
             Energies at which the cross section should be evaluated
+        threads : int, optional
+            Number of threads over which the energies are divided. The
+            reconstruction kernels release the GIL, so the threads run
+            concurrently.
 
         Returns
         -------
@@ -216,28 +231,132 @@ class ResonanceRange(object):
             energies
 
         """
-        if not _reconstruct:
+        if not _reconstruct or self._reconstruct is None:
             raise RuntimeError("Resonance reconstruction not available.")
+        cv.check_type('number of threads', threads, Integral)
+        cv.check_greater_than('number of threads', threads, 0)
 
         # Pre-calculate penetrations and shifts for resonances
         if not self._prepared:
             self._prepare_resonances()
 
-        if isinstance(energies, Iterable):
-            elastic = np.zeros_like(energies)
-            capture = np.zeros_like(energies)
-            fission = np.zeros_like(energies)
-
-            for i, E in enumerate(energies):
-                xse, xsg, xsf = self._reconstruct(self, E)
-                elastic[i] = xse
-                capture[i] = xsg
-                fission[i] = xsf
+        E = np.ascontiguousarray(np.atleast_1d(energies), dtype=float)
+        threads = min(threads, E.size)
+        if threads > 1:
+            pool = ThreadPool(threads)
+            try:
+                results = pool.map(partial(self._reconstruct, self),
+                                   np.array_split(E, threads))
+            finally:
+                pool.close()
+                pool.join()
+            elastic, capture, fission = [np.concatenate(xs)
+                                         for xs in zip(*results)]
         else:
-            elastic, capture, fission = self._reconstruct(self, energies)
+            elastic, capture, fission = self._reconstruct(self, E)
+
+        if not isinstance(energies, Iterable):
+            elastic, capture, fission = elastic[0], capture[0], fission[0]
 
         return {2: elastic, 102: capture, 18: fission}
 
+    def linearize(self, tolerance=0.001, energies=None, threads=1):
+        """Generate an energy grid on which the cross sections are linear.
+
+        Starting from an initial grid, every interval is bisected until the
+        elastic, capture, and fission cross sections at its midpoint are
+        reproduced by linear interpolation within the given relative
+        tolerance. All midpoints of a refinement pass are evaluated in a
+        single call to :meth:`reconstruct`.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Maximum relative error of linear interpolation
+        energies : Iterable of float, optional
+            Energies in eV that must appear in the grid. By default, the
+            limits of the range, the resonance energies and the energies half
+            a total width on either side of them, and a coarse logarithmic grid
+            are used.
+        threads : int, optional
+            Number of threads used to evaluate the cross sections
+
+        Returns
+        -------
+        energies : numpy.ndarray
+            Energies in eV of the linearized grid
+        dict of int to numpy.ndarray
+            Elastic, capture, and fission cross sections on the grid keyed by
+            their MT values
+
+        """
+        cv.check_type('tolerance', tolerance, Real)
+        cv.check_greater_than('tolerance', tolerance, 0.0)
+
+        emin, emax = self.energy_min, self.energy_max
+        if energies is None:
+            # Start from the peak and half maxima of each resonance so that
+            # bisection does not mistake an unresolved peak for a line
+            E_r = self._resonance_energies()
+            half_width = 0.5*self._resonance_widths()
+            energies = np.concatenate((E_r, E_r - half_width,
+                                       E_r + half_width))
+            if emin > 0.0:
+                energies = np.append(energies, np.logspace(
+                    np.log10(emin), np.log10(emax),
+                    _LINEARIZE_INITIAL_POINTS))
+        x = np.asarray(energies, dtype=float)
+        x = np.unique(np.append(x[(emin <= x) & (x <= emax)], [emin, emax]))
+
+        mts = (2, 102, 18)
+        xs = self.reconstruct(x, threads)
+        y = np.vstack([xs[mt] for mt in mts])
+
+        # Intervals whose midpoint has yet to be checked
+        check = np.ones(x.size - 1, dtype=bool)
+
+        while check.any():
+            i = np.flatnonzero(check)
+            x_mid = 0.5*(x[i] + x[i + 1])
+            xs = self.reconstruct(x_mid, threads)
+            y_mid = np.vstack([xs[mt] for mt in mts])
+
+            # Compare with linear interpolation, stopping at the resolution
+            # of the energy grid
+            y_lin = 0.5*(y[:, i] + y[:, i + 1])
+            error = np.abs(y_mid - y_lin) > tolerance*np.abs(y_mid)
+            refine = error.any(axis=0) & (
+                x[i + 1] - x[i] > _LINEARIZE_MIN_SPACING*x[i + 1])
+
+            # Insert midpoints of refined intervals, both halves of which are
+            # checked in the next pass
+            i = i[refine]
+            x = np.insert(x, i + 1, x_mid[refine])
+            y = np.insert(y, i + 1, y_mid[:, refine], axis=1)
+            check = np.zeros(check.size, dtype=bool)
+            check[i] = True
+            check = np.insert(check, i + 1, True)
+
+        return x, dict(zip(mts, y))
+
+    def _resonance_energies(self):
+        """Return the energies of the resonances in eV."""
+        parameters = getattr(self, 'parameters', None)
+        if isinstance(parameters, pd.DataFrame) and \
+                'energy' in parameters.columns:
+            return parameters['energy'].values
+        return np.array([])
+
+    def _resonance_widths(self):
+        """Return the total widths of the resonances in eV."""
+        parameters = getattr(self, 'parameters', None)
+        if isinstance(parameters, pd.DataFrame):
+            columns = [c for c in parameters.columns
+                       if c.endswith('Width') and c != 'totalWidth']
+            if columns:
+                return np.abs(parameters[columns].values).sum(axis=1)
+        return np.zeros_like(self._resonance_energies())
+
 
 class MultiLevelBreitWigner(ResonanceRange):
     """Multi-level Breit-Wigner resolved resonance formalism data.
@@ -858,6 +977,11 @@ class RMatrixLimited(ResonanceRange):
 
         return rml
 
+    def _resonance_energies(self):
+        """Return the energies of the resonances in eV."""
+        return np.concatenate([np.array([])] + [
+            sg.parameters['energy'].values for sg in self.spin_groups])
+
 
 class ParticlePair(object):
     def __init__(self, first, second, q_value, penetrability,
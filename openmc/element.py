@@ -3,10 +3,10 @@ import re
 import os
 
 from six import string_types
-from xml.etree import ElementTree as ET
 
 import openmc
 import openmc.checkvalue as cv
+import openmc.data
 from openmc.data import NATURAL_ABUNDANCE, atomic_mass
 
 
@@ -145,13 +145,12 @@ class Element(object):
         if cross_sections is not None:
 
             library_nuclides = set()
-            tree = ET.parse(cross_sections)
-            root = tree.getroot()
-            for child in root:
-                nuclide = child.attrib['materials']
-                if re.match(r'{}\d+'.format(self.name), nuclide) and \
-                   '_m' not in nuclide:
-                    library_nuclides.add(nuclide)
+            library = openmc.data.DATA_CACHE.get_library(cross_sections)
+            for lib in library.libraries:
+                for nuclide in lib['materials']:
+                    if re.match(r'{}\d+'.format(self.name), nuclide) and \
+                       '_m' not in nuclide:
+                        library_nuclides.add(nuclide)
 
             # Get a set of the mutual and absent nuclides. Convert to lists
             # and sort to avoid different ordering between Python 2 and 3.
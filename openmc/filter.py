@@ -1,6 +1,5 @@
 from abc import ABCMeta
 from collections import Iterable, OrderedDict
-import copy
 import hashlib
 from numbers import Real, Integral
 from xml.etree import ElementTree as ET
@@ -23,6 +22,92 @@ _CURRENT_NAMES = {1:  'x-min out', 2:  'x-min in',
                   9:  'z-min out', 10: 'z-min in',
                   11: 'z-max out', 12: 'z-max in'}
 
+# Fields of each CSG level of a parsed distribcell path. Unused fields are -1.
+_DISTRIBCELL_LEVEL_DTYPE = np.dtype([
+    ('universe', int), ('cell', int), ('lattice', int),
+    ('i', int), ('j', int), ('k', int)])
+
+
+def _parse_distribcell_paths(paths):
+    """Parse distribcell paths into a structured array of CSG levels.
+
+    Each level of a path is either a universe and the cell filled by it,
+    e.g. '0->10', or a lattice and the indices of a lattice cell, e.g.
+    '100(2,3,1)'. All paths must have the same sequence of levels.
+
+    Parameters
+    ----------
+    paths : list of str
+        The paths traversed through the CSG tree to reach each distribcell
+        instance
+
+    Returns
+    -------
+    numpy.ndarray
+        Structured array with shape (number of paths, number of levels) with
+        fields 'universe', 'cell', 'lattice', 'i', 'j' and 'k'. The lattice
+        indices are zero-based. Fields not used by a level are -1.
+
+    Raises
+    ------
+    ValueError
+        If the paths do not all have the same sequence of levels
+
+    """
+
+    # Use the first path to determine whether each level is a lattice
+    elements = paths[0].split('->')
+    lattice_levels = []
+    n = 0
+    while n < len(elements):
+        if '(' in elements[n]:
+            lattice_levels.append(True)
+            n += 1
+        else:
+            lattice_levels.append(False)
+            n += 2
+    num_tokens = sum(4 if lattice else 2 for lattice in lattice_levels)
+
+    # Every path must cross the same number of lattices and levels
+    path_array = np.array(paths)
+    for delimiter in ('->', '('):
+        counts = np.char.count(path_array, delimiter)
+        if np.any(counts != counts[0]):
+            raise ValueError('Unable to parse distribcell paths since they '
+                             'do not all traverse the same levels of the '
+                             'CSG tree')
+
+    # Split all of the paths into integers at once
+    text = ' '.join(paths)
+    for delimiter in ('->', '(', ')', ','):
+        text = text.replace(delimiter, ' ')
+    tokens = np.fromstring(text, dtype=int, sep=' ')
+
+    if tokens.size != len(paths)*num_tokens:
+        raise ValueError('Unable to parse distribcell paths since they do '
+                         'not all traverse the same levels of the CSG tree')
+    tokens = tokens.reshape(len(paths), num_tokens)
+
+    levels = np.empty((len(paths), len(lattice_levels)),
+                      dtype=_DISTRIBCELL_LEVEL_DTYPE)
+    for name in _DISTRIBCELL_LEVEL_DTYPE.names:
+        levels[name] = -1
+
+    column = 0
+    for i, lattice in enumerate(lattice_levels):
+        if lattice:
+            levels['lattice'][:, i] = tokens[:, column]
+            levels['i'][:, i] = tokens[:, column + 1] - 1
+            levels['j'][:, i] = tokens[:, column + 2] - 1
+            levels['k'][:, i] = tokens[:, column + 3] - 1
+            column += 4
+        else:
+            levels['universe'][:, i] = tokens[:, column]
+            levels['cell'][:, i] = tokens[:, column + 1]
+            column += 2
+
+    return levels
+
 
 class FilterMeta(ABCMeta):
     def __new__(cls, name, bases, namespace, **kwargs):
@@ -191,6 +276,7 @@ class Filter(object):
         self.check_bins(bins)
 
         self._bins = bins
+        self._changed()
 
     @num_bins.setter
     def num_bins(self, num_bins):
@@ -208,6 +294,13 @@ class Filter(object):
 
         self._stride = stride
 
+    def _changed(self):
+        """Mark the tally index of the StatePoint whose tallies use this filter
+        as out of date."""
+        state = getattr(self, '_index_state', None)
+        if state is not None:
+            state['version'] += 1
+
     def check_bins(self, bins):
         """Make sure given bins are valid for this filter.
 
@@ -340,6 +433,50 @@ class Filter(object):
 
         return np.where(self.bins == filter_bin)[0][0]
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the Filter for an array of bins.
+
+        This is a vectorized version of :meth:`Filter.get_bin_index` which
+        maps all of the bins to indices with a single NumPy operation.
+
+        Parameters
+        ----------
+        filter_bins : Iterable of Integral or Iterable of tuple
+            The bins to find indices for. Each bin takes the same form as the
+            filter_bin parameter of :meth:`Filter.get_bin_index`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices in the Tally data array for the filter bins
+
+        Raises
+        ------
+        ValueError
+            If any of the bins is not one of this filter's bins
+
+        See also
+        --------
+        Filter.get_bin_index()
+
+        """
+
+        filter_bins = np.ravel(filter_bins)
+
+        # Find the first occurrence of each bin in the (unsorted) filter bins
+        sorter = np.argsort(self.bins, kind='mergesort')
+        positions = np.searchsorted(self.bins, filter_bins, sorter=sorter)
+        positions = np.clip(positions, 0, len(self.bins) - 1)
+        indices = sorter[positions]
+
+        missing = self.bins[indices] != filter_bins
+        if np.any(missing):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(filter_bins[missing][0])
+            raise ValueError(msg)
+
+        return indices
+
     def get_bin(self, bin_index):
         """Returns the filter bin for some filter bin index.
 
@@ -711,6 +848,12 @@ class MeshFilter(Filter):
 
         return val
 
+    def get_bin_indices(self, filter_bins):
+        # Convert an array of (x,y,z) tuples to flattened mesh bins in the same
+        # order as MeshFilter.get_bin_index
+        ijk = np.reshape(filter_bins, (-1, len(self.mesh.dimension))) - 1
+        return np.ravel_multi_index(ijk.T, tuple(self.mesh.dimension))
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -908,6 +1051,21 @@ class RealFilter(Filter):
         else:
             return i[0] - 1
 
+    def get_bin_indices(self, filter_bins):
+        # Find the upper edge of each (lower, upper) bin in the bin edges
+        upper = np.reshape(filter_bins, (-1, 2))[:, 1]
+        indices = np.searchsorted(self.bins, upper)
+        indices = np.clip(indices, 0, len(self.bins) - 1)
+
+        missing = (self.bins[indices] != upper) | (indices == 0)
+        if np.any(missing):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(
+                      tuple(np.reshape(filter_bins, (-1, 2))[missing][0]))
+            raise ValueError(msg)
+
+        return indices - 1
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -948,6 +1106,27 @@ class EnergyFilter(RealFilter):
                   'is not one of the bins'.format(filter_bin)
             raise ValueError(msg)
 
+    def get_bin_indices(self, filter_bins):
+        # Use the nearest bin edge to the upper energy bound of each bin, which
+        # is one of the two edges bracketing it in the sorted energy grid
+        upper = np.reshape(filter_bins, (-1, 2))[:, 1]
+        right = np.clip(np.searchsorted(self.bins, upper), 0,
+                        len(self.bins) - 1)
+        left = np.clip(right - 1, 0, len(self.bins) - 1)
+        use_left = np.abs(self.bins[left] - upper) < \
+            np.abs(self.bins[right] - upper)
+        indices = np.where(use_left, left, right)
+
+        deltas = np.abs(self.bins[indices] - upper) / upper
+        missing = deltas >= 1E-3
+        if np.any(missing):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(
+                      tuple(np.reshape(filter_bins, (-1, 2))[missing][0]))
+            raise ValueError(msg)
+
+        return indices - 1
+
     def check_bins(self, bins):
         for edge in bins:
             if not isinstance(edge, Real):
@@ -1061,11 +1240,18 @@ class DistribcellFilter(Filter):
     distribcell_paths : list of str
         The paths traversed through the CSG tree to reach each distribcell
         instance (for 'distribcell' filters only)
+    levels : numpy.ndarray or None
+        Structured array of the distribcell paths with one row per instance
+        and one column per CSG level. Each level has fields 'universe',
+        'cell', 'lattice', 'i', 'j' and 'k' where fields not used by the level
+        are -1 and the lattice indices are zero-based. The paths are parsed the
+        first time this is accessed.
 
     """
 
     def __init__(self, bins):
         self._distribcell_paths = None
+        self._levels = None
         super(DistribcellFilter, self).__init__(bins)
 
     @classmethod
@@ -1088,10 +1274,17 @@ class DistribcellFilter(Filter):
     def distribcell_paths(self):
         return self._distribcell_paths
 
+    @property
+    def levels(self):
+        if self._levels is None and self.distribcell_paths is not None:
+            self._levels = _parse_distribcell_paths(self.distribcell_paths)
+        return self._levels
+
     @distribcell_paths.setter
     def distribcell_paths(self, distribcell_paths):
         cv.check_iterable_type('distribcell_paths', distribcell_paths, str)
         self._distribcell_paths = distribcell_paths
+        self._levels = None
 
     def check_bins(self, bins):
         if not len(bins) == 1:
@@ -1112,6 +1305,9 @@ class DistribcellFilter(Filter):
         # the Cell in the Geometry (consecutive integers starting at 0).
         return filter_bin
 
+    def get_bin_indices(self, filter_bins):
+        return np.ravel(filter_bins).astype(int)
+
     def get_pandas_dataframe(self, data_size, **kwargs):
         """Builds a Pandas DataFrame for the Filter's bins.
 
@@ -1175,122 +1371,33 @@ class DistribcellFilter(Filter):
                       'the Summary is not linked to the StatePoint'
                 raise ValueError(msg)
 
-            # Make copy of array of distribcell paths to use in
-            # Pandas Multi-index column construction
-            distribcell_paths = copy.deepcopy(self.distribcell_paths)
-            num_offsets = len(distribcell_paths)
-
-            # Loop over CSG levels in the distribcell paths
-            level_counter = 0
-            levels_remain = True
-            while levels_remain:
-
-                # Use level key as first index in Pandas Multi-index column
-                level_counter += 1
-                level_key = 'level {}'.format(level_counter)
-
-                # Use the first distribcell path to determine if level
-                # is a universe/cell or lattice level
-                first_path = distribcell_paths[0]
-                next_index = first_path.index('-')
-                level = first_path[:next_index]
-
-                # Trim universe/lattice info from path
-                first_path = first_path[next_index+2:]
-
-                # Create a dictionary for this level for Pandas Multi-index
-                level_dict = OrderedDict()
+            # Build the columns for all instances from the parsed paths
+            level_dict = OrderedDict()
+            levels = self.levels
+            for i in range(levels.shape[1]):
+                level_key = 'level {}'.format(i + 1)
+                level = levels[:, i]
 
                 # This level is a lattice (e.g., ID(x,y,z))
-                if '(' in level:
-                    level_type = 'lattice'
-
-                    # Initialize prefix Multi-index keys
-                    lat_id_key = (level_key, 'lat', 'id')
-                    lat_x_key = (level_key, 'lat', 'x')
-                    lat_y_key = (level_key, 'lat', 'y')
-                    lat_z_key = (level_key, 'lat', 'z')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[lat_id_key] = np.empty(num_offsets)
-                    level_dict[lat_x_key] = np.empty(num_offsets)
-                    level_dict[lat_y_key] = np.empty(num_offsets)
-                    level_dict[lat_z_key] = np.empty(num_offsets)
+                if level['lattice'][0] >= 0:
+                    level_dict[(level_key, 'lat', 'id')] = level['lattice']
+                    level_dict[(level_key, 'lat', 'x')] = level['i']
+                    level_dict[(level_key, 'lat', 'y')] = level['j']
+                    level_dict[(level_key, 'lat', 'z')] = level['k']
 
                 # This level is a universe / cell (e.g., ID->ID)
                 else:
-                    level_type = 'universe'
-
-                    # Initialize prefix Multi-index keys
-                    univ_key = (level_key, 'univ', 'id')
-                    cell_key = (level_key, 'cell', 'id')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[univ_key] = np.empty(num_offsets)
-                    level_dict[cell_key] = np.empty(num_offsets)
+                    level_dict[(level_key, 'univ', 'id')] = level['universe']
+                    level_dict[(level_key, 'cell', 'id')] = level['cell']
 
-                    # Determine any levels remain in path
-                    if '-' not in first_path:
-                        levels_remain = False
+            # Tile the Multi-index columns
+            for level_key, level_bins in level_dict.items():
+                level_bins = np.repeat(level_bins, self.stride)
+                tile_factor = data_size // len(level_bins)
+                level_dict[level_key] = np.tile(level_bins, tile_factor)
 
-                # Populate Multi-index arrays with all distribcell paths
-                for i, path in enumerate(distribcell_paths):
-
-                    if level_type == 'lattice':
-                        # Extract lattice ID, indices from path
-                        next_index = path.index('-')
-                        lat_id_indices = path[:next_index]
-
-                        # Trim lattice info from distribcell path
-                        distribcell_paths[i] = path[next_index+2:]
-
-                        # Extract the lattice cell indices from the path
-                        i1 = lat_id_indices.index('(')
-                        i2 = lat_id_indices.index(')')
-                        i3 = lat_id_indices[i1+1:i2]
-
-                        # Assign entry to Lattice Multi-index column
-                        level_dict[lat_id_key][i] = path[:i1]
-                        level_dict[lat_x_key][i] = int(i3.split(',')[0]) - 1
-                        level_dict[lat_y_key][i] = int(i3.split(',')[1]) - 1
-                        level_dict[lat_z_key][i] = int(i3.split(',')[2]) - 1
-
-                    else:
-                        # Extract universe ID from path
-                        next_index = path.index('-')
-                        universe_id = int(path[:next_index])
-
-                        # Trim universe info from distribcell path
-                        path = path[next_index+2:]
-
-                        # Extract cell ID from path
-                        if '-' in path:
-                            next_index = path.index('-')
-                            cell_id = int(path[:next_index])
-                            distribcell_paths[i] = path[next_index+2:]
-                        else:
-                            cell_id = int(path)
-                            distribcell_paths[i] = ''
-
-                        # Assign entry to Universe, Cell Multi-index columns
-                        level_dict[univ_key][i] = universe_id
-                        level_dict[cell_key][i] = cell_id
-
-                # Tile the Multi-index columns
-                for level_key, level_bins in level_dict.items():
-                    level_bins = np.repeat(level_bins, self.stride)
-                    tile_factor = data_size / len(level_bins)
-                    level_bins = np.tile(level_bins, tile_factor)
-                    level_dict[level_key] = level_bins
-
-                # Initialize a Pandas DataFrame from the level dictionary
-                if level_df is None:
-                    level_df = pd.DataFrame(level_dict)
-                else:
-                    level_df = pd.concat([level_df, pd.DataFrame(level_dict)],
-                                         axis=1)
+            # Initialize a Pandas DataFrame from the level dictionary
+            level_df = pd.DataFrame(level_dict)
 
         # Create DataFrame column for distribcell instance IDs
         # NOTE: This is performed regardless of whether the user
@@ -1303,8 +1410,6 @@ class DistribcellFilter(Filter):
 
         # Concatenate with DataFrame of distribcell instance IDs
         if level_df is not None:
-            level_df = level_df.dropna(axis=1, how='all')
-            level_df = level_df.astype(np.int)
             df = pd.concat([level_df, df], axis=1)
 
         return df
@@ -1818,6 +1923,9 @@ class EnergyFunctionFilter(Filter):
         # This filter only has one bin.  Always return 0.
         return 0
 
+    def get_bin_indices(self, filter_bins):
+        return np.zeros(len(filter_bins), dtype=int)
+
     def get_bin(self, bin_index):
         """This function is invalid for EnergyFunctionFilters."""
         raise RuntimeError('EnergyFunctionFilters have no get_bin() method')
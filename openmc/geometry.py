@@ -1,9 +1,12 @@
 from collections import OrderedDict
 from xml.etree import ElementTree as ET
 
+import numpy as np
+
 import openmc
 from openmc.clean_xml import sort_xml_elements, clean_xml_indentation
 from openmc.checkvalue import check_type
+from openmc.filter import _parse_distribcell_paths, _DISTRIBCELL_LEVEL_DTYPE
 
 
 def reset_auto_ids():
@@ -31,7 +34,7 @@ class Geometry(object):
 
     def __init__(self, root_universe=None):
         self._root_universe = None
-        self._offsets = {}
+        self._offset_maps = None
         if root_universe is not None:
             self.root_universe = root_universe
 
@@ -49,6 +52,7 @@ class Geometry(object):
             raise ValueError(msg)
 
         self._root_universe = root_universe
+        self._offset_maps = None
 
     def add_volume_information(self, volume_calc):
         """Add volume information from a stochastic volume calculation.
@@ -110,6 +114,69 @@ class Geometry(object):
         """
         return self.root_universe.find(point)
 
+    def find_many(self, points):
+        """Find the cells and materials which contain many points
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points, with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1 if no
+            cell contains the point
+        material_ids : numpy.ndarray
+            ID of the material filling that cell, or -1 if the cell is void,
+            is filled with distributed materials, or does not exist
+
+        """
+        return self.root_universe.find_many(points)
+
+    def _get_offset_maps(self):
+        """Return the distribcell offset tables indexed by cell and lattice.
+
+        The tables are those computed by OpenMC and read from the summary
+        file. They are gathered on first use.
+
+        Returns
+        -------
+        cells : dict
+            Distribcell index, fill type, and offsets of each cell, indexed by
+            cell ID. The offsets are only given for cells filled with a
+            universe.
+        lattices : dict
+            Offsets of each lattice element with shape (z, y, x, distribcell
+            index) and the shift of the x and y indices of paths relative to
+            the offsets, indexed by lattice ID
+
+        """
+        if self._offset_maps is None:
+            cells = {}
+            for cell in self.get_all_cells().values():
+                offsets = None
+                if cell.fill_type == 'universe' and cell.offsets is not None:
+                    offsets = np.asarray(cell.offsets)
+                cells[cell.id] = (cell.distribcell_index, cell.fill_type,
+                                  offsets)
+
+            lattices = {}
+            for lattice in self.get_all_lattices().values():
+                if lattice.offsets is not None:
+                    # Paths through hexagonal lattices give indices relative
+                    # to the center of the lattice
+                    if isinstance(lattice, openmc.HexLattice):
+                        shift = lattice.num_rings
+                    else:
+                        shift = 0
+                    lattices[lattice.id] = (np.asarray(lattice.offsets),
+                                            shift)
+
+            self._offset_maps = (cells, lattices)
+
+        return self._offset_maps
+
     def get_cell_instance(self, path):
         """Return the instance number for the final cell in a geometry path.
 
@@ -117,12 +184,12 @@ class Geometry(object):
 
         Parameters
         ----------
-        path : list
-            A list of IDs that form the path to the target. It should begin with
-            0 for the base universe, and should cover every universe, cell, and
-            lattice passed through. For the case of the lattice, a tuple should
-            be provided to indicate which coordinates in the lattice should be
-            entered. This should be in the form: (lat_id, i_x, i_y, i_z)
+        path : str
+            The path traversed through the CSG tree to reach the target, e.g.
+            '0->10->100(2,3,1)->20->30'. It should begin with 0 for the base
+            universe, and should cover every universe, cell, and lattice
+            passed through. Each lattice is given with the indices of the
+            lattice element that is entered.
 
         Returns
         -------
@@ -130,33 +197,84 @@ class Geometry(object):
             Index in tally results array for distribcell filters
 
         """
+        return int(self.get_cell_instances([path])[0])
 
-        # Extract the cell id from the path
-        last_index = path.rfind('>')
-        cell_id = int(path[last_index+1:])
+    def get_cell_instances(self, paths):
+        """Return the instance numbers for the final cells of geometry paths.
 
-        # Find the distribcell index of the cell.
-        cells = self.get_all_cells()
-        for cell in cells:
-            if cell.id == cell_id:
-                distribcell_index = cell.distribcell_index
-                break
-        else:
-            raise RuntimeError('Could not find cell {} specified in a \
-                                distribcell filter'.format(cell_id))
+        The instances are computed from the distribcell offset tables of the
+        cells and lattice elements traversed by the paths, which are gathered
+        once per geometry.
 
-        # Return memoize'd offset if possible
-        if (path, distribcell_index) in self._offsets:
-            offset = self._offsets[(path, distribcell_index)]
+        Parameters
+        ----------
+        paths : Iterable of str or numpy.ndarray
+            Paths traversed through the CSG tree to reach the targets, in the
+            format described in :meth:`Geometry.get_cell_instance`, or the
+            parsed paths given by :attr:`DistribcellFilter.levels`. All paths
+            must traverse the same levels of the CSG tree.
 
-        # Begin recursive call to compute offset starting with the base Universe
-        else:
-            offset = self._root_universe.get_cell_instance(path,
-                                                           distribcell_index)
-            self._offsets[(path, distribcell_index)] = offset
+        Returns
+        -------
+        numpy.ndarray
+            Index in tally results array for distribcell filters of each path
 
-        # Return the final offset
-        return offset
+        """
+        if isinstance(paths, np.ndarray) and \
+           paths.dtype == _DISTRIBCELL_LEVEL_DTYPE:
+            levels = np.atleast_2d(paths)
+        else:
+            levels = _parse_distribcell_paths(list(paths))
+        cells, lattices = self._get_offset_maps()
+
+        # Find the distribcell index of the final cell of each path
+        cell_ids, inverse = np.unique(levels['cell'][:, -1],
+                                      return_inverse=True)
+        indices = np.empty(len(cell_ids), dtype=int)
+        for n, cell_id in enumerate(cell_ids):
+            if cell_id in cells and \
+               cells[cell_id][1] not in ('material', 'distribmat', 'void'):
+                raise ValueError('Distribcell path ends at cell {} which is '
+                                 'filled with a {}'.format(
+                                     cell_id, cells[cell_id][1]))
+            if cell_id not in cells or cells[cell_id][0] is None:
+                raise RuntimeError('Could not find cell {} specified in a '
+                                   'distribcell filter'.format(cell_id))
+            indices[n] = cells[cell_id][0] - 1
+        indices = indices[inverse]
+
+        # Add the offsets of the cells and lattice elements at each level
+        instances = np.zeros(len(levels), dtype=int)
+        for level in levels.T:
+            if level['lattice'][0] >= 0:
+                ids, inverse = np.unique(level['lattice'], return_inverse=True)
+                for n, lattice_id in enumerate(ids):
+                    if lattice_id not in lattices:
+                        raise RuntimeError('Distribcell offsets of lattice {} '
+                                           'are not available'.format(
+                                               lattice_id))
+                    offsets, shift = lattices[lattice_id]
+                    mask = inverse == n
+                    instances[mask] += offsets[
+                        level['k'][mask], level['j'][mask] + shift,
+                        level['i'][mask] + shift, indices[mask]]
+            else:
+                ids, inverse = np.unique(level['cell'], return_inverse=True)
+                for n, cell_id in enumerate(ids):
+                    if cell_id not in cells:
+                        raise RuntimeError('Could not find cell {} specified '
+                                           'in a distribcell path'.format(
+                                               cell_id))
+                    distribcell_index, fill_type, offsets = cells[cell_id]
+                    if fill_type != 'universe':
+                        continue
+                    if offsets is None:
+                        raise RuntimeError('Distribcell offsets of cell {} '
+                                           'are not available'.format(cell_id))
+                    mask = inverse == n
+                    instances[mask] += offsets[indices[mask]]
+
+        return instances
 
     def get_all_cells(self):
         """Return all cells in the geometry.
@@ -249,7 +367,7 @@ class Geometry(object):
         """
         lattices = OrderedDict()
 
-        for cell in self.get_all_cells():
+        for cell in self.get_all_cells().values():
             if cell.fill_type == 'lattice':
                 if cell.fill not in lattices:
                     lattices[cell.fill.id] = cell.fill
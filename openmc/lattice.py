@@ -11,10 +11,36 @@ import numpy as np
 
 import openmc.checkvalue as cv
 import openmc
+from openmc.region import _Observable
+
+
+def _unique_rows(a):
+    """Return the distinct rows of a two-dimensional array.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        Two-dimensional array
+
+    Returns
+    -------
+    numpy.ndarray
+        Distinct rows of the array in lexicographic order
+    numpy.ndarray
+        Index of the distinct row equal to each row of the array
+
+    """
+    order = np.lexsort(a.T[::-1])
+    a = a[order]
+    first = np.ones(len(a), dtype=bool)
+    first[1:] = np.any(a[1:] != a[:-1], axis=1)
+    inverse = np.empty(len(a), dtype=int)
+    inverse[order] = np.cumsum(first) - 1
+    return a[first], inverse
 
 
 @add_metaclass(ABCMeta)
-class Lattice(object):
+class Lattice(_Observable):
     """A repeating structure wherein each element is a universe.
 
     Parameters
@@ -109,6 +135,8 @@ class Lattice(object):
     def outer(self, outer):
         cv.check_type('outer universe', outer, openmc.Universe)
         self._outer = outer
+        self._watch()
+        self._notify(False)
 
     @staticmethod
     def from_hdf5(group, universes):
@@ -261,6 +289,29 @@ class Lattice(object):
 
         return lattice
 
+    def _watch(self):
+        """Register the lattice with the universes filling it."""
+        for universe in getattr(self, '_watched', ()):
+            universe._remove_observer(self)
+
+        self._watched = []
+        if self._universes is not None:
+            self._watched.extend(self.get_unique_universes().values())
+        elif self._outer is not None:
+            self._watched.append(self._outer)
+        for universe in self._watched:
+            universe._add_observer(self)
+
+    def _on_change(self, source, bounds):
+        """Notify the cells filled with the lattice that a universe filling
+        it was modified."""
+        self._notify(False)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for universe in getattr(self, '_watched', ()):
+            universe._add_observer(self)
+
     def get_unique_universes(self):
         """Determine all unique universes in the lattice
 
@@ -378,6 +429,56 @@ class Lattice(object):
 
         return all_universes
 
+    def _find_many(self, points):
+        """Find the cells and materials which contain many points
+
+        Points are grouped by the universe filling their lattice element so
+        that each universe locates all of its points at once.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1
+        material_ids : numpy.ndarray
+            ID of the material filling that cell, or -1
+
+        """
+        cell_ids = np.full(len(points), -1, dtype=int)
+        material_ids = np.full(len(points), -1, dtype=int)
+
+        idx, local = self._find_elements(points)
+        elements, inverse = _unique_rows(idx)
+
+        # Determine the universe in each distinct lattice element. Universes
+        # are identified by object identity since hashing them is expensive.
+        universes = []
+        index_of = {}
+        codes = np.empty(len(elements), dtype=int)
+        for i, element in enumerate(elements):
+            element = tuple(element)
+            if self.is_valid_index(element):
+                u = self._get_universe(element)
+            else:
+                u = self.outer
+            if id(u) not in index_of:
+                index_of[id(u)] = len(universes)
+                universes.append(u)
+            codes[i] = index_of[id(u)]
+
+        codes = codes[inverse.ravel()]
+        for code, u in enumerate(universes):
+            if u is None:
+                continue
+            index = np.flatnonzero(codes == code)
+            cell_ids[index], material_ids[index] = u._find_many(local[index])
+
+        return cell_ids, material_ids
+
 
 class RectLattice(Lattice):
     """A lattice consisting of rectangular prisms.
@@ -537,6 +638,7 @@ class RectLattice(Lattice):
         cv.check_type('lattice lower left corner', lower_left, Iterable, Real)
         cv.check_length('lattice lower left corner', lower_left, 2, 3)
         self._lower_left = lower_left
+        self._notify(False)
 
     @offsets.setter
     def offsets(self, offsets):
@@ -550,12 +652,15 @@ class RectLattice(Lattice):
         for dim in pitch:
             cv.check_greater_than('lattice pitch', dim, 0.0)
         self._pitch = pitch
+        self._notify(False)
 
     @Lattice.universes.setter
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
         self._universes = np.asarray(universes)
+        self._watch()
+        self._notify(False)
 
     def get_cell_instance(self, path, distribcell_index):
         # Extract the lattice element from the path
@@ -611,6 +716,45 @@ class RectLattice(Lattice):
             idx = (ix, iy, iz)
         return idx, self.get_local_coordinates(point, idx)
 
+    def _find_elements(self, points):
+        """Determine lattice element indices and local coordinates of points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            (x,y,z) lattice element indices of each point with shape (N, 2) or
+            (N, 3)
+        numpy.ndarray
+            Coordinates of each point in the corresponding lattice element
+            coordinate system with shape (N, 3)
+
+        """
+        idx = [np.floor((points[:, i] - self.lower_left[i])/self.pitch[i])
+               .astype(int) for i in range(self.ndim)]
+        local = self.get_local_coordinates(points.T, idx)
+        return np.column_stack(idx), np.column_stack(local)
+
+    def _get_universe(self, idx):
+        """Return the universe filling a lattice element
+
+        Parameters
+        ----------
+        idx : Iterable of int
+            Lattice element indices in the :math:`(x,y,z)` coordinate system
+
+        Returns
+        -------
+        openmc.Universe
+            Universe filling the lattice element
+
+        """
+        return self.universes[self.get_universe_index(idx)]
+
     def get_local_coordinates(self, point, idx):
         """Determine local coordinates of a point within a lattice element
 
@@ -851,6 +995,7 @@ class HexLattice(Lattice):
         self._num_rings = None
         self._num_axial = None
         self._center = None
+        self._offsets = None
 
     def __eq__(self, other):
         if not isinstance(other, HexLattice):
@@ -912,6 +1057,10 @@ class HexLattice(Lattice):
     def center(self):
         return self._center
 
+    @property
+    def offsets(self):
+        return self._offsets
+
     @property
     def indices(self):
         if self.num_axial is None:
@@ -927,6 +1076,12 @@ class HexLattice(Lattice):
         cv.check_type('lattice center', center, Iterable, Real)
         cv.check_length('lattice center', center, 2, 3)
         self._center = center
+        self._notify(False)
+
+    @offsets.setter
+    def offsets(self, offsets):
+        cv.check_type('lattice offsets', offsets, Iterable)
+        self._offsets = offsets
 
     @Lattice.pitch.setter
     def pitch(self, pitch):
@@ -935,12 +1090,15 @@ class HexLattice(Lattice):
         for dim in pitch:
             cv.check_greater_than('lattice pitch', dim, 0)
         self._pitch = pitch
+        self._notify(False)
 
     @Lattice.universes.setter
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
         self._universes = universes
+        self._watch()
+        self._notify(False)
 
         # NOTE: This routine assumes that the user creates a "ragged" list of
         # lists, where each sub-list corresponds to one ring of Universes.
@@ -1019,6 +1177,34 @@ class HexLattice(Lattice):
                                              6*(self._num_rings - 1 - r))
                     raise ValueError(msg)
 
+    def get_cell_instance(self, path, distribcell_index):
+        # Extract the lattice element from the path. The indices may be
+        # negative, so split on the full delimiter.
+        next_index = path.index('->')
+        lat_id_indices = path[:next_index]
+        path = path[next_index+2:]
+
+        # Extract the lattice cell indices from the path. The x and alpha
+        # indices are relative to the center of the lattice, whereas the
+        # offsets are indexed from its corner.
+        i1 = lat_id_indices.index('(')
+        i2 = lat_id_indices.index(')')
+        i = lat_id_indices[i1+1:i2]
+        lat_x = int(i.split(',')[0])
+        lat_a = int(i.split(',')[1])
+        lat_z = int(i.split(',')[2]) - 1
+
+        offset = self._offsets[lat_z, lat_a + self._num_rings - 1,
+                               lat_x + self._num_rings - 1,
+                               distribcell_index-1]
+        if self.num_axial is None:
+            universe = self._get_universe((lat_x, lat_a))
+        else:
+            universe = self._get_universe((lat_x, lat_a, lat_z))
+        offset += universe.get_cell_instance(path, distribcell_index)
+
+        return offset
+
     def find_element(self, point):
         r"""Determine index of lattice element and local coordinates for a point
 
@@ -1063,6 +1249,49 @@ class HexLattice(Lattice):
 
         return idx_min, p_min
 
+    def _find_elements(self, points):
+        r"""Determine lattice element indices and local coordinates of points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the lattice element of each point in :math:`(x,\alpha,z)`
+            bases with shape (N, 3)
+        numpy.ndarray
+            Coordinates of each point in the corresponding lattice element
+            coordinate system with shape (N, 3)
+
+        """
+        # Convert coordinates to skewed bases
+        x = points[:, 0] - self.center[0]
+        y = points[:, 1] - self.center[1]
+        if self._num_axial is None:
+            iz = np.ones(len(points), dtype=int)
+        else:
+            z = points[:, 2] - self.center[2]
+            iz = np.floor(z/self.pitch[1] + 0.5*self.num_axial).astype(int)
+        alpha = y - x/sqrt(3.)
+        ix = np.floor(x/(sqrt(0.75) * self.pitch[0])).astype(int)
+        ia = np.floor(alpha/self.pitch[0]).astype(int)
+
+        # Check four lattice elements to see which one is closest based on local
+        # coordinates
+        candidates = [(ix, ia, iz), (ix + 1, ia, iz), (ix, ia + 1, iz),
+                      (ix + 1, ia + 1, iz)]
+        coords = [self.get_local_coordinates(points.T, idx)
+                  for idx in candidates]
+        closest = np.argmin([p[0]**2 + p[1]**2 for p in coords], axis=0)
+
+        idx = [np.choose(closest, [c[i] for c in candidates]) for i in range(3)]
+        local = [np.choose(closest, [np.broadcast_to(p[i], ix.shape)
+                                     for p in coords]) for i in range(3)]
+        return np.column_stack(idx), np.column_stack(local)
+
     def get_local_coordinates(self, point, idx):
         r"""Determine local coordinates of a point within a lattice element
 
@@ -1129,6 +1358,27 @@ class HexLattice(Lattice):
         else:
             return (idx[2], i_ring, i_within)
 
+    def _get_universe(self, idx):
+        r"""Return the universe filling a lattice element
+
+        Parameters
+        ----------
+        idx : Iterable of int
+            Lattice element indices in the :math:`(x,\alpha,z)` coordinate
+            system
+
+        Returns
+        -------
+        openmc.Universe
+            Universe filling the lattice element
+
+        """
+        idx_u = self.get_universe_index(idx)
+        if self.num_axial is None:
+            return self.universes[idx_u[0]][idx_u[1]]
+        else:
+            return self.universes[idx_u[0]][idx_u[1]][idx_u[2]]
+
     def is_valid_index(self, idx):
         r"""Determine whether lattice element index is within defined range
 
@@ -119,7 +119,7 @@ class MDGXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1000,7 +1000,7 @@ class ChiDelayed(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1514,7 +1514,7 @@ class DelayedNuFissionXS(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1650,7 +1650,7 @@ class Beta(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -1834,7 +1834,7 @@ class DecayRate(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2010,7 +2010,7 @@ class MatrixMDGXS(MDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2603,7 +2603,7 @@ class DelayedNuFissionMatrixXS(MatrixMDGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
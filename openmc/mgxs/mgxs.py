@@ -197,7 +197,7 @@ class MGXS(object):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -633,11 +633,11 @@ class MGXS(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
+        tally data processing. The tally data will be stored as SciPy CSR
         matrices internally within the Tally object. All tally data access
         properties and methods will return data as a dense NumPy array.
 
@@ -2050,7 +2050,7 @@ class MatrixMGXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2545,7 +2545,7 @@ class TotalXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2682,7 +2682,7 @@ class TransportXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2865,7 +2865,7 @@ class AbsorptionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -2992,7 +2992,7 @@ class CaptureXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3146,7 +3146,7 @@ class FissionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3307,7 +3307,7 @@ class KappaFissionXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3439,7 +3439,7 @@ class ScatterXS(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -3618,7 +3618,7 @@ class ScatterMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -4473,7 +4473,7 @@ class MultiplicityMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -4644,7 +4644,7 @@ class NuFissionMatrixXS(MatrixMGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -4801,7 +4801,7 @@ class Chi(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
@@ -5374,7 +5374,7 @@ class InverseVelocity(MGXS):
         are not specified by the user, all nuclides in the spatial domain
         are included. This attribute is 'sum' if by_nuclide is false.
     sparse : bool
-        Whether or not the MGXS' tallies use SciPy's LIL sparse matrix format
+        Whether or not the MGXS' tallies use SciPy's CSR sparse matrix format
         for compressed data storage
     loaded_sp : bool
         Whether or not a statepoint file has been loaded with tally data
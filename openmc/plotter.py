@@ -343,7 +343,7 @@ def _calculate_cexs_nuclide(this, types, temperature=294., sab_name=None,
             yields.append(False)
 
     # Load the library
-    library = openmc.data.DataLibrary.from_xml(cross_sections)
+    library = openmc.data.DATA_CACHE.get_library(cross_sections)
 
     # Convert temperature to format needed for access in the library
     strT = "{}K".format(int(round(temperature)))
@@ -354,7 +354,7 @@ def _calculate_cexs_nuclide(this, types, temperature=294., sab_name=None,
     xs = []
     lib = library.get_by_material(this.name)
     if lib is not None:
-        nuc = openmc.data.IncidentNeutron.from_hdf5(lib['path'])
+        nuc = openmc.data.DATA_CACHE.get_neutron(lib['path'])
         # Obtain the nearest temperature
         if strT in nuc.temperatures:
             nucT = strT
@@ -372,7 +372,7 @@ def _calculate_cexs_nuclide(this, types, temperature=294., sab_name=None,
 
         # Prep S(a,b) data if needed
         if sab_name:
-            sab = openmc.data.ThermalScattering.from_hdf5(sab_name)
+            sab = openmc.data.DATA_CACHE.get_thermal(sab_name)
             # Obtain the nearest temperature
             if strT in sab.temperatures:
                 sabT = strT
@@ -527,7 +527,7 @@ def _calculate_cexs_elem_mat(this, types, temperature=294.,
         T = temperature
 
     # Load the library
-    library = openmc.data.DataLibrary.from_xml(cross_sections)
+    library = openmc.data.DATA_CACHE.get_library(cross_sections)
 
     if isinstance(this, openmc.Material):
         # Expand elements in to nuclides with atomic densities
@@ -557,13 +557,13 @@ def _calculate_cexs_elem_mat(this, types, temperature=294.,
         sabs[nuclide[0]] = None
     if isinstance(this, openmc.Material):
         for sab_name in this._sab:
-            sab = openmc.data.ThermalScattering.from_hdf5(
+            sab = openmc.data.DATA_CACHE.get_thermal(
                 library.get_by_material(sab_name)['path'])
             for nuc in sab.nuclides:
                 sabs[nuc] = library.get_by_material(sab_name)['path']
     else:
         if sab_name:
-            sab = openmc.data.ThermalScattering.from_hdf5(sab_name)
+            sab = openmc.data.DATA_CACHE.get_thermal(sab_name)
             for nuc in sab.nuclides:
                 sabs[nuc] = library.get_by_material(sab_name)['path']
 
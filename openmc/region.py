@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from collections import Iterable
+import weakref
 
 from six import add_metaclass
 import numpy as np
@@ -7,8 +8,106 @@ import numpy as np
 from openmc.checkvalue import check_type
 
 
+# Instructions of compiled regions
+_CONSTANT = 0       # Push a constant
+_SENSE = 1          # Push the sense of a surface
+_AND = 2            # Replace the top two values by their intersection
+_OR = 3             # Replace the top two values by their union
+_NOT = 4            # Replace the top value by its complement
+_JUMP_IF_NONE = 5   # Jump if the top value holds for no point
+_JUMP_IF_ALL = 6    # Jump if the top value holds for every point
+
+class _Observable(object):
+    """Part of a geometry that notifies the objects using it when modified.
+
+    Observers are held by weak references and are notified through their
+    ``_on_change`` method, which is passed the modified object and whether
+    its extent may have changed. Objects have no observers while they are
+    being constructed, so only modifications of existing objects are
+    reported. Observers are not copied or pickled along with the object; they
+    register themselves again when they are restored.
+
+    """
+
+    def _add_observer(self, observer):
+        observers = self.__dict__.setdefault('_observers', {})
+        key = id(observer)
+        if key not in observers:
+            def forget(ref, key=key):
+                if observers.get(key) is ref:
+                    del observers[key]
+            observers[key] = weakref.ref(observer, forget)
+
+    def _remove_observer(self, observer):
+        self.__dict__.get('_observers', {}).pop(id(observer), None)
+
+    def _notify(self, bounds=True):
+        """Notify the observers that the object has been modified.
+
+        Parameters
+        ----------
+        bounds : bool
+            Whether the extent of the object may have changed
+
+        """
+        observers = self.__dict__.get('_observers')
+        if observers:
+            for ref in list(observers.values()):
+                observer = ref()
+                if observer is not None:
+                    observer._on_change(self, bounds)
+
+    def _children(self):
+        """Return the parts of the geometry the object is composed of."""
+        return ()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_observers', None)
+        return state
+
+
+class _NodeList(list):
+    """List of the nodes of a region that reports changes to the region.
+
+    Parameters
+    ----------
+    region : openmc.Region
+        Region whose nodes are listed
+    nodes : Iterable of openmc.Region
+        Nodes of the region
+
+    """
+
+    def __init__(self, region, nodes):
+        super(_NodeList, self).__init__(nodes)
+        self._region = region
+
+
+def _node_list_mutator(name):
+    """Return a list method that notifies the region after mutating."""
+    method = getattr(list, name)
+
+    def mutate(self, *args):
+        result = method(self, *args)
+        # Nodes are added before the region is set when unpickling
+        region = getattr(self, '_region', None)
+        if region is not None:
+            region._changed()
+        return result
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'reverse',
+              'sort', '__setitem__', '__delitem__', '__iadd__', '__imul__',
+              '__setslice__', '__delslice__'):
+    if hasattr(list, _name):
+        setattr(_NodeList, _name, _node_list_mutator(_name))
+
+
 @add_metaclass(ABCMeta)
-class Region(object):
+class Region(_Observable):
     """Region of space that can be assigned to a cell.
 
     Region is an abstract base class that is inherited by
@@ -46,6 +145,34 @@ class Region(object):
     def __ne__(self, other):
         return not self == other
 
+    def compile(self):
+        """Compile the region into a postfix program.
+
+        Returns
+        -------
+        openmc.CompiledRegion
+            Program that evaluates whether points are in the region
+
+        """
+        program = CompiledRegion()
+        self._compile(program)
+        return program
+
+    @abstractmethod
+    def _compile(self, program):
+        """Append the instructions that evaluate the region to a program.
+
+        Parameters
+        ----------
+        program : openmc.CompiledRegion
+            Program being compiled
+
+        """
+
+    def _changed(self):
+        """Notify the cells using the region that it has been modified."""
+        self._notify()
+
     @staticmethod
     def from_expression(expression, surfaces):
         """Generate a region given an infix expression.
@@ -257,6 +384,27 @@ class Intersection(Region):
         """
         return all(point in n for n in self.nodes)
 
+    def _compile(self, program):
+        if not self.nodes:
+            program.instructions.append((_CONSTANT, True))
+            return
+        jumps = []
+        for i, n in enumerate(self.nodes):
+            if i > 0:
+                jumps.append(len(program.instructions))
+                program.instructions.append(None)
+            n._compile(program)
+            if i > 0:
+                program.instructions.append((_AND, None))
+
+        # Skip the remaining nodes once no point can be in the intersection
+        end = len(program.instructions)
+        for i in jumps:
+            program.instructions[i] = (_JUMP_IF_NONE, end)
+
+    def _children(self):
+        return self.nodes
+
     def __str__(self):
         return '(' + ' '.join(map(str, self.nodes)) + ')'
 
@@ -277,7 +425,8 @@ class Intersection(Region):
     @nodes.setter
     def nodes(self, nodes):
         check_type('nodes', nodes, Iterable, Region)
-        self._nodes = nodes
+        self._nodes = _NodeList(self, nodes)
+        self._changed()
 
 
 class Union(Region):
@@ -334,6 +483,27 @@ class Union(Region):
         """
         return any(point in n for n in self.nodes)
 
+    def _compile(self, program):
+        if not self.nodes:
+            program.instructions.append((_CONSTANT, False))
+            return
+        jumps = []
+        for i, n in enumerate(self.nodes):
+            if i > 0:
+                jumps.append(len(program.instructions))
+                program.instructions.append(None)
+            n._compile(program)
+            if i > 0:
+                program.instructions.append((_OR, None))
+
+        # Skip the remaining nodes once every point is in the union
+        end = len(program.instructions)
+        for i in jumps:
+            program.instructions[i] = (_JUMP_IF_ALL, end)
+
+    def _children(self):
+        return self.nodes
+
     def __str__(self):
         return '(' + ' | '.join(map(str, self.nodes)) + ')'
 
@@ -354,7 +524,8 @@ class Union(Region):
     @nodes.setter
     def nodes(self, nodes):
         check_type('nodes', nodes, Iterable, Region)
-        self._nodes = nodes
+        self._nodes = _NodeList(self, nodes)
+        self._changed()
 
 
 class Complement(Region):
@@ -405,6 +576,13 @@ class Complement(Region):
         """
         return point not in self.node
 
+    def _compile(self, program):
+        self.node._compile(program)
+        program.instructions.append((_NOT, None))
+
+    def _children(self):
+        return (self.node,)
+
     def __str__(self):
         return '~' + str(self.node)
 
@@ -416,6 +594,7 @@ class Complement(Region):
     def node(self, node):
         check_type('node', node, Region)
         self._node = node
+        self._changed()
 
     @property
     def bounding_box(self):
@@ -431,3 +610,171 @@ class Complement(Region):
         else:
             temp_region = ~self.node
         return temp_region.bounding_box
+
+
+class CompiledRegion(object):
+    """Region flattened into a postfix program.
+
+    Instances of CompiledRegion are created by :meth:`Region.compile`. Each
+    distinct surface of the region appears once in the program, and the
+    operators of the region are replaced by instructions acting on a stack of
+    boolean values. Intersections and unions skip their remaining operands
+    once the result is decided for every point being evaluated. A single
+    point is evaluated with Python booleans, so that the program is as fast
+    as testing the point against the region itself.
+
+    Attributes
+    ----------
+    surfaces : list of openmc.Surface
+        Distinct surfaces referenced by the program
+    instructions : list of tuple
+        Operation code and argument of each instruction
+
+    """
+
+    def __init__(self):
+        self.surfaces = []
+        self.instructions = []
+        self._surface_index = {}
+
+    def __contains__(self, point):
+        """Check whether a point is contained in the region.
+
+        Parameters
+        ----------
+        point : 3-tuple of float
+            Cartesian coordinates, :math:`(x',y',z')`, of the point
+
+        Returns
+        -------
+        bool
+            Whether the point is in the region
+
+        """
+        return bool(self.evaluate(point))
+
+    def _add_surface(self, surface, side):
+        """Append an instruction pushing the sense of a surface.
+
+        Parameters
+        ----------
+        surface : openmc.Surface
+            Surface whose sense is pushed
+        side : {'+', '-'}
+            Side of the surface that is tested
+
+        """
+        if surface not in self._surface_index:
+            self._surface_index[surface] = len(self.surfaces)
+            self.surfaces.append(surface)
+        self.instructions.append(
+            (_SENSE, (self._surface_index[surface], side == '+')))
+
+    def evaluate(self, points, senses=None):
+        """Determine which points are contained in the region.
+
+        Parameters
+        ----------
+        points : Iterable of float
+            Cartesian coordinates of a single point or of many points with
+            shape (N, 3)
+        senses : dict, optional
+            Senses of surfaces at the points, indexed by surface. Missing
+            entries are added as surfaces are evaluated. Passing the same
+            dictionary to the programs of several regions evaluates each
+            surface only once.
+
+        Returns
+        -------
+        bool or numpy.ndarray
+            Whether each point is in the region
+
+        """
+        points = np.asarray(points, dtype=float)
+        if senses is None:
+            senses = {}
+        if points.ndim == 1:
+            return self._evaluate_point(points.tolist(), senses)
+
+        stack = []
+        pc = 0
+        n = len(self.instructions)
+        while pc < n:
+            op, arg = self.instructions[pc]
+            pc += 1
+            if op == _SENSE:
+                surface = self.surfaces[arg[0]]
+                if surface not in senses:
+                    senses[surface] = surface.evaluate(points.T) >= 0.
+                if arg[1]:
+                    stack.append(senses[surface])
+                else:
+                    stack.append(np.logical_not(senses[surface]))
+            elif op == _AND:
+                value = stack.pop()
+                stack[-1] = np.logical_and(stack[-1], value)
+            elif op == _OR:
+                value = stack.pop()
+                stack[-1] = np.logical_or(stack[-1], value)
+            elif op == _NOT:
+                stack[-1] = np.logical_not(stack[-1])
+            elif op == _JUMP_IF_NONE:
+                if not stack[-1].any():
+                    pc = arg
+            elif op == _JUMP_IF_ALL:
+                if stack[-1].all():
+                    pc = arg
+            elif op == _CONSTANT:
+                stack.append(np.full(len(points), arg, dtype=bool))
+
+        return stack[0]
+
+    def _evaluate_point(self, point, senses):
+        """Determine whether a single point is contained in the region.
+
+        Parameters
+        ----------
+        point : list of float
+            Cartesian coordinates of the point
+        senses : dict
+            Senses of surfaces at the point, indexed by surface
+
+        Returns
+        -------
+        bool
+            Whether the point is in the region
+
+        """
+        surfaces = self.surfaces
+        instructions = self.instructions
+        stack = []
+        pc = 0
+        n = len(instructions)
+        while pc < n:
+            op, arg = instructions[pc]
+            pc += 1
+            if op == _SENSE:
+                surface = surfaces[arg[0]]
+                sense = senses.get(surface)
+                if sense is None:
+                    sense = senses[surface] = \
+                        bool(surface.evaluate(point) >= 0.)
+                stack.append(sense if arg[1] else not sense)
+            elif op == _JUMP_IF_NONE:
+                if not stack[-1]:
+                    pc = arg
+            elif op == _AND:
+                value = stack.pop()
+                stack[-1] = stack[-1] and value
+            elif op == _JUMP_IF_ALL:
+                if stack[-1]:
+                    pc = arg
+            elif op == _OR:
+                value = stack.pop()
+                stack[-1] = stack[-1] or value
+            elif op == _NOT:
+                stack[-1] = not stack[-1]
+            elif op == _CONSTANT:
+                stack.append(arg)
+
+        return stack[0]
@@ -102,6 +102,10 @@ class Settings(object):
         Options for writing state points. Acceptable keys are:
 
         :batches: list of batches at which to write source
+        :chunked: bool indicating whether tally results should be written as
+                  chunked datasets aligned with the filter strides
+        :compression: int between 0 and 9 indicating the gzip compression
+                      level for tally results (implies a chunked layout)
     survival_biasing : bool
         Indicate whether survival biasing is to be used
     tabular_legendre : dict
@@ -526,6 +530,14 @@ class Settings(object):
                 cv.check_type('statepoint batches', value, Iterable, Integral)
                 for batch in value:
                     cv.check_greater_than('statepoint batch', batch, 0)
+            elif key == 'chunked':
+                cv.check_type('statepoint chunked', value, bool)
+            elif key == 'compression':
+                cv.check_type('statepoint compression', value, Integral)
+                cv.check_greater_than('statepoint compression', value, 0,
+                                      equality=True)
+                cv.check_less_than('statepoint compression', value, 9,
+                                   equality=True)
             else:
                 raise ValueError("Unknown key '{}' encountered when setting "
                                  "statepoint options.".format(key))
@@ -868,6 +880,12 @@ class Settings(object):
                 subelement = ET.SubElement(element, "batches")
                 subelement.text = ' '.join(
                     str(x) for x in self._statepoint['batches'])
+            if 'chunked' in self._statepoint:
+                subelement = ET.SubElement(element, "chunked")
+                subelement.text = str(self._statepoint['chunked']).lower()
+            if 'compression' in self._statepoint:
+                subelement = ET.SubElement(element, "compression")
+                subelement.text = str(self._statepoint['compression'])
 
     def _create_sourcepoint_subelement(self, root):
         if self._sourcepoint:
@@ -1,17 +1,133 @@
+from collections import defaultdict, Iterable
+from contextlib import contextmanager
+import multiprocessing
+from numbers import Integral
 import sys
 import re
 import os
+import shutil
 import warnings
 import glob
 
 import numpy as np
 import h5py
+from six import string_types
 
 import openmc
 import openmc.checkvalue as cv
 
 _VERSION_STATEPOINT = 16
 
+# Sums of the products of pairs of estimates of k-effective
+_K_PRODUCTS = ('k_col_abs', 'k_col_tra', 'k_abs_tra')
+
+# Bins of real-valued filters are indexed by their value rounded to two
+# significant digits. Values smaller in magnitude than the threshold are
+# indexed as zero.
+_REAL_BIN_FORMAT = '{:.1e}'
+_REAL_BIN_ZERO = 1e-5
+
+# Statepoint files that are currently open, keyed by absolute path, inode,
+# size and modification time so that a file which is rewritten is opened
+# again. Each value is a two-item list containing the h5py.File object and its
+# reference count.
+_OPEN_FILES = {}
+
+
+def _acquire_file(filename):
+    """Return a shared read-only handle for a statepoint file.
+
+    If the file is already open (e.g., by a StatePoint object) and has not
+    been modified since, the existing handle is returned and its reference
+    count is incremented. Otherwise, the file is opened and added to the pool.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the statepoint file
+
+    Returns
+    -------
+    key : tuple
+        Key of the handle in the pool, which is passed to
+        :func:`_release_file` once the handle is no longer needed
+    h5py.File
+        Open HDF5 file
+
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    key = (path, stat.st_ino, stat.st_size, stat.st_mtime)
+    if key in _OPEN_FILES:
+        _OPEN_FILES[key][1] += 1
+    else:
+        _OPEN_FILES[key] = [h5py.File(path, 'r'), 1]
+    return key, _OPEN_FILES[key][0]
+
+
+def _release_file(key):
+    """Decrement the reference count of a shared statepoint file handle and
+    close the file once it is no longer in use.
+
+    Parameters
+    ----------
+    key : tuple
+        Key of the handle returned by :func:`_acquire_file`
+
+    """
+    if key in _OPEN_FILES:
+        _OPEN_FILES[key][1] -= 1
+        if _OPEN_FILES[key][1] <= 0:
+            f, _ = _OPEN_FILES.pop(key)
+            f.close()
+
+
+@contextmanager
+def _shared_file(filename):
+    """Context manager yielding a shared handle for a statepoint file."""
+    key, f = _acquire_file(filename)
+    try:
+        yield f
+    finally:
+        _release_file(key)
+
+
+def _real_bin_key(value):
+    """Round a bin of a real-valued filter for the tally index."""
+    if abs(value) < _REAL_BIN_ZERO:
+        return 0.
+    return float(_REAL_BIN_FORMAT.format(value))
+
+
+class _TallyDict(dict):
+    """Dictionary of the tallies of a statepoint that counts modifications.
+
+    The version is shared with the tallies and filters in the tally index of
+    the statepoint, which increment it when they are modified.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_TallyDict, self).__init__(*args, **kwargs)
+        self._state = {'version': 0}
+
+
+def _tally_dict_mutator(name):
+    """Return a dictionary method that counts the modification."""
+    method = getattr(dict, name)
+
+    def mutate(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._state['version'] += 1
+        return result
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', 'clear', 'pop', 'popitem',
+              'setdefault', 'update'):
+    setattr(_TallyDict, _name, _tally_dict_mutator(_name))
+
 
 class StatePoint(object):
     """State information on a simulation at a certain point in time (at the end
@@ -51,7 +167,8 @@ class StatePoint(object):
     date_and_time : str
         Date and time when simulation began
     entropy : numpy.ndarray
-        Shannon entropy of fission source at each batch
+        Shannon entropy of fission source at each batch. None for statepoints
+        written by :class:`StatePointMerger`.
     generations_per_batch : int
         Number of fission generations per batch
     global_tallies : numpy.ndarray of compound datatype
@@ -66,7 +183,8 @@ class StatePoint(object):
     k_abs_tra : float
         Cross-product of absorption and tracklength estimates of k-effective
     k_generation : numpy.ndarray
-        Estimate of k-effective for each batch/generation
+        Estimate of k-effective for each batch/generation. None for
+        statepoints written by :class:`StatePointMerger`.
     meshes : dict
         Dictionary whose keys are mesh IDs and whose values are Mesh objects
     n_batches : int
@@ -93,7 +211,7 @@ class StatePoint(object):
     source_present : bool
         Indicate whether source sites are present
     sparse : bool
-        Whether or not the tallies uses SciPy's LIL sparse matrix format for
+        Whether or not the tallies uses SciPy's CSR sparse matrix format for
         compressed data storage
     tallies : dict
         Dictionary whose keys are tally IDs and whose values are Tally objects
@@ -110,9 +228,10 @@ class StatePoint(object):
     """
 
     def __init__(self, filename, autolink=True):
-        self._f = h5py.File(filename, 'r')
+        self._filename = filename
+        self._file_key, self._f = _acquire_file(filename)
         self._meshes = {}
-        self._tallies = {}
+        self._tallies = _TallyDict()
         self._derivs = {}
 
         # Check filetype and version
@@ -125,6 +244,7 @@ class StatePoint(object):
         self._global_tallies = None
         self._sparse = False
         self._derivs_read = False
+        self._tally_index = None
 
         # Automatically link in a summary file if one exists
         if autolink:
@@ -139,6 +259,20 @@ class StatePoint(object):
                     vol = openmc.VolumeCalculation.from_hdf5(path_i)
                     self.add_volume_information(vol)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        # The shared file handle is kept alive by the pool, so it has to be
+        # released explicitly when the statepoint goes out of scope
+        try:
+            self.close()
+        except Exception:
+            pass
+
     @property
     def cmfd_on(self):
         return self._f.attrs['cmfd_on'] > 0
@@ -181,7 +315,7 @@ class StatePoint(object):
 
     @property
     def entropy(self):
-        if self.run_mode == 'eigenvalue':
+        if self.run_mode == 'eigenvalue' and 'entropy' in self._f:
             return self._f['entropy'].value
         else:
             return None
@@ -223,7 +357,7 @@ class StatePoint(object):
 
     @property
     def k_generation(self):
-        if self.run_mode == 'eigenvalue':
+        if self.run_mode == 'eigenvalue' and 'k_generation' in self._f:
             return self._f['k_generation'].value
         else:
             return None
@@ -332,45 +466,46 @@ class StatePoint(object):
             else:
                 tally_ids = []
 
+            # Read the metadata of all tallies from the compact index if it is
+            # present, otherwise fall back to reading each tally group
+            if 'index' in tallies_group:
+                metadata = self._read_tally_index(tallies_group['index'])
+            else:
+                metadata = [self._read_tally_group(
+                    tallies_group['tally {}'.format(tally_id)])
+                    for tally_id in tally_ids]
+
             # Iterate over all tallies
-            for tally_id in tally_ids:
+            for tally_id, meta in zip(tally_ids, metadata):
                 group = tallies_group['tally {}'.format(tally_id)]
 
-                # Read the number of realizations
-                n_realizations = group['n_realizations'].value
-
                 # Create Tally object and assign basic properties
                 tally = openmc.Tally(tally_id)
-                tally._sp_filename = self._f.filename
-                tally.name = group['name'].value.decode()
-                tally.estimator = group['estimator'].value.decode()
-                tally.num_realizations = n_realizations
+                tally._sp_filename = self._file_key[0]
+                tally.name = meta['name']
+                tally.estimator = meta['estimator']
+                tally.num_realizations = meta['n_realizations']
 
                 # Read derivative information.
-                if 'derivative' in group:
-                    deriv_id = group['derivative'].value
-                    tally.derivative = self.tally_derivatives[deriv_id]
+                if meta['derivative'] is not None:
+                    tally.derivative = self.tally_derivatives[
+                        meta['derivative']]
 
                 # Read all filters
-                n_filters = group['n_filters'].value
+                n_filters = meta['n_filters']
                 for j in range(1, n_filters + 1):
                     filter_group = group['filter {}'.format(j)]
                     new_filter = openmc.Filter.from_hdf5(filter_group,
                                                          meshes=self.meshes)
                     tally.filters.append(new_filter)
 
-                # Read nuclide bins
-                nuclide_names = group['nuclides'].value
-
                 # Add all nuclides to the Tally
+                nuclide_names = meta['nuclides']
                 for name in nuclide_names:
-                    nuclide = openmc.Nuclide(name.decode().strip())
-                    tally.nuclides.append(nuclide)
-
-                scores = group['score_bins'].value
-                n_score_bins = group['n_score_bins'].value
+                    tally.nuclides.append(openmc.Nuclide(name))
 
                 # Compute and set the filter strides
+                n_score_bins = len(meta['scores'])
                 for i in range(n_filters):
                     tally_filter = tally.filters[i]
                     tally_filter.stride = n_score_bins * len(nuclide_names)
@@ -378,17 +513,8 @@ class StatePoint(object):
                     for j in range(i+1, n_filters):
                         tally_filter.stride *= tally.filters[j].num_bins
 
-                # Read scattering moment order strings (e.g., P3, Y1,2, etc.)
-                moments = group['moment_orders'].value
-
                 # Add the scores to the Tally
-                for j, score in enumerate(scores):
-                    score = score.decode()
-
-                    # If this is a moment, use generic moment order
-                    pattern = r'-n$|-pn$|-yn$'
-                    score = re.sub(pattern, '-' + moments[j].decode(), score)
-
+                for score in meta['scores']:
                     tally.scores.append(score)
 
                 # Add Tally to the global dictionary of all Tallies
@@ -396,9 +522,114 @@ class StatePoint(object):
                 self._tallies[tally_id] = tally
 
             self._tallies_read = True
+            self._build_tally_index()
 
         return self._tallies
 
+    @staticmethod
+    def _read_tally_group(group):
+        """Read the metadata for a single tally from its HDF5 group.
+
+        This is used for statepoint files written without a tally metadata
+        index.
+
+        Parameters
+        ----------
+        group : h5py.Group
+            HDF5 group for the tally
+
+        Returns
+        -------
+        dict
+            Tally metadata with keys 'name', 'estimator', 'n_realizations',
+            'derivative', 'n_filters', 'nuclides' and 'scores'
+
+        """
+
+        meta = {}
+        meta['name'] = group['name'].value.decode()
+        meta['estimator'] = group['estimator'].value.decode()
+        meta['n_realizations'] = group['n_realizations'].value
+        if 'derivative' in group:
+            meta['derivative'] = group['derivative'].value
+        else:
+            meta['derivative'] = None
+        meta['n_filters'] = group['n_filters'].value
+        meta['nuclides'] = [name.decode().strip() for name in
+                            group['nuclides'].value]
+
+        # Read scattering moment order strings (e.g., P3, Y1,2, etc.)
+        moments = group['moment_orders'].value
+
+        # If a score is a moment, use generic moment order
+        meta['scores'] = []
+        for j, score in enumerate(group['score_bins'].value):
+            pattern = r'-n$|-pn$|-yn$'
+            score = re.sub(pattern, '-' + moments[j].decode(), score.decode())
+            meta['scores'].append(score)
+
+        return meta
+
+    @staticmethod
+    def _read_tally_index(group):
+        """Read the metadata for all tallies from the compact tally index.
+
+        Each array in the index is read with a single dataset read and the
+        moment orders are substituted into the scores with vectorized string
+        operations.
+
+        Parameters
+        ----------
+        group : h5py.Group
+            HDF5 group containing the tally metadata index
+
+        Returns
+        -------
+        list of dict
+            Tally metadata in the same order as the tally IDs. Each dictionary
+            has the same keys as returned by StatePoint._read_tally_group.
+
+        """
+
+        names = np.char.decode(group['names'].value)
+        estimators = np.char.decode(group['estimators'].value)
+        n_realizations = group['n_realizations'].value
+        n_filters = group['n_filters'].value
+        derivatives = group['derivatives'].value
+        n_nuclides = group['n_nuclides'].value
+        nuclides = np.char.strip(np.char.decode(group['nuclides'].value))
+        n_score_bins = group['n_score_bins'].value
+        scores = np.char.decode(group['score_bins'].value)
+        moments = np.char.decode(group['moment_orders'].value)
+
+        # Replace the generic moment suffix of moment scores (-n, -pn, -yn)
+        # with the explicit moment order, e.g. scatter-pn -> scatter-2
+        parts = np.char.rpartition(scores, '-')
+        suffix = parts[:, 2]
+        is_moment = (parts[:, 1] == '-') & ((suffix == 'n') |
+                                            (suffix == 'pn') |
+                                            (suffix == 'yn'))
+        scores = np.where(is_moment, np.char.add(
+            np.char.add(parts[:, 0], '-'), moments), scores)
+
+        # Split the flattened nuclide and score arrays by tally
+        nuclides = np.split(nuclides, np.cumsum(n_nuclides)[:-1])
+        scores = np.split(scores, np.cumsum(n_score_bins)[:-1])
+
+        metadata = []
+        for i in range(len(names)):
+            metadata.append({
+                'name': str(names[i]),
+                'estimator': str(estimators[i]),
+                'n_realizations': int(n_realizations[i]),
+                'derivative': (int(derivatives[i]) if derivatives[i] >= 0
+                               else None),
+                'n_filters': int(n_filters[i]),
+                'nuclides': nuclides[i].tolist(),
+                'scores': scores[i].tolist()})
+
+        return metadata
+
     @property
     def tallies_present(self):
         return self._f.attrs['tallies_present'] > 0
@@ -441,11 +672,11 @@ class StatePoint(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
+        tally data processing. The tally data will be stored as SciPy CSR
         matrices internally within each Tally object. All tally data access
         properties and methods will return data as a dense NumPy array.
 
@@ -459,6 +690,32 @@ class StatePoint(object):
             for tally_id in self.tallies:
                 self.tallies[tally_id].sparse = self.sparse
 
+    def close(self):
+        """Release this statepoint's handle on the underlying HDF5 file.
+
+        The file is closed once neither the statepoint nor any of its tallies
+        are reading from it. Tally results that have already been loaded remain
+        available after the statepoint is closed.
+
+        """
+        if self._f is not None:
+            _release_file(self._file_key)
+            self._f = None
+
+    def load_all_results(self):
+        """Read the results of every tally in a single pass over the file.
+
+        By default, tally results are read from the statepoint file the first
+        time they are accessed. This method instead reads all results datasets
+        up front using the statepoint's open file handle, which avoids repeated
+        dataset lookups when post-processing many tallies.
+
+        """
+        for tally_id, tally in self.tallies.items():
+            if not tally._results_read:
+                tally._set_results(
+                    self._f['tallies/tally {}/results'.format(tally_id)])
+
     def add_volume_information(self, volume_calc):
         """Add volume information to the geometry within the file
 
@@ -477,7 +734,14 @@ class StatePoint(object):
         """Finds and returns a Tally object with certain properties.
 
         This routine searches the list of Tallies and returns the first Tally
-        found which satisfies all of the input parameters.
+        found which satisfies all of the input parameters. Secondary indexes of
+        the tallies by name, estimator, score, nuclide and filter are used to
+        narrow the search, so only a few tallies are checked for each query.
+        The indexes are rebuilt after tallies are added to or removed from
+        :attr:`StatePoint.tallies`, after the name, estimator, filters,
+        nuclides or scores of a tally are assigned or modified in place, and
+        after the bins of a filter are assigned. Changes to the elements of
+        the bins array of a filter are not detected.
 
         NOTE: If any of the "exact" parameters are False (default), the input
         parameters do not need to match the complete Tally specification and
@@ -527,8 +791,10 @@ class StatePoint(object):
 
         tally = None
 
-        # Iterate over all tallies to find the appropriate one
-        for test_tally in self.tallies.values():
+        # Iterate over the tallies that the indexes could not rule out to find
+        # the appropriate one
+        for test_tally in self._tally_candidates(scores, filters, nuclides,
+                                                 name, id, estimator):
 
             # Determine if Tally has queried name
             if name and name != test_tally.name:
@@ -607,6 +873,164 @@ class StatePoint(object):
 
         return tally
 
+    def get_tallies(self, queries):
+        """Finds and returns Tally objects for many queries at once.
+
+        This is a batched version of :meth:`StatePoint.get_tally`. All queries
+        are answered using the same secondary tally indexes, which makes it
+        efficient to look up large numbers of tallies, e.g., when building
+        multi-group cross section libraries.
+
+        Parameters
+        ----------
+        queries : Iterable of dict
+            Each query is a dictionary of keyword arguments accepted by
+            :meth:`StatePoint.get_tally`, e.g. ``{'scores': ['flux'],
+            'filters': [cell_filter]}``.
+
+        Returns
+        -------
+        list of openmc.Tally
+            The first tally matching each query, in the order of the queries
+
+        Raises
+        ------
+        LookupError
+            If a Tally meeting all of the parameters of a query cannot be found
+            in the statepoint.
+
+        """
+
+        return [self.get_tally(**query) for query in queries]
+
+    @staticmethod
+    def _filter_index_keys(tally_filter, query=False):
+        """Return the keys under which a filter is stored in the tally index.
+
+        Filters whose bins must match exactly (IDs, mesh IDs and distribcell
+        cells) are keyed by their type and each of their bins, so that a query
+        with a subset of the bins can be answered by intersecting the tallies
+        stored under each bin. Real-valued filters match filters with the same
+        number of bins that are equal within the tolerance of
+        :func:`numpy.allclose`, so they are keyed by their type, number of
+        bins, and the position and rounded value of each bin. Bins within the
+        tolerance of a rounding boundary are stored under the values on both
+        sides of it. All filters are also keyed by type alone.
+
+        Parameters
+        ----------
+        tally_filter : openmc.Filter
+            Filter of a tally or of a query
+        query : bool
+            Whether the filter is part of a query rather than of a tally
+
+        Returns
+        -------
+        list of tuple
+            Keys of the filter
+
+        """
+
+        filter_type = type(tally_filter)
+        keys = [(filter_type,)]
+        if isinstance(tally_filter, (openmc.IntegralFilter,
+                                     openmc.DistribcellFilter,
+                                     openmc.MeshFilter)):
+            keys.extend((filter_type, b) for b in tally_filter.bins)
+        elif isinstance(tally_filter, openmc.RealFilter):
+            n = len(tally_filter.bins)
+            for i, value in enumerate(tally_filter.bins):
+                if query:
+                    rounded = {_real_bin_key(value)}
+                else:
+                    tolerance = 2e-8 + 2e-5*abs(value)
+                    rounded = {_real_bin_key(value - tolerance),
+                               _real_bin_key(value + tolerance)}
+                keys.extend((filter_type, n, i, r) for r in rounded)
+        return keys
+
+    def _build_tally_index(self):
+        """Build secondary indexes of the tallies by name, estimator, score,
+        nuclide and filter.
+
+        The indexes are rebuilt once the tallies dictionary is modified or a
+        tally's name, estimator, filters, nuclides or scores, or the bins of
+        its filters, are changed. The dictionary and each indexed tally and
+        filter share a version counter that is incremented on modification.
+
+        """
+
+        state = self._tallies._state
+        index = {'name': defaultdict(set), 'estimator': defaultdict(set),
+                 'score': defaultdict(set), 'nuclide': defaultdict(set),
+                 'filter': defaultdict(set), 'order': {},
+                 'version': state['version']}
+
+        for i, (tally_id, tally) in enumerate(self._tallies.items()):
+            tally._index_state = state
+            index['order'][tally_id] = i
+            index['name'][tally.name].add(tally_id)
+            index['estimator'][tally.estimator].add(tally_id)
+            for score in tally.scores:
+                index['score'][score].add(tally_id)
+            for nuclide in tally.nuclides:
+                index['nuclide'][getattr(nuclide, 'name', nuclide)].add(
+                    tally_id)
+            for tally_filter in tally.filters:
+                tally_filter._index_state = state
+                for key in self._filter_index_keys(tally_filter):
+                    index['filter'][key].add(tally_id)
+
+        self._tally_index = index
+
+    def _tally_candidates(self, scores, filters, nuclides, name, id,
+                          estimator):
+        """Return the tallies which may match a query to get_tally.
+
+        The candidates are found by intersecting the sets of tally IDs stored
+        in the secondary indexes for each parameter of the query. Since filter
+        subsets and the "exact" parameters are not fully resolved by the
+        indexes, each candidate still needs to be checked against the query.
+
+        """
+
+        tallies = self.tallies
+        index = self._tally_index
+        if index is None or index['version'] != tallies._state['version']:
+            self._build_tally_index()
+            index = self._tally_index
+
+        # Collect the sets of tally IDs matching each queried parameter
+        matches = []
+        if id:
+            matches.append({id} if id in tallies else set())
+        if name:
+            matches.append(index['name'].get(name, set()))
+        if estimator:
+            matches.append(index['estimator'].get(estimator, set()))
+        for score in scores:
+            matches.append(index['score'].get(score, set()))
+        for nuclide in nuclides:
+            matches.append(index['nuclide'].get(
+                getattr(nuclide, 'name', nuclide), set()))
+        for tally_filter in filters:
+            for key in self._filter_index_keys(tally_filter, query=True):
+                matches.append(index['filter'].get(key, set()))
+
+        if not matches:
+            return list(tallies.values())
+
+        # Intersect the smallest sets first
+        matches.sort(key=len)
+        candidates = set(matches[0])
+        for ids in matches[1:]:
+            if not candidates:
+                break
+            candidates &= ids
+
+        return [tallies[i] for i in sorted(candidates,
+                                           key=index['order'].get)]
+
     def link_with_summary(self, summary):
         """Links Tallies and Filters with Summary model information.
 
@@ -652,3 +1076,351 @@ class StatePoint(object):
                     tally_filter.distribcell_paths = cell.distribcell_paths
 
         self._summary = summary
+
+
+def _combined_keff(n, sums, sums_sq, k_col_abs, k_col_tra, k_abs_tra):
+    """Combine the collision, absorption and track-length estimates of
+    k-effective as in calculate_combined_keff() in src/eigenvalue.F90.
+
+    Parameters
+    ----------
+    n : int
+        Number of realizations
+    sums, sums_sq : numpy.ndarray
+        Sums and sums of squares of the collision, absorption and
+        track-length estimates over all realizations
+    k_col_abs, k_col_tra, k_abs_tra : float
+        Sums over all realizations of the products of pairs of estimates
+
+    Returns
+    -------
+    numpy.ndarray
+        Mean and standard deviation of the combined estimate. Both are NaN if
+        there are fewer than four realizations.
+
+    """
+
+    if n <= 3:
+        return np.array([np.nan, np.nan])
+
+    # Estimates of k-effective and their sample covariance matrix
+    kv = np.asarray(sums, dtype=float) / n
+    cov = np.empty((3, 3))
+    cov[np.diag_indices(3)] = (np.asarray(sums_sq) - n*kv*kv) / (n - 1)
+    cov[0, 1] = cov[1, 0] = (k_col_abs - n*kv[0]*kv[1]) / (n - 1)
+    cov[0, 2] = cov[2, 0] = (k_col_tra - n*kv[0]*kv[2]) / (n - 1)
+    cov[1, 2] = cov[2, 1] = (k_abs_tra - n*kv[1]*kv[2]) / (n - 1)
+
+    # If two estimators are the same, only the other two are combined
+    rel_precision = 1.e-5
+    pair = None
+    for a, b, pair_if_same in ((0, 1, (0, 2)), (0, 2, (0, 1)),
+                               (1, 2, (0, 1))):
+        if (abs(kv[a] - kv[b]) / kv[a] < rel_precision and
+                abs(cov[a, a] - cov[b, b]) / cov[a, a] < rel_precision):
+            pair = pair_if_same
+            break
+
+    if pair is None:
+        # Combine all three estimators as derived by Urbatsch
+        g = 0.
+        S = np.zeros(3)
+        k = 0.
+        for l, (i, j, m) in enumerate(((0, 1, 2), (1, 2, 0), (2, 0, 1))):
+            f = (cov[j, j]*(cov[m, m] - cov[i, m]) - cov[m, m]*cov[i, j] +
+                 cov[j, m]*(cov[i, j] + cov[i, m] - cov[j, m]))
+            S[0] += f*cov[0, l]
+            S[1] += (cov[j, j] + cov[m, m] - 2*cov[j, m])*kv[l]*kv[l]
+            S[2] += (cov[m, m] + cov[i, j] - cov[j, m] - cov[i, m])*kv[l]*kv[j]
+            k += f*kv[l]
+            g += f
+        S *= n - 1
+        S[0] *= (n - 1)**2
+        k /= g
+        g *= (n - 1)**2
+        std_dev = np.sqrt(S[0] / (g*n*(n - 3)) * (1 + n*(S[1] - 2*S[2])/g))
+    else:
+        # Combine two estimators
+        i, j = pair
+        f = kv[i] - kv[j]
+        g = cov[i, i] + cov[j, j] - 2*cov[i, j]
+        k = kv[i] - (cov[i, i] - cov[i, j]) / g * f
+        std_dev = np.sqrt((cov[i, i]*cov[j, j] - cov[i, j]**2) *
+                          (g + n*f*f) / (n*(n - 2)*g*g))
+
+    return np.array([k, std_dev])
+
+
+def _sum_statepoint_datasets(args):
+    """Sum a slice of a dataset over several statepoint files.
+
+    This function is executed by the worker processes of a
+    :class:`StatePointMerger`.
+
+    Parameters
+    ----------
+    args : tuple
+        Tuple of the statepoint filenames, the name of the dataset, and the
+        first and last (exclusive) index of the slice along the first axis
+
+    Returns
+    -------
+    numpy.ndarray
+        Sum of the slice over all files
+
+    """
+
+    filenames, name, start, stop = args
+
+    total = None
+    for filename in filenames:
+        with h5py.File(filename, 'r') as f:
+            data = f[name][start:stop]
+        if total is None:
+            total = data
+        else:
+            total += data
+    return total
+
+
+class StatePointMerger(object):
+    """Combine the tally results of independent simulations.
+
+    Statepoints from simulations of the same model that differ only in their
+    random number seed can be merged into a single statepoint. The sums and
+    sums of squares of each tally and of the global tallies are added together
+    along with the number of realizations, so that means and uncertainties
+    computed from the merged statepoint are those of one simulation with all
+    of the realizations. Tally results are streamed through memory a slice of
+    filter bins at a time and each slice is read from the files in parallel by
+    a pool of worker processes.
+
+    For eigenvalue calculations, the sums of products of the estimates of
+    k-effective are also added and the combined estimate of k-effective is
+    recomputed from the merged sums. Since the generations of the simulations
+    do not form a single history, k-effective and the Shannon entropy for
+    each generation and the CMFD data of each batch are not written to the
+    merged statepoint, and the corresponding :class:`StatePoint` attributes
+    are None. All other datasets, e.g. the source bank, are copied from the
+    first statepoint.
+
+    Parameters
+    ----------
+    filenames : Iterable of str
+        Paths to the statepoint files to merge
+    chunk_size : int, optional
+        Maximum number of filter bins read from each file at a time. Defaults
+        to 10000.
+    processes : int or None, optional
+        Number of worker processes used to read the files. If None, the number
+        of CPUs is used. If 1, the files are read in the calling process.
+
+    Attributes
+    ----------
+    filenames : list of str
+        Paths to the statepoint files to merge
+    chunk_size : int
+        Maximum number of filter bins read from each file at a time
+    processes : int or None
+        Number of worker processes used to read the files
+    n_realizations : int
+        Total number of realizations across all statepoints
+    tally_ids : numpy.ndarray
+        IDs of the tallies in the statepoints
+
+    Raises
+    ------
+    ValueError
+        If the statepoints do not contain the same tallies
+
+    """
+
+    def __init__(self, filenames, chunk_size=10000, processes=None):
+        self.filenames = filenames
+        self.chunk_size = chunk_size
+        self.processes = processes
+
+        self._n_realizations = 0
+        self._tally_realizations = {}
+        self._k_products = np.zeros(3)
+        self._shapes = None
+        self._tally_ids = None
+
+        # Make sure each statepoint has the same tallies as the first one
+        for filename in self.filenames:
+            with h5py.File(filename, 'r') as f:
+                cv.check_filetype_version(f, 'statepoint', _VERSION_STATEPOINT)
+                self._n_realizations += f['n_realizations'].value
+                if 'k_col_abs' in f:
+                    self._k_products += [f[name].value for name in
+                                         _K_PRODUCTS]
+
+                tallies_group = f.get('tallies')
+                if tallies_group is not None and \
+                   tallies_group.attrs.get('n_tallies', 0) > 0:
+                    tally_ids = tallies_group.attrs['ids']
+                else:
+                    tally_ids = np.array([], dtype=int)
+
+                shapes = {}
+                for tally_id in tally_ids:
+                    group = f['tallies/tally {}'.format(tally_id)]
+                    shapes[tally_id] = group['results'].shape
+                    self._tally_realizations[tally_id] = \
+                        self._tally_realizations.get(tally_id, 0) + \
+                        group['n_realizations'].value
+
+            if self._shapes is None:
+                self._tally_ids = tally_ids
+                self._shapes = shapes
+            elif shapes != self._shapes:
+                msg = 'Unable to merge statepoint "{0}" since its tallies ' \
+                      'differ from those in "{1}".'.format(
+                          filename, self.filenames[0])
+                raise ValueError(msg)
+
+    @property
+    def filenames(self):
+        return self._filenames
+
+    @property
+    def chunk_size(self):
+        return self._chunk_size
+
+    @property
+    def processes(self):
+        return self._processes
+
+    @property
+    def n_realizations(self):
+        return self._n_realizations
+
+    @property
+    def tally_ids(self):
+        return self._tally_ids
+
+    @filenames.setter
+    def filenames(self, filenames):
+        cv.check_type('statepoint filenames', filenames, Iterable,
+                      string_types)
+        filenames = list(filenames)
+        if len(filenames) == 0:
+            raise ValueError('At least one statepoint is needed for merging.')
+        self._filenames = filenames
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size):
+        cv.check_type('chunk size', chunk_size, Integral)
+        cv.check_greater_than('chunk size', chunk_size, 0)
+        self._chunk_size = chunk_size
+
+    @processes.setter
+    def processes(self, processes):
+        if processes is not None:
+            cv.check_type('number of processes', processes, Integral)
+            cv.check_greater_than('number of processes', processes, 0)
+        self._processes = processes
+
+    def _sum_dataset(self, name, shape, pool, n_groups):
+        """Yield slices of a dataset summed over all statepoints.
+
+        Parameters
+        ----------
+        name : str
+            Name of the dataset in the statepoint files
+        shape : tuple of int
+            Shape of the dataset
+        pool : multiprocessing.Pool or None
+            Pool of worker processes used to read the files
+        n_groups : int
+            Number of groups of files that are read concurrently
+
+        Yields
+        ------
+        start : int
+            First index of the slice along the first axis
+        data : numpy.ndarray
+            Sum of the slice over all statepoints
+
+        """
+
+        # Divide the files among the worker processes, each of which returns
+        # the partial sum over its files
+        groups = [self.filenames[i::n_groups] for i in range(n_groups)]
+
+        for start in range(0, shape[0], self.chunk_size):
+            stop = min(start + self.chunk_size, shape[0])
+            args = [(group, name, start, stop) for group in groups]
+            if pool is None:
+                partial_sums = [_sum_statepoint_datasets(a) for a in args]
+            else:
+                partial_sums = pool.map(_sum_statepoint_datasets, args)
+            yield start, sum(partial_sums[1:], partial_sums[0])
+
+    def merge(self, path='statepoint.merged.h5'):
+        """Write a statepoint containing the combined results.
+
+        Parameters
+        ----------
+        path : str
+            Path of the merged statepoint file
+
+        """
+
+        cv.check_type('merged statepoint path', path, string_types)
+
+        # Start from a copy of the first statepoint so that the merged file
+        # keeps its metadata and dataset layout
+        shutil.copyfile(self.filenames[0], path)
+
+        processes = self.processes or multiprocessing.cpu_count()
+        n_groups = min(len(self.filenames), processes)
+        pool = multiprocessing.Pool(n_groups) if n_groups > 1 else None
+
+        try:
+            with h5py.File(path, 'r+') as f:
+                f['n_realizations'][()] = self.n_realizations
+
+                # Add the sums and sums of squares of the global tallies
+                if 'global_tallies' in f:
+                    dset = f['global_tallies']
+                    for start, data in self._sum_dataset(
+                            'global_tallies', dset.shape, pool, n_groups):
+                        dset[start:start + data.shape[0], 1:3] = data[:, 1:3]
+
+                # Recompute the combined estimate of k-effective from the
+                # merged sums. The histories of each generation and batch
+                # belong to the individual simulations and are removed.
+                if 'k_col_abs' in f:
+                    for name, value in zip(_K_PRODUCTS, self._k_products):
+                        f[name][()] = value
+                    global_tallies = f['global_tallies'].value
+                    f['k_combined'][...] = _combined_keff(
+                        self.n_realizations, global_tallies[:3, 1],
+                        global_tallies[:3, 2], *self._k_products)
+                    for name in ('k_generation', 'entropy', 'cmfd'):
+                        if name in f:
+                            del f[name]
+                    f.attrs['cmfd_on'] = 0
+
+                # Stream the tally results through memory slice by slice
+                for tally_id in self.tally_ids:
+                    group = f['tallies/tally {}'.format(tally_id)]
+                    group['n_realizations'][()] = \
+                        self._tally_realizations[tally_id]
+
+                    dset = group['results']
+                    name = dset.name
+                    for start, data in self._sum_dataset(
+                            name, dset.shape, pool, n_groups):
+                        dset[start:start + data.shape[0]] = data
+
+                # Update the realizations in the tally metadata index
+                if 'tallies/index' in f:
+                    f['tallies/index/n_realizations'][...] = \
+                        [self._tally_realizations[i] for i in self.tally_ids]
+
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
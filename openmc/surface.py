@@ -8,7 +8,7 @@ from six import add_metaclass, string_types
 import numpy as np
 
 from openmc.checkvalue import check_type, check_value, check_greater_than
-from openmc.region import Region, Intersection, Union
+from openmc.region import Region, Intersection, Union, _Observable
 
 
 # A static variable for auto-generated Surface IDs
@@ -23,7 +23,7 @@ def reset_auto_surface_id():
     AUTO_SURFACE_ID = 10000
 
 
-class Surface(object):
+class Surface(_Observable):
     """An implicit surface with an associated boundary condition.
 
     An implicit surface is defined as the set of zeros of a function of the
@@ -351,21 +351,25 @@ class Plane(Surface):
     def a(self, A):
         check_type('A coefficient', A, Real)
         self._coefficients['A'] = A
+        self._notify()
 
     @b.setter
     def b(self, B):
         check_type('B coefficient', B, Real)
         self._coefficients['B'] = B
+        self._notify()
 
     @c.setter
     def c(self, C):
         check_type('C coefficient', C, Real)
         self._coefficients['C'] = C
+        self._notify()
 
     @d.setter
     def d(self, D):
         check_type('D coefficient', D, Real)
         self._coefficients['D'] = D
+        self._notify()
 
     @periodic_surface.setter
     def periodic_surface(self, periodic_surface):
@@ -465,6 +469,7 @@ class XPlane(Plane):
     def x0(self, x0):
         check_type('x0 coefficient', x0, Real)
         self._coefficients['x0'] = x0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -571,6 +576,7 @@ class YPlane(Plane):
     def y0(self, y0):
         check_type('y0 coefficient', y0, Real)
         self._coefficients['y0'] = y0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -677,6 +683,7 @@ class ZPlane(Plane):
     def z0(self, z0):
         check_type('z0 coefficient', z0, Real)
         self._coefficients['z0'] = z0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -778,6 +785,7 @@ class Cylinder(Surface):
     def r(self, R):
         check_type('R coefficient', R, Real)
         self._coefficients['R'] = R
+        self._notify()
 
 
 class XCylinder(Cylinder):
@@ -844,11 +852,13 @@ class XCylinder(Cylinder):
     def y0(self, y0):
         check_type('y0 coefficient', y0, Real)
         self._coefficients['y0'] = y0
+        self._notify()
 
     @z0.setter
     def z0(self, z0):
         check_type('z0 coefficient', z0, Real)
         self._coefficients['z0'] = z0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -966,11 +976,13 @@ class YCylinder(Cylinder):
     def x0(self, x0):
         check_type('x0 coefficient', x0, Real)
         self._coefficients['x0'] = x0
+        self._notify()
 
     @z0.setter
     def z0(self, z0):
         check_type('z0 coefficient', z0, Real)
         self._coefficients['z0'] = z0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -1088,11 +1100,13 @@ class ZCylinder(Cylinder):
     def x0(self, x0):
         check_type('x0 coefficient', x0, Real)
         self._coefficients['x0'] = x0
+        self._notify()
 
     @y0.setter
     def y0(self, y0):
         check_type('y0 coefficient', y0, Real)
         self._coefficients['y0'] = y0
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -1224,21 +1238,25 @@ class Sphere(Surface):
     def x0(self, x0):
         check_type('x0 coefficient', x0, Real)
         self._coefficients['x0'] = x0
+        self._notify()
 
     @y0.setter
     def y0(self, y0):
         check_type('y0 coefficient', y0, Real)
         self._coefficients['y0'] = y0
+        self._notify()
 
     @z0.setter
     def z0(self, z0):
         check_type('z0 coefficient', z0, Real)
         self._coefficients['z0'] = z0
+        self._notify()
 
     @r.setter
     def r(self, R):
         check_type('R coefficient', R, Real)
         self._coefficients['R'] = R
+        self._notify()
 
     def bounding_box(self, side):
         """Determine an axis-aligned bounding box.
@@ -1370,21 +1388,25 @@ class Cone(Surface):
     def x0(self, x0):
         check_type('x0 coefficient', x0, Real)
         self._coefficients['x0'] = x0
+        self._notify()
 
     @y0.setter
     def y0(self, y0):
         check_type('y0 coefficient', y0, Real)
         self._coefficients['y0'] = y0
+        self._notify()
 
     @z0.setter
     def z0(self, z0):
         check_type('z0 coefficient', z0, Real)
         self._coefficients['z0'] = z0
+        self._notify()
 
     @r2.setter
     def r2(self, R2):
         check_type('R^2 coefficient', R2, Real)
         self._coefficients['R2'] = R2
+        self._notify()
 
 
 class XCone(Cone):
@@ -1713,51 +1735,61 @@ class Quadric(Surface):
     def a(self, a):
         check_type('a coefficient', a, Real)
         self._coefficients['a'] = a
+        self._notify()
 
     @b.setter
     def b(self, b):
         check_type('b coefficient', b, Real)
         self._coefficients['b'] = b
+        self._notify()
 
     @c.setter
     def c(self, c):
         check_type('c coefficient', c, Real)
         self._coefficients['c'] = c
+        self._notify()
 
     @d.setter
     def d(self, d):
         check_type('d coefficient', d, Real)
         self._coefficients['d'] = d
+        self._notify()
 
     @e.setter
     def e(self, e):
         check_type('e coefficient', e, Real)
         self._coefficients['e'] = e
+        self._notify()
 
     @f.setter
     def f(self, f):
         check_type('f coefficient', f, Real)
         self._coefficients['f'] = f
+        self._notify()
 
     @g.setter
     def g(self, g):
         check_type('g coefficient', g, Real)
         self._coefficients['g'] = g
+        self._notify()
 
     @h.setter
     def h(self, h):
         check_type('h coefficient', h, Real)
         self._coefficients['h'] = h
+        self._notify()
 
     @j.setter
     def j(self, j):
         check_type('j coefficient', j, Real)
         self._coefficients['j'] = j
+        self._notify()
 
     @k.setter
     def k(self, k):
         check_type('k coefficient', k, Real)
         self._coefficients['k'] = k
+        self._notify()
 
     def evaluate(self, point):
         """Evaluate the surface equation at a given point.
@@ -1855,6 +1887,12 @@ class Halfspace(Region):
         val = self.surface.evaluate(point)
         return val >= 0. if self.side == '+' else val < 0.
 
+    def _compile(self, program):
+        program._add_surface(self.surface, self.side)
+
+    def _children(self):
+        return (self.surface,)
+
     @property
     def surface(self):
         return self._surface
@@ -1863,6 +1901,7 @@ class Halfspace(Region):
     def surface(self, surface):
         check_type('surface', surface, Surface)
         self._surface = surface
+        self._changed()
 
     @property
     def side(self):
@@ -1872,6 +1911,7 @@ class Halfspace(Region):
     def side(self, side):
         check_value('side', side, ('+', '-'))
         self._side = side
+        self._changed()
 
     @property
     def bounding_box(self):
@@ -1,6 +1,6 @@
 from __future__ import division
 
-from collections import Iterable, MutableSequence
+from collections import Iterable, MutableSequence, OrderedDict
 import copy
 from functools import partial
 import os
@@ -40,6 +40,10 @@ _FILTER_CLASSES = (openmc.Filter, openmc.CrossFilter, openmc.AggregateFilter)
 # Valid types of estimators
 ESTIMATOR_TYPES = ['tracklength', 'collision', 'analog']
 
+# Number of values of a results dataset read at a time when the results of a
+# sparse tally are converted to sparse matrices
+_SPARSE_READ_SIZE = 2**20
+
 
 def reset_auto_tally_id():
     """Reset counter for auto-generated tally IDs."""
@@ -47,6 +51,345 @@ def reset_auto_tally_id():
     AUTO_TALLY_ID = 10000
 
 
+def _sparse_sum(data, dims, axis, indices, columns=False):
+    """Sum sparse tally data over some of the indices along one axis of its
+    rows or columns.
+
+    Only the stored entries of the data are visited, so the cost of the sum
+    is proportional to the number of nonzero bins.
+
+    Parameters
+    ----------
+    data : scipy.sparse.spmatrix
+        Tally data with one row per filter bin and one column per nuclide and
+        score
+    dims : Iterable of int
+        Shape in C order of the rows, or of the columns if `columns` is True
+    axis : int
+        Axis to sum over
+    indices : Iterable of int
+        Indices along the axis to include in the sum. Repeated indices are
+        counted once per occurrence.
+    columns : bool
+        Whether to sum over the columns rather than the rows
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Summed data, whose rows or columns have the same shape as before
+        except that the axis has a length of one
+
+    """
+
+    import scipy.sparse as sps
+
+    dims = tuple(dims)
+    inner = int(np.prod(dims[axis+1:]))
+    weights = np.bincount(np.asarray(indices, dtype=int),
+                          minlength=dims[axis])
+
+    # Weight each entry by the number of times its index is summed and map
+    # it to the same position with the summed axis removed
+    data = data.tocoo()
+    flat = data.col if columns else data.row
+    weight = weights[(flat // inner) % dims[axis]]
+    summed = (flat // (inner*dims[axis]))*inner + flat % inner
+    nonzero = weight > 0
+    values = data.data[nonzero]*weight[nonzero]
+
+    # Duplicate entries are added together when the matrix is built
+    size = int(np.prod(dims)) // dims[axis]
+    if columns:
+        return sps.csr_matrix((values, (data.row[nonzero], summed[nonzero])),
+                              shape=(data.shape[0], size))
+    else:
+        return sps.csr_matrix((values, (summed[nonzero], data.col[nonzero])),
+                              shape=(size, data.shape[1]))
+
+
+def _binary_op(binary_op, self_mean, self_std_dev, other_mean,
+               other_std_dev):
+    """Propagate the mean and standard deviation of two aligned tally operands
+    through a binary operation.
+
+    Parameters
+    ----------
+    binary_op : {'+', '-', '*', '/', '^'}
+        The binary operation
+    self_mean, self_std_dev : numpy.ndarray
+        Mean and standard deviation of the left hand side operand
+    other_mean, other_std_dev : numpy.ndarray
+        Mean and standard deviation of the right hand side operand
+
+    Returns
+    -------
+    mean : numpy.ndarray
+        Mean of the result with any infs and nans converted to zero
+    std_dev : numpy.ndarray
+        Standard deviation of the result with any infs and nans converted to
+        zero
+
+    """
+
+    if binary_op == '+':
+        mean = self_mean + other_mean
+        std_dev = np.sqrt(self_std_dev**2 + other_std_dev**2)
+    elif binary_op == '-':
+        mean = self_mean - other_mean
+        std_dev = np.sqrt(self_std_dev**2 + other_std_dev**2)
+    elif binary_op == '*':
+        self_rel_err = self_std_dev / self_mean
+        other_rel_err = other_std_dev / other_mean
+        mean = self_mean * other_mean
+        std_dev = np.abs(mean) * np.sqrt(self_rel_err**2 + other_rel_err**2)
+    elif binary_op == '/':
+        self_rel_err = self_std_dev / self_mean
+        other_rel_err = other_std_dev / other_mean
+        mean = self_mean / other_mean
+        std_dev = np.abs(mean) * np.sqrt(self_rel_err**2 + other_rel_err**2)
+    elif binary_op == '^':
+        mean_ratio = other_mean / self_mean
+        first_term = mean_ratio * self_std_dev
+        second_term = np.log(self_mean) * other_std_dev
+        mean = self_mean ** other_mean
+        std_dev = np.abs(mean) * np.sqrt(first_term**2 + second_term**2)
+
+    # Convert any infs and nans to zero
+    mean[np.isinf(mean)] = 0
+    mean = np.nan_to_num(mean)
+    std_dev[np.isinf(std_dev)] = 0
+    std_dev = np.nan_to_num(std_dev)
+
+    return mean, std_dev
+
+
+def _results_value(data, num_realizations, value):
+    """Compute tally values from rows of a statepoint results array.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Results with the sum and sum of squares along the last axis
+    num_realizations : int
+        Number of realizations used to compute the mean and standard deviation
+    value : {'sum', 'sum_sq', 'mean', 'std_dev', 'rel_err'}
+        Type of value to return
+
+    Returns
+    -------
+    numpy.ndarray
+        Values with the shape of the leading axes of the results
+
+    """
+
+    sum = data[..., 0]
+    sum_sq = data[..., 1]
+
+    if value == 'sum':
+        return sum
+    elif value == 'sum_sq':
+        return sum_sq
+
+    n = num_realizations
+    mean = sum / n
+    if value == 'mean':
+        return mean
+
+    nonzero = np.abs(mean) > 0
+    std_dev = np.zeros_like(mean)
+    std_dev[nonzero] = np.sqrt((sum_sq[nonzero]/n -
+                                mean[nonzero]**2)/(n - 1))
+    if value == 'std_dev':
+        return std_dev
+    else:
+        return std_dev / mean
+
+
+class _TallyList(cv.CheckedList):
+    """Checked list of the filters, nuclides or scores of a tally that
+    reports modifications to the tally.
+
+    Copies of the list are not attached to the tally.
+
+    Parameters
+    ----------
+    tally : openmc.Tally or None
+        Tally that the list belongs to
+    expected_type : type or Iterable of type
+        Type(s) which each element should be
+    name : str
+        Name of data being checked
+    items : Iterable, optional
+        Items to initialize the list with
+
+    """
+
+    def __init__(self, tally, expected_type, name, items=[]):
+        self._tally = None
+        super(_TallyList, self).__init__(expected_type, name, items)
+        self._tally = tally
+
+    def __copy__(self):
+        return cv.CheckedList(self.expected_type, self.name, self)
+
+    def __deepcopy__(self, memo):
+        # The copy belongs to the copy of the tally, if the tally is copied
+        tally = memo.get(id(self._tally))
+        return _TallyList(tally, self.expected_type, self.name,
+                          copy.deepcopy(list(self), memo))
+
+
+def _tally_list_mutator(name):
+    """Return a list method that notifies the tally after mutating."""
+    method = getattr(cv.CheckedList, name)
+
+    def mutate(self, *args):
+        result = method(self, *args)
+        # Items are added before the tally is set when unpickling
+        tally = getattr(self, '_tally', None)
+        if tally is not None:
+            tally._changed()
+        return result
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'reverse',
+              'sort', '__setitem__', '__delitem__', '__iadd__', '__imul__',
+              '__setslice__', '__delslice__', 'clear'):
+    if hasattr(list, _name):
+        setattr(_TallyList, _name, _tally_list_mutator(_name))
+
+
+class _LazyResults(object):
+    """Read-on-demand view of a tally's results in a statepoint file.
+
+    Values are looked up with a 3-tuple of index arrays for the filter,
+    nuclide and score axes (e.g., as returned by :func:`numpy.ix_`). Only the
+    requested filter bins are read from the tally's results dataset using an
+    HDF5 hyperslab selection. Rows that have been read are kept, so repeated
+    lookups of the same bins do not read the file again, and the full results
+    array is only held in memory once every filter bin has been requested.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the statepoint file
+    tally_id : int
+        Unique identifier for the tally
+    shape : 3-tuple of int
+        Shape of the tally data ordered as the number of filter bins, nuclide
+        bins and score bins
+    num_realizations : int
+        Number of realizations used to compute the mean and standard deviation
+
+    """
+
+    def __init__(self, filename, tally_id, shape, num_realizations):
+        self._filename = filename
+        self._tally_id = tally_id
+        self._num_realizations = num_realizations
+        self.shape = shape
+
+        # Sorted filter bins that have been read and their results
+        self._rows = np.empty(0, dtype=int)
+        self._data = np.empty((0, shape[1]*shape[2], 2))
+
+    def _read_rows(self, rows):
+        """Read rows of the results dataset that have not been read yet.
+
+        Parameters
+        ----------
+        rows : numpy.ndarray
+            Sorted, unique filter bin indices
+
+        """
+
+        missing = np.setdiff1d(rows, self._rows)
+        if missing.size == 0:
+            return
+
+        with openmc.statepoint._shared_file(self._filename) as f:
+            dataset = f['tallies/tally {0}/results'.format(self._tally_id)]
+            if missing[-1] - missing[0] + 1 == missing.size:
+                data = dataset[missing[0]:missing[-1] + 1]
+            elif dataset.chunks is not None:
+                data = self._read_chunked(dataset, missing)
+            else:
+                data = dataset[missing.tolist()]
+
+        # Merge the new rows into the sorted rows that were already read
+        all_rows = np.concatenate((self._rows, missing))
+        order = np.argsort(all_rows, kind='mergesort')
+        self._rows = all_rows[order]
+        self._data = np.concatenate((self._data, data))[order]
+
+    def get(self, indices, value='mean'):
+        """Return values of the tally for the requested bins.
+
+        Parameters
+        ----------
+        indices : 3-tuple of numpy.ndarray
+            Filter, nuclide and score indices to select
+        value : {'sum', 'sum_sq', 'mean', 'std_dev', 'rel_err'}
+            Type of value to return
+
+        Returns
+        -------
+        numpy.ndarray
+            A 3D array of the values indexed by the filter, nuclide and score
+            indices
+
+        """
+
+        filter_indices, nuclide_indices, score_indices = \
+            [np.ravel(index) for index in indices]
+
+        # HDF5 selections must be increasing and may not contain duplicates,
+        # so read the unique filter bins and map them back to requested order
+        rows = np.unique(filter_indices)
+        self._read_rows(rows)
+        positions = np.searchsorted(self._rows, filter_indices)
+
+        # Select the requested nuclide and score bins
+        data = np.reshape(self._data, (self._rows.size,) + self.shape[1:] +
+                          (2,))
+        data = data[np.ix_(positions, nuclide_indices, score_indices)]
+        return _results_value(data, self._num_realizations, value)
+
+    @staticmethod
+    def _read_chunked(dataset, rows):
+        """Read rows of a chunked results dataset one chunk at a time.
+
+        Each chunk touched by the selection is read exactly once with a
+        contiguous slice, which is much cheaper than a point selection when
+        the dataset is compressed or stored on a remote filesystem.
+
+        Parameters
+        ----------
+        dataset : h5py.Dataset
+            Chunked results dataset
+        rows : numpy.ndarray
+            Sorted, unique filter bin indices to read
+
+        Returns
+        -------
+        numpy.ndarray
+            Results for the requested rows
+
+        """
+
+        chunk_rows = dataset.chunks[0]
+        data = np.empty((rows.size,) + dataset.shape[1:], dtype=dataset.dtype)
+        for chunk in np.unique(rows // chunk_rows):
+            lo = chunk * chunk_rows
+            hi = min(lo + chunk_rows, dataset.shape[0])
+            start, stop = np.searchsorted(rows, [lo, hi])
+            block = dataset[lo:hi]
+            data[start:stop] = block[rows[start:stop] - lo]
+        return data
+
+
 class Tally(object):
     """A tally defined by a set of scores that are accumulated for a list of
     nuclides given a set of filters.
@@ -102,7 +445,7 @@ class Tally(object):
     derived : bool
         Whether or not the tally is derived from one or more other tallies
     sparse : bool
-        Whether or not the tally uses SciPy's LIL sparse matrix format for
+        Whether or not the tally uses SciPy's CSR sparse matrix format for
         compressed data storage
     derivative : openmc.TallyDerivative
         A material perturbation derivative to apply to all scores in the tally.
@@ -113,9 +456,9 @@ class Tally(object):
         # Initialize Tally class attributes
         self.id = tally_id
         self.name = name
-        self._filters = cv.CheckedList(_FILTER_CLASSES, 'tally filters')
-        self._nuclides = cv.CheckedList(_NUCLIDE_CLASSES, 'tally nuclides')
-        self._scores = cv.CheckedList(_SCORE_CLASSES, 'tally scores')
+        self._filters = _TallyList(self, _FILTER_CLASSES, 'tally filters')
+        self._nuclides = _TallyList(self, _NUCLIDE_CLASSES, 'tally nuclides')
+        self._scores = _TallyList(self, _SCORE_CLASSES, 'tally scores')
         self._estimator = None
         self._triggers = cv.CheckedList(openmc.Trigger, 'tally triggers')
         self._derivative = None
@@ -133,6 +476,10 @@ class Tally(object):
 
         self._sp_filename = None
         self._results_read = False
+        self._lazy_results = None
+
+        # Version of the StatePoint tally index that includes this tally
+        self._index_state = None
 
     def __eq__(self, other):
         if not isinstance(other, Tally):
@@ -277,103 +624,180 @@ class Tally(object):
         if not self._sp_filename or self.derived:
             return None
 
-        if not self._results_read:
-            # Open the HDF5 statepoint file
-            f = h5py.File(self._sp_filename, 'r')
-
-            # Extract Tally data from the file
-            data = f['tallies/tally {0}/results'.format(
-                self.id)].value
-            sum = data[:,:,0]
-            sum_sq = data[:,:,1]
+        self._read_results()
+        return self._to_dense(self._sum)
 
-            # Reshape the results arrays
-            sum = np.reshape(sum, self.shape)
-            sum_sq = np.reshape(sum_sq, self.shape)
+    def _read_results(self):
+        """Read the sum and sum of squares from the statepoint if they have not
+        been read yet"""
 
-            # Set the data for this Tally
-            self._sum = sum
-            self._sum_sq = sum_sq
+        if not self._results_read:
+            # Read the results using the statepoint's shared file handle
+            with openmc.statepoint._shared_file(self._sp_filename) as f:
+                self._set_results(
+                    f['tallies/tally {0}/results'.format(self.id)])
 
-            # Convert NumPy arrays to SciPy sparse LIL matrices
-            if self.sparse:
-                import scipy.sparse as sps
+    def _set_results(self, data):
+        """Set the sum and sum of squares from a statepoint results array
 
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
+        The results of sparse tallies are read and converted to sparse
+        matrices a block of filter bins at a time, so that the dense results
+        are never held in memory all at once.
 
-            # Indicate that Tally results have been read
-            self._results_read = True
+        Parameters
+        ----------
+        data : h5py.Dataset or numpy.ndarray
+            Results array for this tally in a statepoint file with shape
+            (num_filter_bins, num_nuclides*num_scores, 2)
 
-            # Close the HDF5 statepoint file
-            f.close()
+        """
 
+        # Set the data for this Tally. Sparse tallies are converted directly
+        # from the 2D layout of the results array, reading whole chunks of
+        # chunked datasets.
         if self.sparse:
-            return np.reshape(self._sum.toarray(), self.shape)
+            import scipy.sparse as sps
+
+            block_rows = max(1, _SPARSE_READ_SIZE // (2*data.shape[1]))
+            if getattr(data, 'chunks', None) is not None:
+                chunk_rows = data.chunks[0]
+                block_rows = max(1, block_rows // chunk_rows) * chunk_rows
+
+            sums = []
+            sums_sq = []
+            for start in range(0, data.shape[0], block_rows):
+                block = data[start:start + block_rows]
+                sums.append(self._to_sparse(block[:,:,0]))
+                sums_sq.append(self._to_sparse(block[:,:,1]))
+            self._sum = sps.vstack(sums, format='csr')
+            self._sum_sq = sps.vstack(sums_sq, format='csr')
         else:
-            return self._sum
+            if isinstance(data, h5py.Dataset):
+                data = data.value
+            self._sum = np.reshape(data[:,:,0], self.shape)
+            self._sum_sq = np.reshape(data[:,:,1], self.shape)
 
-    @property
-    def sum_sq(self):
-        if not self._sp_filename:
-            return None
+        # Indicate that Tally results have been read. Rows that were read on
+        # demand are no longer needed.
+        self._results_read = True
+        self._lazy_results = None
 
-        if not self._results_read:
-            # Force reading of sum and sum_sq
-            self.sum
+    def _to_sparse(self, data):
+        """Convert a tally data array to a SciPy CSR matrix with one row per
+        filter bin and one column per (nuclide, score) pair.
 
-        if self.sparse:
-            return np.reshape(self._sum_sq.toarray(), self.shape)
+        Parameters
+        ----------
+        data : numpy.ndarray or scipy.sparse.spmatrix
+            Tally data with filter bins along the first axis
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Tally data in compressed sparse row format
+
+        """
+
+        import scipy.sparse as sps
+
+        if sps.issparse(data):
+            return data.tocsr()
         else:
-            return self._sum_sq
+            data = np.asarray(data)
+            return sps.csr_matrix(np.reshape(data, (data.shape[0], -1)))
 
-    @property
-    def mean(self):
-        if self._mean is None:
-            if not self._sp_filename:
-                return None
+    def _to_dense(self, data):
+        """Convert a tally data array stored in sparse format to a dense
+        NumPy array with the tally's shape.
 
-            self._mean = self.sum / self.num_realizations
+        Parameters
+        ----------
+        data : numpy.ndarray or scipy.sparse.spmatrix or None
+            Tally data as stored in the tally
 
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                import scipy.sparse as sps
+        Returns
+        -------
+        numpy.ndarray or None
+            Tally data indexed by filter bin, nuclide bin and score
 
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
+        """
 
-        if self.sparse:
-            return np.reshape(self._mean.toarray(), self.shape)
+        if data is None or isinstance(data, np.ndarray):
+            return data
         else:
-            return self._mean
+            return np.reshape(data.toarray(), self.shape)
+
+    def _get_results(self, value):
+        """Return the stored mean, standard deviation, sum or sum of squares
+        for this tally without converting sparse data to dense arrays.
+
+        Parameters
+        ----------
+        value : {'mean', 'std_dev', 'sum', 'sum_sq'}
+            The type of data to return
+
+        Returns
+        -------
+        numpy.ndarray or scipy.sparse.csr_matrix or None
+            Tally data in the tally's storage format
+
+        """
+
+        if value in ('mean', 'std_dev'):
+            # Make sure the statistics have been computed
+            getattr(self, '_compute_' + value)()
+        elif self._sp_filename and not self.derived:
+            self._read_results()
+        return getattr(self, '_' + value)
 
     @property
-    def std_dev(self):
-        if self._std_dev is None:
-            if not self._sp_filename:
-                return None
+    def sum_sq(self):
+        if not self._sp_filename:
+            return None
 
-            n = self.num_realizations
-            nonzero = np.abs(self.mean) > 0
-            self._std_dev = np.zeros_like(self.mean)
-            self._std_dev[nonzero] = np.sqrt((self.sum_sq[nonzero]/n -
-                                              self.mean[nonzero]**2)/(n - 1))
+        if not self.derived:
+            self._read_results()
+        return self._to_dense(self._sum_sq)
 
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                import scipy.sparse as sps
+    @property
+    def mean(self):
+        self._compute_mean()
+        return self._to_dense(self._mean)
 
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
+    def _compute_mean(self):
+        if self._mean is None and self._sp_filename and not self.derived:
+            self._read_results()
+            self._mean = self._sum / self.num_realizations
 
-            self.with_batch_statistics = True
+    @property
+    def std_dev(self):
+        self._compute_std_dev()
+        return self._to_dense(self._std_dev)
+
+    def _compute_std_dev(self):
+        if self._std_dev is not None or not self._sp_filename or self.derived:
+            return
+
+        n = self.num_realizations
+        self._compute_mean()
 
         if self.sparse:
-            return np.reshape(self._std_dev.toarray(), self.shape)
+            import scipy.sparse as sps
+
+            # Only bins with a nonzero mean have a nonzero standard deviation
+            mean = self._mean.tocoo()
+            mean.eliminate_zeros()
+            sum_sq = np.asarray(self._sum_sq[mean.row, mean.col]).ravel()
+            std_dev = np.sqrt((sum_sq/n - mean.data**2)/(n - 1))
+            self._std_dev = sps.csr_matrix((std_dev, (mean.row, mean.col)),
+                                           shape=mean.shape)
         else:
-            return self._std_dev
+            nonzero = np.abs(self._mean) > 0
+            self._std_dev = np.zeros_like(self._mean)
+            self._std_dev[nonzero] = np.sqrt((self._sum_sq[nonzero]/n -
+                                              self._mean[nonzero]**2)/(n - 1))
+
+        self.with_batch_statistics = True
 
     @property
     def with_batch_statistics(self):
@@ -391,10 +815,18 @@ class Tally(object):
     def sparse(self):
         return self._sparse
 
+    def _changed(self):
+        """Mark the tally index of the StatePoint this tally belongs to as out
+        of date."""
+        state = getattr(self, '_index_state', None)
+        if state is not None:
+            state['version'] += 1
+
     @estimator.setter
     def estimator(self, estimator):
         cv.check_value('estimator', estimator, ESTIMATOR_TYPES)
         self._estimator = estimator
+        self._changed()
 
     @triggers.setter
     def triggers(self, triggers):
@@ -440,6 +872,7 @@ class Tally(object):
             self._name = name
         else:
             self._name = ''
+        self._changed()
 
     @derivative.setter
     def derivative(self, deriv):
@@ -459,7 +892,9 @@ class Tally(object):
                       'Python API'.format(f, self.id)
                 raise ValueError(msg)
 
-        self._filters = cv.CheckedList(_FILTER_CLASSES, 'tally filters', filters)
+        self._filters = _TallyList(self, _FILTER_CLASSES, 'tally filters',
+                                   filters)
+        self._changed()
 
     @nuclides.setter
     def nuclides(self, nuclides):
@@ -473,8 +908,9 @@ class Tally(object):
                       'Python API'.format(nuclide, self.id)
                 raise ValueError(msg)
 
-        self._nuclides = cv.CheckedList(_NUCLIDE_CLASSES, 'tally nuclides',
-                                        nuclides)
+        self._nuclides = _TallyList(self, _NUCLIDE_CLASSES, 'tally nuclides',
+                                    nuclides)
+        self._changed()
 
     @scores.setter
     def scores(self, scores):
@@ -492,7 +928,8 @@ class Tally(object):
             if isinstance(score, string_types):
                 scores[i] = score.strip()
 
-        self._scores = cv.CheckedList(_SCORE_CLASSES, 'tally scores', scores)
+        self._scores = _TallyList(self, _SCORE_CLASSES, 'tally scores', scores)
+        self._changed()
 
     def add_filter(self, new_filter):
         """Add a filter to the tally
@@ -587,56 +1024,48 @@ class Tally(object):
     @sum.setter
     def sum(self, sum):
         cv.check_type('sum', sum, Iterable)
-        self._sum = sum
+        self._sum = self._to_sparse(sum) if self.sparse else sum
 
     @sum_sq.setter
     def sum_sq(self, sum_sq):
         cv.check_type('sum_sq', sum_sq, Iterable)
-        self._sum_sq = sum_sq
+        self._sum_sq = self._to_sparse(sum_sq) if self.sparse else sum_sq
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
-        matrices internally within the Tally object. All tally data access
-        properties and methods will return data as a dense NumPy array.
+        tally data processing. The tally data will be stored as SciPy CSR
+        matrices internally within the Tally object with one row per filter bin
+        and one column per nuclide and score pair. Slicing, summation and
+        entrywise tally arithmetic between sparse tallies operate directly on
+        the sparse matrices. The data access properties return data as a dense
+        NumPy array.
 
         """
 
         cv.check_type('sparse', sparse, bool)
 
-        # Convert NumPy arrays to SciPy sparse LIL matrices
+        # Convert NumPy arrays to SciPy sparse CSR matrices
         if sparse and not self.sparse:
-            import scipy.sparse as sps
-
             if self._sum is not None:
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
+                self._sum = self._to_sparse(self._sum)
             if self._sum_sq is not None:
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
+                self._sum_sq = self._to_sparse(self._sum_sq)
             if self._mean is not None:
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
+                self._mean = self._to_sparse(self._mean)
             if self._std_dev is not None:
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
-
+                self._std_dev = self._to_sparse(self._std_dev)
             self._sparse = True
 
-        # Convert SciPy sparse LIL matrices to NumPy arrays
+        # Convert SciPy sparse CSR matrices to NumPy arrays
         elif not sparse and self.sparse:
-            if self._sum is not None:
-                self._sum = np.reshape(self._sum.toarray(), self.shape)
-            if self._sum_sq is not None:
-                self._sum_sq = np.reshape(self._sum_sq.toarray(), self.shape)
-            if self._mean is not None:
-                self._mean = np.reshape(self._mean.toarray(), self.shape)
-            if self._std_dev is not None:
-                self._std_dev = np.reshape(self._std_dev.toarray(), self.shape)
+            self._sum = self._to_dense(self._sum)
+            self._sum_sq = self._to_dense(self._sum_sq)
+            self._mean = self._to_dense(self._mean)
+            self._std_dev = self._to_dense(self._std_dev)
             self._sparse = False
 
     def remove_score(self, score):
@@ -1307,48 +1736,20 @@ class Tally(object):
                         user_filter = True
                         break
 
-                # If not a user-requested Filter, get all bins
-                if not user_filter:
-                    # Create list of 2- or 3-tuples tuples for mesh cell bins
-                    if isinstance(self_filter, openmc.MeshFilter):
-                        dimension = self_filter.mesh.dimension
-                        xyz = [range(1, x+1) for x in dimension]
-                        bins = list(itertools.product(*xyz))
-
-                    # Create list of 2-tuples for energy boundary bins
-                    elif isinstance(self_filter, (openmc.EnergyFilter,
-                        openmc.EnergyoutFilter, openmc.MuFilter,
-                        openmc.PolarFilter, openmc.AzimuthalFilter)):
-                        bins = []
-                        for k in range(self_filter.num_bins):
-                            bins.append((self_filter.bins[k], self_filter.bins[k+1]))
-
-                    # Create list of cell instance IDs for distribcell Filters
-                    elif isinstance(self_filter, openmc.DistribcellFilter):
-                        bins = [b for b in range(self_filter.num_bins)]
-
-                    # EnergyFunctionFilters don't have bins so just add a None
-                    elif isinstance(self_filter, openmc.EnergyFunctionFilter):
-                        bins = [None]
-
-                    # Create list of IDs for bins for all other filter types
-                    else:
-                        bins = self_filter.bins
-
-                # Initialize a NumPy array for the Filter bin indices
-                filter_indices.append(np.zeros(len(bins), dtype=np.int))
-
-                # Add indices for each bin in this Filter to the list
-                for j, bin in enumerate(bins):
-                    filter_index = self.get_filter_index(type(self_filter), bin)
-                    filter_indices[i][j] = filter_index
+                # Map all of the user-requested bins to indices at once
+                if user_filter:
+                    filter_indices.append(self_filter.get_bin_indices(bins))
 
-                # Account for stride in each of the previous filters
-                for indices in filter_indices[:i]:
-                    indices *= self_filter.num_bins
+                # If not a user-requested Filter, get all bins
+                else:
+                    filter_indices.append(np.arange(self_filter.num_bins))
 
-            # Apply outer product sum between all filter bin indices
-            filter_indices = list(map(sum, itertools.product(*filter_indices)))
+            # Apply strided outer product sum between all filter bin indices.
+            # The broadcasted indices are flattened in the same order as
+            # itertools.product over the filters' bins.
+            shape = tuple(f.num_bins for f in self.filters)
+            filter_indices = np.ravel_multi_index(np.ix_(*filter_indices),
+                                                  shape).ravel()
 
         # If user did not specify any specific Filters, use them all
         else:
@@ -1480,12 +1881,21 @@ class Tally(object):
 
         """
 
-        # Ensure that the tally has data
-        if (value == 'mean' and self.mean is None) or \
-           (value == 'std_dev' and self.std_dev is None) or \
-           (value == 'rel_err' and self.mean is None) or \
-           (value == 'sum' and self.sum is None) or \
-           (value == 'sum_sq' and self.sum_sq is None):
+        if value not in ('mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'):
+            msg = 'Unable to return results from Tally ID="{0}" since the ' \
+                  'the requested value "{1}" is not \'mean\', \'std_dev\', ' \
+                  '\'rel_err\', \'sum\', or \'sum_sq\''.format(self.id, value)
+            raise LookupError(msg)
+
+        # Results that have not been read yet are only checked once the
+        # requested bins are read from the statepoint file
+        lazy = self._sp_filename and not self.derived and \
+            not self._results_read
+
+        # Ensure that the tally has data. The stored results are checked so
+        # that sparse data is not converted to a dense array.
+        if not lazy and self._get_results(
+                'mean' if value == 'rel_err' else value) is None:
             msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
             raise ValueError(msg)
 
@@ -1494,11 +1904,60 @@ class Tally(object):
         nuclide_indices = self.get_nuclide_indices(nuclides)
         score_indices = self.get_score_indices(scores)
 
+        return self._get_values_by_index(value, filter_indices,
+                                         nuclide_indices, score_indices)
+
+    def _get_values_by_index(self, value, filter_indices, nuclide_indices,
+                             score_indices):
+        """Returns tallied values given arrays of filter, nuclide and score
+        bin indices.
+
+        Parameters
+        ----------
+        value : {'mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'}
+            The type of value to return
+        filter_indices : numpy.ndarray
+            Indices of the filter bins
+        nuclide_indices : numpy.ndarray
+            Indices of the nuclides
+        score_indices : numpy.ndarray
+            Indices of the scores
+
+        Returns
+        -------
+        numpy.ndarray
+            A 3D array of the Tally data indexed in the order of the filter,
+            nuclide and score indices
+
+        """
+
+        # If the results have not been read yet, only the requested bins are
+        # read from the statepoint file
+        lazy = self._sp_filename and not self.derived and \
+            not self._results_read
+
         # Construct outer product of all three index types with each other
         indices = np.ix_(filter_indices, nuclide_indices, score_indices)
 
         # Return the desired result from Tally
-        if value == 'mean':
+        if lazy:
+            if self._lazy_results is None:
+                self._lazy_results = _LazyResults(
+                    self._sp_filename, self.id, self.shape,
+                    self.num_realizations)
+            data = self._lazy_results.get(indices, value)
+        elif self.sparse:
+            # Only the requested bins of the sparse matrices are densified
+            shape = (len(filter_indices), len(nuclide_indices),
+                     len(score_indices))
+            bins = (filter_indices, nuclide_indices, score_indices)
+            if value == 'rel_err':
+                data = self._get_sparse_slice('std_dev', *bins).toarray() / \
+                    self._get_sparse_slice('mean', *bins).toarray()
+            else:
+                data = self._get_sparse_slice(value, *bins).toarray()
+            data = np.reshape(data, shape)
+        elif value == 'mean':
             data = self.mean[indices]
         elif value == 'std_dev':
             data = self.std_dev[indices]
@@ -1508,14 +1967,39 @@ class Tally(object):
             data = self.sum[indices]
         elif value == 'sum_sq':
             data = self.sum_sq[indices]
-        else:
-            msg = 'Unable to return results from Tally ID="{0}" since the ' \
-                  'the requested value "{1}" is not \'mean\', \'std_dev\', ' \
-                  '\'rel_err\', \'sum\', or \'sum_sq\''.format(self.id, value)
-            raise LookupError(msg)
 
         return data
 
+    def _get_sparse_slice(self, value, filter_indices, nuclide_indices,
+                          score_indices):
+        """Select bins from the sparse data of this tally.
+
+        Parameters
+        ----------
+        value : {'mean', 'std_dev', 'sum', 'sum_sq'}
+            The type of data to select
+        filter_indices : numpy.ndarray
+            Indices of the filter bins to select
+        nuclide_indices : numpy.ndarray
+            Indices of the nuclides to select
+        score_indices : numpy.ndarray
+            Indices of the scores to select
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Sparse matrix with one row per selected filter bin and one column
+            per selected (nuclide, score) pair
+
+        """
+
+        # Map each (nuclide, score) pair to a column of the sparse matrix
+        columns = np.add.outer(np.asarray(nuclide_indices) * self.num_scores,
+                               score_indices).ravel()
+
+        data = self._to_sparse(self._get_results(value))
+        return data[filter_indices, :][:, columns]
+
     def get_pandas_dataframe(self, filters=True, nuclides=True, scores=True,
                              derivative=True, distribcell_paths=True,
                              float_format='{:.2e}'):
@@ -1552,7 +2036,7 @@ class Tally(object):
         pandas.DataFrame
             A Pandas DataFrame with each column annotated by filter, nuclide and
             score bin information (if these parameters are True), and the mean
-            and standard deviation of the Tally's data.
+            and standard deviation of the Tally's data
 
         Raises
         ------
@@ -1564,7 +2048,9 @@ class Tally(object):
         """
 
         # Ensure that the tally has data
-        if self.mean is None or self.std_dev is None:
+        mean = self._get_results('mean')
+        std_dev = self._get_results('std_dev')
+        if mean is None or std_dev is None:
             msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
             raise KeyError(msg)
 
@@ -1573,7 +2059,7 @@ class Tally(object):
         df = pd.DataFrame()
 
         # Find the total length of the tally data array
-        data_size = self.mean.size
+        data_size = self.num_bins
 
         # Build DataFrame columns for filters if user requested them
         if filters:
@@ -1586,17 +2072,7 @@ class Tally(object):
 
         # Include DataFrame column for nuclides if user requested it
         if nuclides:
-            nuclides = []
-            column_name = 'nuclide'
-
-            for nuclide in self.nuclides:
-                if isinstance(nuclide, openmc.Nuclide):
-                    nuclides.append(nuclide.name)
-                elif isinstance(nuclide, openmc.AggregateNuclide):
-                    nuclides.append(nuclide.name)
-                    column_name = '{0}(nuclide)'.format(nuclide.aggregate_op)
-                else:
-                    nuclides.append(nuclide)
+            column_name, nuclides = self._get_nuclide_column()
 
             # Tile the nuclide bins into a DataFrame column
             nuclides = np.repeat(nuclides, len(self.scores))
@@ -1605,16 +2081,7 @@ class Tally(object):
 
         # Include column for scores if user requested it
         if scores:
-            scores = []
-            column_name = 'score'
-
-            for score in self.scores:
-                if isinstance(score, string_types + (openmc.CrossScore,)):
-                    scores.append(str(score))
-                elif isinstance(score, openmc.AggregateScore):
-                    scores.append(score.name)
-                    column_name = '{0}(score)'.format(score.aggregate_op)
-
+            column_name, scores = self._get_score_column()
             tile_factor = data_size / len(self.scores)
             df[column_name] = np.tile(scores, int(tile_factor))
 
@@ -1626,9 +2093,16 @@ class Tally(object):
             if self.derivative.nuclide is not None:
                 df['d_nuclide'] = self.derivative.nuclide
 
-        # Append columns with mean, std. dev. for each tally bin
-        df['mean'] = self.mean.ravel()
-        df['std. dev.'] = self.std_dev.ravel()
+        # Append columns with mean, std. dev. for each tally bin. The columns
+        # of sparse tallies are sparse arrays that have a row for every bin,
+        # so that the rows line up with the bins of the filters, nuclides and
+        # scores, but only store the nonzero bins.
+        if self.sparse:
+            df['mean'] = self._sparse_column(mean)
+            df['std. dev.'] = self._sparse_column(std_dev)
+        else:
+            df['mean'] = mean.ravel()
+            df['std. dev.'] = std_dev.ravel()
 
         df = df.dropna(axis=1)
 
@@ -1659,6 +2133,272 @@ class Tally(object):
 
         return df
 
+    def _sparse_column(self, data):
+        """Convert sparse tally data to a sparse DataFrame column.
+
+        Parameters
+        ----------
+        data : scipy.sparse.spmatrix
+            Tally data with one row per filter bin and one column per (nuclide,
+            score) pair
+
+        Returns
+        -------
+        pandas.arrays.SparseArray
+            Tally data with one entry per bin in the order of the DataFrame
+            rows and a fill value of zero
+
+        """
+
+        import pandas as pd
+        import scipy.sparse as sps
+
+        try:
+            from_spmatrix = pd.arrays.SparseArray.from_spmatrix
+        except AttributeError:
+            # Older versions of Pandas only build sparse arrays from dense ones
+            return pd.SparseArray(self._to_dense(data).ravel(), fill_value=0.)
+
+        # Flatten the matrix into a single column in row-major order
+        coo = data.tocoo()
+        rows = coo.row.astype(np.int64)*data.shape[1] + coo.col
+        column = sps.csc_matrix((coo.data, (rows, np.zeros_like(rows))),
+                                shape=(data.shape[0]*data.shape[1], 1))
+        return from_spmatrix(column)
+
+    def _get_nuclide_column(self):
+        """Returns the name and nuclide bin labels of the nuclide column of the
+        tally's DataFrame"""
+
+        nuclides = []
+        column_name = 'nuclide'
+
+        for nuclide in self.nuclides:
+            if isinstance(nuclide, openmc.Nuclide):
+                nuclides.append(nuclide.name)
+            elif isinstance(nuclide, openmc.AggregateNuclide):
+                nuclides.append(nuclide.name)
+                column_name = '{0}(nuclide)'.format(nuclide.aggregate_op)
+            else:
+                nuclides.append(nuclide)
+
+        return column_name, nuclides
+
+    def _get_score_column(self):
+        """Returns the name and score bin labels of the score column of the
+        tally's DataFrame"""
+
+        scores = []
+        column_name = 'score'
+
+        for score in self.scores:
+            if isinstance(score, string_types + (openmc.CrossScore,)):
+                scores.append(str(score))
+            elif isinstance(score, openmc.AggregateScore):
+                scores.append(score.name)
+                column_name = '{0}(score)'.format(score.aggregate_op)
+
+        return column_name, scores
+
+    def _iter_columns(self, batch_size, filters=True, nuclides=True,
+                      scores=True, derivative=True, distribcell_paths=True):
+        """Iterate over the columns of the tally's DataFrame in batches of
+        rows.
+
+        Each batch covers a contiguous range of filter bins. The filter columns
+        are generated for the rows of the batch from the filter strides, and
+        only the results for the filter bins of the batch are read.
+
+        Parameters
+        ----------
+        batch_size : Integral
+            Maximum number of rows in each batch. Batches contain at least one
+            filter bin.
+        filters, nuclides, scores, derivative, distribcell_paths : bool
+            Columns to include as in :meth:`Tally.get_pandas_dataframe`
+
+        Yields
+        ------
+        collections.OrderedDict
+            Mapping of column names to the arrays of the column for the rows
+            of the batch
+
+        """
+
+        # Ensure that the tally has data
+        lazy = self._sp_filename and not self.derived and \
+            not self._results_read
+        if not lazy and (self._get_results('mean') is None or
+                         self._get_results('std_dev') is None):
+            msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
+            raise KeyError(msg)
+
+        # Build a table with one row per bin for each filter. The rows for a
+        # batch are selected from these tables with the filter strides.
+        tables = []
+        if filters:
+            for self_filter in self.filters:
+                bin_filter = copy.copy(self_filter)
+                bin_filter._stride = 1
+                tables.append(bin_filter.get_pandas_dataframe(
+                    bin_filter.num_bins, distribcell_paths=distribcell_paths))
+
+        if nuclides:
+            nuclide_column, nuclide_labels = self._get_nuclide_column()
+            nuclide_labels = np.repeat(nuclide_labels, self.num_scores)
+        if scores:
+            score_column, score_labels = self._get_score_column()
+            score_labels = np.array(score_labels)
+
+        nuclide_indices = np.arange(self.num_nuclides)
+        score_indices = np.arange(self.num_scores)
+        row_stride = self.num_nuclides * self.num_scores
+        filter_bins_per_batch = max(1, batch_size // row_stride)
+
+        for start in range(0, self.num_filter_bins, filter_bins_per_batch):
+            stop = min(start + filter_bins_per_batch, self.num_filter_bins)
+            rows = np.arange(start*row_stride, stop*row_stride)
+            columns = OrderedDict()
+
+            for self_filter, table in zip(self.filters, tables):
+                bin_indices = \
+                    (rows // self_filter.stride) % self_filter.num_bins
+                for name in table.columns:
+                    columns[name] = table[name].values[bin_indices]
+
+            if nuclides:
+                columns[nuclide_column] = nuclide_labels[rows % row_stride]
+            if scores:
+                columns[score_column] = \
+                    score_labels[rows % self.num_scores]
+
+            if derivative and (self.derivative is not None):
+                columns['d_variable'] = \
+                    np.repeat(self.derivative.variable, len(rows))
+                if self.derivative.material is not None:
+                    columns['d_material'] = \
+                        np.repeat(self.derivative.material, len(rows))
+                if self.derivative.nuclide is not None:
+                    columns['d_nuclide'] = \
+                        np.repeat(self.derivative.nuclide, len(rows))
+
+            if lazy:
+                # Read the contiguous rows of the batch with one slice. They
+                # are not kept, so only one batch is held in memory at a time.
+                with openmc.statepoint._shared_file(self._sp_filename) as f:
+                    data = f['tallies/tally {0}/results'.format(
+                        self.id)][start:stop]
+                for value, name in (('mean', 'mean'),
+                                    ('std_dev', 'std. dev.')):
+                    columns[name] = _results_value(
+                        data, self.num_realizations, value).ravel()
+            else:
+                filter_indices = np.arange(start, stop)
+                for value, name in (('mean', 'mean'),
+                                    ('std_dev', 'std. dev.')):
+                    columns[name] = self._get_values_by_index(
+                        value, filter_indices, nuclide_indices,
+                        score_indices).ravel()
+
+            yield columns
+
+    def iter_record_batches(self, batch_size=65536, filters=True,
+                            nuclides=True, scores=True, derivative=True,
+                            distribcell_paths=True):
+        """Iterate over the Tally data as Apache Arrow record batches.
+
+        The record batches contain the same columns as the DataFrame built by
+        :meth:`Tally.get_pandas_dataframe`. Multi-index column names are joined
+        with spaces, e.g. 'mesh 1 x'. The columns are generated one batch at a
+        time, so the whole table is never held in memory.
+
+        Parameters
+        ----------
+        batch_size : Integral
+            Maximum number of rows in each record batch (default is 65536).
+            Each batch contains the rows of at least one filter bin.
+        filters : bool
+            Include columns with filter bin information (default is True).
+        nuclides : bool
+            Include columns with nuclide bin information (default is True).
+        scores : bool
+            Include columns with score bin information (default is True).
+        derivative : bool
+            Include columns with differential tally info (default is True).
+        distribcell_paths : bool, optional
+            Construct columns for distribcell tally filters (default is True).
+
+        Yields
+        ------
+        pyarrow.RecordBatch
+            Record batch with the rows of one or more filter bins
+
+        Raises
+        ------
+        KeyError
+            When this method is called before the Tally is populated with data
+        ImportError
+            When PyArrow or Pandas can not be found on the caller's system
+
+        """
+
+        import pyarrow as pa
+
+        cv.check_type('batch size', batch_size, Integral)
+        cv.check_greater_than('batch size', batch_size, 0)
+
+        for columns in self._iter_columns(batch_size, filters, nuclides,
+                                          scores, derivative,
+                                          distribcell_paths):
+            names = []
+            for name in columns:
+                if isinstance(name, tuple):
+                    name = ' '.join(str(part) for part in name if part != '')
+                names.append(str(name))
+
+            arrays = [pa.array(column) for column in columns.values()]
+            yield pa.RecordBatch.from_arrays(arrays, names)
+
+    def to_parquet(self, path, batch_size=65536, compression='snappy',
+                   **kwargs):
+        """Write the Tally data to an Apache Parquet file.
+
+        The file contains the same columns as :meth:`Tally.iter_record_batches`
+        with one row group per record batch.
+
+        Parameters
+        ----------
+        path : str
+            Path of the Parquet file
+        batch_size : Integral
+            Maximum number of rows in each row group (default is 65536)
+        compression : str
+            Compression codec passed to :class:`pyarrow.parquet.ParquetWriter`
+            (default is 'snappy')
+        **kwargs
+            Keyword arguments passed to :meth:`Tally.iter_record_batches`
+
+        Raises
+        ------
+        ImportError
+            When PyArrow or Pandas can not be found on the caller's system
+
+        """
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for batch in self.iter_record_batches(batch_size, **kwargs):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema,
+                                              compression=compression)
+                writer.write_table(pa.Table.from_batches([batch]))
+        finally:
+            if writer is not None:
+                writer.close()
+
     def get_reshaped_data(self, value='mean'):
         """Returns an array of tally data with one dimension per filter.
 
@@ -1802,55 +2542,39 @@ class Tally(object):
 
         # Query the mean and std dev so the tally data is read in from file
         # if it has not already been read in.
-        self.mean, self.std_dev, other.mean, other.std_dev
+        for tally in (self, other):
+            tally._get_results('mean'), tally._get_results('std_dev')
 
         # Create copies of self and other tallies to rearrange for tally
         # arithmetic
         self_copy = copy.deepcopy(self)
         other_copy = copy.deepcopy(other)
 
-        self_copy.sparse = False
-        other_copy.sparse = False
-
-        # Align the tally data based on desired hybrid product
-        data = self_copy._align_tally_data(other_copy, filter_product,
-                                           nuclide_product, score_product)
-
-        # Perform tally arithmetic operation
-        if binary_op == '+':
-            new_tally._mean = data['self']['mean'] + data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '-':
-            new_tally._mean = data['self']['mean'] - data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '*':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] * data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '/':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] / data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '^':
-            mean_ratio = data['other']['mean'] / data['self']['mean']
-            first_term = mean_ratio * data['self']['std. dev.']
-            second_term = \
-                np.log(data['self']['mean']) * data['other']['std. dev.']
-            new_tally._mean = data['self']['mean'] ** data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(first_term**2 + second_term**2)
-
-        # Convert any infs and nans to zero
-        new_tally._mean[np.isinf(new_tally._mean)] = 0
-        new_tally._mean = np.nan_to_num(new_tally._mean)
-        new_tally._std_dev[np.isinf(new_tally._std_dev)] = 0
-        new_tally._std_dev = np.nan_to_num(new_tally._std_dev)
+        # Entrywise arithmetic between sparse tallies with identical bins is
+        # performed on the sparse matrices without aligning the data
+        sparse = self.sparse and other.sparse and binary_op != '^' and \
+            nuclide_product == 'entrywise' and \
+            score_product == 'entrywise' and \
+            self.filters == other.filters and \
+            self.nuclides == other.nuclides and self.scores == other.scores
+
+        if sparse:
+            new_tally._mean, new_tally._std_dev = \
+                self_copy._sparse_binary_op(other_copy, binary_op)
+            new_tally._sparse = True
+
+        else:
+            self_copy.sparse = False
+            other_copy.sparse = False
+
+            # Align the tally data based on desired hybrid product
+            data = self_copy._align_tally_data(other_copy, filter_product,
+                                               nuclide_product, score_product)
+
+            # Perform tally arithmetic operation
+            new_tally._mean, new_tally._std_dev = _binary_op(
+                binary_op, data['self']['mean'], data['self']['std. dev.'],
+                data['other']['mean'], data['other']['std. dev.'])
 
         # Set tally attributes
         if self_copy.estimator == other_copy.estimator:
@@ -1898,6 +2622,53 @@ class Tally(object):
 
         return new_tally
 
+    def _sparse_binary_op(self, other, binary_op):
+        """Perform entrywise arithmetic between two sparse tallies with
+        identical filters, nuclides and scores.
+
+        Parameters
+        ----------
+        other : openmc.Tally
+            The tally on the right hand side of the operation
+        binary_op : {'+', '-', '*', '/'}
+            The binary operation
+
+        Returns
+        -------
+        mean : scipy.sparse.csr_matrix
+            Mean of the result
+        std_dev : scipy.sparse.csr_matrix
+            Standard deviation of the result
+
+        """
+
+        import scipy.sparse as sps
+
+        operands = [self._get_results('mean'), self._get_results('std_dev'),
+                    other._get_results('mean'), other._get_results('std_dev')]
+
+        # Sums and differences are nonzero wherever either operand is nonzero
+        # while products and quotients are zero unless both means are nonzero
+        if binary_op in ('+', '-'):
+            pattern = abs(operands[0]) + abs(operands[1]) + \
+                abs(operands[2]) + abs(operands[3])
+        else:
+            pattern = abs(operands[0]).multiply(abs(operands[2]))
+        pattern = sps.csr_matrix(pattern)
+        pattern.eliminate_zeros()
+        pattern = pattern.tocoo()
+
+        # Evaluate the operation only at the bins which may be nonzero
+        values = [np.asarray(operand[pattern.row, pattern.col]).ravel()
+                  for operand in operands]
+        mean, std_dev = _binary_op(binary_op, *values)
+
+        shape = pattern.shape
+        mean = sps.csr_matrix((mean, (pattern.row, pattern.col)), shape=shape)
+        std_dev = sps.csr_matrix((std_dev, (pattern.row, pattern.col)),
+                                 shape=shape)
+        return mean, std_dev
+
     def _update_filter_strides(self):
         """Update each filter's stride based on the tally's nuclides and scores
         for derived tallies created by tally arithmetic.
@@ -2633,7 +3404,7 @@ class Tally(object):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self._mean ** power
+            new_tally._mean = self.mean ** power
             self_rel_err = self.std_dev / self.mean
             new_tally._std_dev = np.abs(new_tally._mean * power * self_rel_err)
             new_tally.estimator = self.estimator
@@ -2802,8 +3573,10 @@ class Tally(object):
 
         """
 
-        # Ensure that the tally has data
-        if not self.derived and self.sum is None:
+        # Ensure that the tally has data. The statepoint filename is checked
+        # rather than the results themselves so that only the sliced bins are
+        # ever read from disk.
+        if not self.derived and not self._sp_filename:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2815,24 +3588,43 @@ class Tally(object):
         # Differentiate Tally with a new auto-generated Tally ID
         new_tally.id = None
 
-        new_tally.sparse = False
+        if self.sparse and (self.derived or self._results_read):
+            # Slice the sparse matrices directly so the data stays sparse
+            bins = (self.get_filter_indices(filters, filter_bins),
+                    self.get_nuclide_indices(nuclides),
+                    self.get_score_indices(scores))
+            for value in ('sum', 'sum_sq', 'mean', 'std_dev'):
+                if self._get_results(value) is not None:
+                    setattr(new_tally, '_' + value,
+                            self._get_sparse_slice(value, *bins))
 
-        if not self.derived and self.sum is not None:
-            new_sum = self.get_values(scores, filters, filter_bins,
-                                      nuclides, 'sum')
-            new_tally.sum = new_sum
-        if not self.derived and self.sum_sq is not None:
-            new_sum_sq = self.get_values(scores, filters, filter_bins,
-                                         nuclides, 'sum_sq')
-            new_tally.sum_sq = new_sum_sq
-        if self.mean is not None:
-            new_mean = self.get_values(scores, filters, filter_bins,
-                                       nuclides, 'mean')
-            new_tally._mean = new_mean
-        if self.std_dev is not None:
-            new_std_dev = self.get_values(scores, filters, filter_bins,
-                                          nuclides, 'std_dev')
-            new_tally._std_dev = new_std_dev
+        else:
+            new_tally.sparse = False
+
+            if not self.derived:
+                new_sum = self.get_values(scores, filters, filter_bins,
+                                          nuclides, 'sum')
+                new_tally.sum = new_sum
+                new_sum_sq = self.get_values(scores, filters, filter_bins,
+                                             nuclides, 'sum_sq')
+                new_tally.sum_sq = new_sum_sq
+            if not self.derived and not self._results_read:
+                new_tally._mean = self.get_values(scores, filters,
+                                                  filter_bins, nuclides,
+                                                  'mean')
+                new_tally._std_dev = self.get_values(scores, filters,
+                                                     filter_bins, nuclides,
+                                                     'std_dev')
+            else:
+                if self.mean is not None:
+                    new_mean = self.get_values(scores, filters, filter_bins,
+                                               nuclides, 'mean')
+                    new_tally._mean = new_mean
+                if self.std_dev is not None:
+                    new_std_dev = self.get_values(scores, filters,
+                                                  filter_bins, nuclides,
+                                                  'std_dev')
+                    new_tally._std_dev = new_std_dev
 
         # SCORES
         if scores:
@@ -2947,9 +3739,16 @@ class Tally(object):
         tally_sum._sp_filename = self._sp_filename
         tally_sum._results_read = self._results_read
 
-        # Get tally data arrays reshaped with one dimension per filter
-        mean = self.get_reshaped_data(value='mean')
-        std_dev = self.get_reshaped_data(value='std_dev')
+        # Get tally data arrays reshaped with one dimension per filter. Sparse
+        # data is summed over its stored entries instead.
+        if self.sparse:
+            mean = self._get_results('mean')
+            variance = self._get_results('std_dev').power(2)
+            filter_dims = [self_filter.num_bins for self_filter in self.filters]
+            column_dims = [self.num_nuclides, self.num_scores]
+        else:
+            mean = self.get_reshaped_data(value='mean')
+            std_dev = self.get_reshaped_data(value='std_dev')
 
         # Sum across any filter bins specified by the user
         if isinstance(filter_type, openmc.FilterMeta):
@@ -2975,7 +3774,19 @@ class Tally(object):
 
             # Sum across the bins in the user-specified filter
             for i, self_filter in enumerate(self.filters):
-                if isinstance(self_filter, filter_type):
+                if isinstance(self_filter, filter_type) and self.sparse:
+                    mean = _sparse_sum(mean, filter_dims, i, bin_indices)
+                    variance = _sparse_sum(variance, filter_dims, i,
+                                           bin_indices)
+                    filter_dims[i] = 1
+
+                    # Add AggregateFilter to the tally sum
+                    if not remove_filter:
+                        filter_sum = openmc.AggregateFilter(self_filter,
+                            [tuple(filter_bins)], 'sum')
+                        tally_sum.filters.append(filter_sum)
+
+                elif isinstance(self_filter, filter_type):
                     shape = mean.shape
                     mean = np.take(mean, indices=bin_indices, axis=i)
                     std_dev = np.take(std_dev, indices=bin_indices, axis=i)
@@ -3007,12 +3818,19 @@ class Tally(object):
         # Sum across any nuclides specified by the user
         if len(nuclides) != 0:
             nuclide_bins = [self.get_nuclide_index(nuclide) for nuclide in nuclides]
-            axis_index = self.num_filters
-            mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=nuclide_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if self.sparse:
+                mean = _sparse_sum(mean, column_dims, 0, nuclide_bins, True)
+                variance = _sparse_sum(variance, column_dims, 0,
+                                       nuclide_bins, True)
+                column_dims[0] = 1
+            else:
+                axis_index = self.num_filters
+                mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=nuclide_bins,
+                                  axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateNuclide to the tally sum
             nuclide_sum = openmc.AggregateNuclide(nuclides, 'sum')
@@ -3025,12 +3843,19 @@ class Tally(object):
         # Sum across any scores specified by the user
         if len(scores) != 0:
             score_bins = [self.get_score_index(score) for score in scores]
-            axis_index = self.num_filters + 1
-            mean = np.take(mean, indices=score_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if self.sparse:
+                mean = _sparse_sum(mean, column_dims, 1, score_bins, True)
+                variance = _sparse_sum(variance, column_dims, 1, score_bins,
+                                       True)
+                column_dims[1] = 1
+            else:
+                axis_index = self.num_filters + 1
+                mean = np.take(mean, indices=score_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=score_bins,
+                                  axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateScore to the tally sum
             score_sum = openmc.AggregateScore(scores, 'sum')
@@ -3044,8 +3869,12 @@ class Tally(object):
         tally_sum._update_filter_strides()
 
         # Reshape condensed data arrays with one dimension for all filters
-        mean = np.reshape(mean, tally_sum.shape)
-        std_dev = np.reshape(std_dev, tally_sum.shape)
+        if self.sparse:
+            mean = mean.tocsr()
+            std_dev = variance.tocsr().sqrt()
+        else:
+            mean = np.reshape(mean, tally_sum.shape)
+            std_dev = np.reshape(std_dev, tally_sum.shape)
 
         # Assign tally sum's data with the new arrays
         tally_sum._mean = mean
@@ -1,4 +1,5 @@
 from collections import OrderedDict, Iterable
+import multiprocessing
 from numbers import Integral, Real
 import random
 import sys
@@ -8,11 +9,18 @@ import numpy as np
 
 import openmc
 import openmc.checkvalue as cv
+from openmc.region import _Observable
 
 
 # A static variable for auto-generated Lattice (Universe) IDs
 AUTO_UNIVERSE_ID = 10000
 
+# Minimum number of cells for which a universe builds a grid of its cells
+_GRID_MIN_CELLS = 8
+
+# Maximum number of grid bins along each axis
+_GRID_MAX_BINS = 128
+
 
 def reset_auto_universe_id():
     """Reset counter for auto-generated universe IDs."""
@@ -20,7 +28,176 @@ def reset_auto_universe_id():
     AUTO_UNIVERSE_ID = 10000
 
 
-class Universe(object):
+def _find_many_tile(args):
+    """Locate the points of one tile of a plot.
+
+    This function is executed by the worker processes of
+    :meth:`Universe.plot`.
+
+    Parameters
+    ----------
+    args : tuple
+        Universe and Cartesian coordinates of the points with shape (N, 3)
+
+    Returns
+    -------
+    cell_ids : numpy.ndarray
+        ID of the lowest-level cell containing each point, or -1
+    material_ids : numpy.ndarray
+        ID of the material filling that cell, or -1
+
+    """
+    universe, points = args
+    return universe._find_many(points)
+
+
+class _CellGrid(object):
+    """Uniform grid of the bounding boxes of the cells of a universe.
+
+    Each bin of the grid lists the cells whose bounding box overlaps the bin,
+    in the order in which they appear in the universe. The domain of the grid
+    is the extent of the finite coordinates of all bounding boxes. An
+    additional bin holds the cells whose bounding box is unbounded, which are
+    the only cells that can contain points outside the domain.
+
+    Parameters
+    ----------
+    cells : Iterable of openmc.Cell
+        Cells of the universe
+
+    Attributes
+    ----------
+    cells : list of openmc.Cell
+        Cells of the universe
+    cell_bins : list of numpy.ndarray
+        Indices of the bins overlapped by each cell
+    n_bins : int
+        Number of bins, including the bin outside the domain
+
+    """
+
+    def __init__(self, cells):
+        self.cells = list(cells)
+
+        lower_left = np.empty((len(self.cells), 3))
+        upper_right = np.empty((len(self.cells), 3))
+        for i, cell in enumerate(self.cells):
+            if cell.region is None:
+                lower_left[i] = -np.inf
+                upper_right[i] = np.inf
+            else:
+                lower_left[i], upper_right[i] = cell.region.bounding_box
+
+        # Determine the domain from the finite coordinates of the boxes
+        coords = np.vstack((lower_left, upper_right))
+        self._lower = np.zeros(3)
+        extent = np.zeros(3)
+        for axis in range(3):
+            finite = coords[:, axis][np.isfinite(coords[:, axis])]
+            if finite.size > 0:
+                self._lower[axis] = finite.min()
+                extent[axis] = finite.max() - finite.min()
+
+        # Choose bins of roughly equal size such that there are about as many
+        # bins as cells that are bounded along the axes of the domain
+        self._finite = extent > 0.
+        bounded = np.all((np.isfinite(lower_left) & np.isfinite(upper_right))
+                         [:, self._finite], axis=1)
+        self._shape = np.ones(3, dtype=int)
+        if self._finite.any():
+            width = (np.prod(extent[self._finite]) / max(bounded.sum(), 1))**(
+                1. / self._finite.sum())
+            self._shape[self._finite] = np.clip(np.ceil(
+                extent[self._finite] / width), 1, _GRID_MAX_BINS)
+        self._width = np.where(self._finite, extent / self._shape, 1.)
+        self._upper = self._lower + extent
+        self.n_bins = int(np.prod(self._shape)) + 1
+
+        # Determine the bins overlapped by each cell
+        self.cell_bins = []
+        cell_index = []
+        for i in range(len(self.cells)):
+            if np.any(lower_left[i] > upper_right[i]):
+                bins = np.empty(0, dtype=int)
+            else:
+                i_min = self._bin_coordinates(lower_left[i])
+                i_max = self._bin_coordinates(upper_right[i])
+                ranges = np.ix_(*[np.arange(a, b + 1)
+                                  for a, b in zip(i_min, i_max)])
+                bins = np.ravel_multi_index(
+                    np.broadcast_arrays(*ranges), self._shape).ravel()
+                if not bounded[i]:
+                    bins = np.append(bins, self.n_bins - 1)
+            self.cell_bins.append(bins)
+            cell_index.append(np.full(bins.size, i, dtype=int))
+
+        # Sort the cells by bin, preserving their order within each bin
+        bins = np.concatenate(self.cell_bins)
+        order = np.argsort(bins, kind='mergesort')
+        self._bin_cells = np.concatenate(cell_index)[order]
+        self._bin_start = np.searchsorted(bins[order],
+                                          np.arange(self.n_bins + 1))
+
+    def _bin_coordinates(self, points):
+        """Return the indices of the bins along each axis containing points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (..., 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the bins, clipped to the grid
+
+        """
+        index = np.floor((np.clip(points, self._lower, self._upper) -
+                          self._lower) / self._width)
+        index = np.where(self._finite, index, 0).astype(int)
+        return np.minimum(index, self._shape - 1)
+
+    def find_bins(self, points):
+        """Return the bins containing points.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the bin containing each point
+
+        """
+        outside = np.any(((points < self._lower) | (points > self._upper)) &
+                         self._finite, axis=1)
+        bins = np.ravel_multi_index(self._bin_coordinates(points).T,
+                                    self._shape)
+        bins[outside] = self.n_bins - 1
+        return bins
+
+    def candidates(self, point):
+        """Return the cells whose bounding box may contain a point.
+
+        Parameters
+        ----------
+        point : numpy.ndarray
+            Cartesian coordinates of the point
+
+        Returns
+        -------
+        list of openmc.Cell
+            Candidate cells in the order in which they appear in the universe
+
+        """
+        b = self.find_bins(np.reshape(point, (1, 3)))[0]
+        start, end = self._bin_start[b], self._bin_start[b + 1]
+        return [self.cells[i] for i in self._bin_cells[start:end]]
+
+
+class Universe(_Observable):
     """A collection of cells that can be repeated.
 
     Parameters
@@ -64,6 +241,16 @@ class Universe(object):
         # Values - Offsets
         self._cell_offsets = OrderedDict()
 
+        # View, cell IDs, and material IDs of the most recent plot
+        self._raster = None
+
+        # Incremented whenever the universe or any part of the geometry it
+        # contains is modified
+        self._version = 0
+
+        # Grid of the bounding boxes of the cells, built on first use
+        self._grid = None
+
         if cells is not None:
             self.add_cells(cells)
 
@@ -181,9 +368,32 @@ class Universe(object):
         else:
             raise ValueError('No volume information found for this universe.')
 
+    def _cell_grid(self):
+        """Return the grid of the bounding boxes of the cells.
+
+        The grid is built on first use and discarded when cells are added to
+        or removed from the universe or when the region of one of its cells,
+        or a surface bounding it, is modified. Universes with few cells are
+        searched linearly and have no grid.
+
+        Returns
+        -------
+        _CellGrid or None
+            Grid of the cells of the universe
+
+        """
+        if len(self._cells) < _GRID_MIN_CELLS:
+            return None
+        if self._grid is None:
+            self._grid = _CellGrid(self._cells.values())
+        return self._grid
+
     def find(self, point):
         """Find cells/universes/lattices which contain a given point
 
+        Universes with many cells are searched using a grid of the bounding
+        boxes of their cells.
+
         Parameters
         ----------
         point : 3-tuple of float
@@ -197,8 +407,19 @@ class Universe(object):
 
         """
         p = np.asarray(point)
-        for cell in self._cells.values():
-            if p in cell:
+
+        # Senses of surfaces at the point, shared by all cells
+        senses = {}
+
+        grid = self._cell_grid()
+        if grid is None:
+            cells = self._cells.values()
+        else:
+            cells = grid.candidates(p)
+
+        for cell in cells:
+            if cell.region is None or \
+               cell._compiled_region().evaluate(p, senses):
                 if cell.fill_type in ('material', 'distribmat', 'void'):
                     return [self, cell]
                 elif cell.fill_type == 'universe':
@@ -211,11 +432,120 @@ class Universe(object):
                     return [self, cell] + cell.fill.find(p)
         return []
 
+    def find_many(self, points):
+        """Find the cells and materials which contain many points
+
+        All points are located together and are divided among cells,
+        universes, and lattices with boolean masks. In universes with few
+        cells, each surface is evaluated once for all points that reach the
+        universe. In universes with many cells, each cell is only tested
+        against the points near its bounding box.
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points, with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1 if no
+            cell contains the point
+        material_ids : numpy.ndarray
+            ID of the material filling that cell, or -1 if the cell is void,
+            is filled with distributed materials, or does not exist
+
+        """
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('Points must be given as an array with shape '
+                             '(N, 3).')
+        return self._find_many(points)
+
+    def _find_many(self, points):
+        """Find the cells and materials which contain many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the lowest-level cell containing each point, or -1
+        material_ids : numpy.ndarray
+            ID of the material filling that cell, or -1
+
+        """
+        cell_ids = np.full(len(points), -1, dtype=int)
+        material_ids = np.full(len(points), -1, dtype=int)
+
+        # Senses of surfaces at the points, shared by all cells
+        senses = {}
+
+        # Sort the points by the grid bin containing them
+        grid = self._cell_grid()
+        if grid is not None:
+            bins = grid.find_bins(points)
+            order = np.argsort(bins, kind='mergesort')
+            bin_start = np.searchsorted(bins[order],
+                                        np.arange(grid.n_bins + 1))
+
+        remaining = np.ones(len(points), dtype=bool)
+        for i, cell in enumerate(self._cells.values()):
+            if grid is None:
+                if cell.region is None:
+                    inside = remaining.copy()
+                else:
+                    inside = remaining & cell._compiled_region().evaluate(
+                        points, senses)
+                index = np.flatnonzero(inside)
+            else:
+                # Only check the points in the bins overlapped by the cell
+                start = bin_start[grid.cell_bins[i]]
+                count = bin_start[grid.cell_bins[i] + 1] - start
+                index = order[np.repeat(start - np.cumsum(count) + count,
+                                        count) + np.arange(count.sum())]
+                index = index[remaining[index]]
+                if cell.region is not None and index.size > 0:
+                    index = index[cell._compiled_region().evaluate(
+                        points[index])]
+            if index.size == 0:
+                continue
+            remaining[index] = False
+
+            if cell.fill_type in ('material', 'distribmat', 'void'):
+                cell_ids[index] = cell.id
+                if cell.fill_type == 'material':
+                    material_ids[index] = cell.fill.id
+            else:
+                p = points[index]
+                if cell.fill_type == 'universe':
+                    if cell.translation is not None:
+                        p = p - cell.translation
+                    if cell.rotation is not None:
+                        p = p.dot(cell.rotation_matrix.T)
+                cell_ids[index], material_ids[index] = cell.fill._find_many(p)
+
+            if not remaining.any():
+                break
+
+        return cell_ids, material_ids
+
     def plot(self, center=(0., 0., 0.), width=(1., 1.), pixels=(200, 200),
              basis='xy', color_by='cell', colors=None, filename=None, seed=None,
-             **kwargs):
+             processes=1, **kwargs):
         """Display a slice plot of the universe.
 
+        All pixels are located together with :meth:`Universe.find_many`. The
+        cells and materials found for the most recent view are cached, so the
+        same view can be plotted again with a different `color_by` or `colors`
+        without querying the geometry. The cache is discarded when a surface,
+        region, cell, universe, or lattice contained in the universe is
+        modified through its attributes or methods, including the nodes of a
+        region. Universes of a lattice modified in place are not detected.
+
         Parameters
         ----------
         center : Iterable of float
@@ -248,6 +578,8 @@ class Universe(object):
             Hashable object which is used to seed the random number generator
             used to select colors. If None, the generator is seeded from the
             current time.
+        processes : int, optional
+            Number of worker processes over which rows of pixels are divided
         **kwargs
             All keyword arguments are passed to
             :func:`matplotlib.pyplot.imshow`.
@@ -255,6 +587,11 @@ class Universe(object):
         """
         import matplotlib.pyplot as plt
 
+        cv.check_value('basis', basis, ('xy', 'xz', 'yz'))
+        cv.check_value('color_by', color_by, ('cell', 'material'))
+        cv.check_type('number of processes', processes, Integral)
+        cv.check_greater_than('number of processes', processes, 0)
+
         # Seed the random number generator
         if seed is not None:
             random.seed(seed)
@@ -266,7 +603,7 @@ class Universe(object):
             # Convert to RGBA if necessary
             for obj, rgb in colors.items():
                 if len(rgb) == 3:
-                    colors[obj] = rgb + (1.0,)
+                    colors[obj] = tuple(rgb) + (1.0,)
 
         if basis == 'xy':
             x_min = center[0] - 0.5*width[0]
@@ -287,39 +624,33 @@ class Universe(object):
             y_min = center[2] - 0.5*width[1]
             y_max = center[2] + 0.5*width[1]
 
-        # Determine locations to determine cells at
-        x_coords = np.linspace(x_min, x_max, pixels[0], endpoint=False) + \
-                   0.5*(x_max - x_min)/pixels[0]
-        y_coords = np.linspace(y_max, y_min, pixels[1], endpoint=False) - \
-                   0.5*(y_max - y_min)/pixels[1]
+        cell_ids, material_ids = self._cached_raster(
+            center, (x_min, x_max, y_min, y_max), pixels, basis, processes)
+
+        # Look up the object that determines the color of each pixel
+        if color_by == 'cell':
+            ids = cell_ids
+            objects = self.get_all_cells()
+        else:
+            ids = material_ids
+            objects = self.get_all_materials()
+
+        # Build a table of colors for the distinct IDs, leaving pixels
+        # without a cell or material transparent
+        unique_ids, inverse = np.unique(ids, return_inverse=True)
+        table = np.zeros((len(unique_ids), 4))
+        for i, uid in enumerate(unique_ids):
+            if uid not in objects:
+                continue
+            obj = objects[uid]
+            if obj not in colors:
+                colors[obj] = (random.random(), random.random(),
+                               random.random(), 1.0)
+            table[i] = colors[obj]
 
         # Initialize output image in RGBA format.  Flip the pixels from
         # traditional (x, y) to (y, x) used in graphics.
-        img = np.zeros((pixels[1], pixels[0], 4))
-        for i, x in enumerate(x_coords):
-            for j, y in enumerate(y_coords):
-                if basis == 'xy':
-                    path = self.find((x, y, center[2]))
-                elif basis == 'yz':
-                    path = self.find((center[0], x, y))
-                elif basis == 'xz':
-                    path = self.find((x, center[1], y))
-
-                if len(path) > 0:
-                    try:
-                        if color_by == 'cell':
-                            obj = path[-1]
-                        elif color_by == 'material':
-                            if path[-1].fill_type == 'material':
-                                obj = path[-1].fill
-                            else:
-                                continue
-                    except AttributeError:
-                        continue
-                    if obj not in colors:
-                        colors[obj] = (random.random(), random.random(),
-                                       random.random(), 1.0)
-                    img[j, i, :] = colors[obj]
+        img = table[inverse.ravel()].reshape(pixels[1], pixels[0], 4)
 
         # Display image
         plt.imshow(img, extent=(x_min, x_max, y_min, y_max), **kwargs)
@@ -330,6 +661,112 @@ class Universe(object):
         else:
             plt.savefig(filename)
 
+    def _cached_raster(self, center, extent, pixels, basis, processes):
+        """Return the cells and materials of a plot, reusing the last view.
+
+        The cells and materials are located again if the view differs from
+        the one last plotted or if the geometry contained in the universe has
+        been modified since.
+
+        Parameters
+        ----------
+        center : Iterable of float
+            Coordinates at the center of the plot
+        extent : 4-tuple of float
+            Minimum and maximum coordinates of the plot in each basis direction
+        pixels : Iterable of int
+            Number of pixels to use in each basis direction
+        basis : {'xy', 'xz', 'yz'}
+            The basis directions for the plot
+        processes : int
+            Number of worker processes over which rows of pixels are divided
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the cell at each pixel, or -1
+        material_ids : numpy.ndarray
+            ID of the material at each pixel, or -1
+
+        """
+        view = (tuple(center), tuple(extent), tuple(pixels), basis,
+                self._version)
+        if self._raster is None or self._raster[0] != view:
+            cell_ids, material_ids = self._rasterize(
+                center, extent, pixels, basis, processes)
+            self._raster = (view, cell_ids, material_ids)
+        return self._raster[1:]
+
+    def _rasterize(self, center, extent, pixels, basis, processes):
+        """Locate the cell and material at the center of each pixel of a plot.
+
+        Parameters
+        ----------
+        center : Iterable of float
+            Coordinates at the center of the plot
+        extent : 4-tuple of float
+            Minimum and maximum coordinates of the plot in each basis direction
+        pixels : Iterable of int
+            Number of pixels to use in each basis direction
+        basis : {'xy', 'xz', 'yz'}
+            The basis directions for the plot
+        processes : int
+            Number of worker processes over which rows of pixels are divided
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            ID of the cell at each pixel, or -1, with shape (pixels[1],
+            pixels[0])
+        material_ids : numpy.ndarray
+            ID of the material at each pixel, or -1, with shape (pixels[1],
+            pixels[0])
+
+        """
+        x_min, x_max, y_min, y_max = extent
+
+        # Determine locations to determine cells at
+        x_coords = np.linspace(x_min, x_max, pixels[0], endpoint=False) + \
+                   0.5*(x_max - x_min)/pixels[0]
+        y_coords = np.linspace(y_max, y_min, pixels[1], endpoint=False) - \
+                   0.5*(y_max - y_min)/pixels[1]
+
+        # Rows of the image run along the first basis direction
+        x, y = np.meshgrid(x_coords, y_coords)
+        points = np.empty((x.size, 3))
+        if basis == 'xy':
+            points[:, 0] = x.ravel()
+            points[:, 1] = y.ravel()
+            points[:, 2] = center[2]
+        elif basis == 'yz':
+            points[:, 0] = center[0]
+            points[:, 1] = x.ravel()
+            points[:, 2] = y.ravel()
+        elif basis == 'xz':
+            points[:, 0] = x.ravel()
+            points[:, 1] = center[1]
+            points[:, 2] = y.ravel()
+
+        n_tiles = min(processes, pixels[1])
+        pool = multiprocessing.Pool(n_tiles) if n_tiles > 1 else None
+
+        try:
+            if pool is None:
+                cell_ids, material_ids = self._find_many(points)
+            else:
+                tiles = np.array_split(points, n_tiles)
+                results = pool.map(_find_many_tile,
+                                   [(self, tile) for tile in tiles])
+                cell_ids = np.concatenate([r[0] for r in results])
+                material_ids = np.concatenate([r[1] for r in results])
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        shape = (pixels[1], pixels[0])
+        return cell_ids.reshape(shape), material_ids.reshape(shape)
+
     def add_cell(self, cell):
         """Add a cell to the universe.
 
@@ -349,6 +786,8 @@ class Universe(object):
 
         if cell_id not in self._cells:
             self._cells[cell_id] = cell
+            cell._add_observer(self)
+            self._on_change(cell, True)
 
     def add_cells(self, cells):
         """Add multiple cells to the universe.
@@ -385,12 +824,39 @@ class Universe(object):
 
         # If the Cell is in the Universe's list of Cells, delete it
         if cell.id in self._cells:
-            del self._cells[cell.id]
+            self._cells.pop(cell.id)._remove_observer(self)
+            self._on_change(cell, True)
 
     def clear_cells(self):
         """Remove all cells from the universe."""
 
+        for cell in self._cells.values():
+            cell._remove_observer(self)
         self._cells.clear()
+        self._on_change(self, True)
+
+    def _on_change(self, source, bounds):
+        """Discard data derived from the cells of the universe after part of
+        the geometry it contains was modified and notify the cells and
+        lattices filled with the universe.
+
+        Parameters
+        ----------
+        source : object
+            Modified cell or the universe itself
+        bounds : bool
+            Whether the extent of a cell of the universe may have changed
+
+        """
+        if bounds:
+            self._grid = None
+        self._version += 1
+        self._notify(False)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for cell in self._cells.values():
+            cell._add_observer(self)
 
     def get_cell_instance(self, path, distribcell_index):
 
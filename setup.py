@@ -45,6 +45,7 @@ if have_setuptools:
         'extras_require': {
             'decay': ['uncertainties'],
             'pandas': ['pandas>=0.17.0'],
+            'parquet': ['pandas>=0.17.0', 'pyarrow'],
             'sparse' : ['scipy'],
             'vtk': ['vtk', 'silomesh'],
             'validate': ['lxml']
@@ -0,0 +1,100 @@
+"""Write small statepoint files for tests of the Python API that do not run
+OpenMC. The layout follows docs/source/io_formats/statepoint.rst.
+
+"""
+
+import h5py
+import numpy as np
+
+
+def _strings(values):
+    return np.array([np.string_(v) for v in values])
+
+
+def write_statepoint(filename, tallies=(), k_samples=None, seed=1):
+    """Write a statepoint file for an eigenvalue calculation.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the statepoint file
+    tallies : Iterable of dict
+        Tallies to write. Each tally has an 'id', a list of 'filters' given as
+        (type, bins, number of bins) tuples, lists of 'nuclides' and 'scores',
+        and 'results' with shape (number of filter bins, number of nuclides
+        times number of scores, 2) holding the sum and sum of squares of each
+        bin. A 'name' and the number of realizations, 'n_realizations', are
+        optional.
+    k_samples : numpy.ndarray, optional
+        Collision, absorption and track-length estimates of k-effective for
+        each realization, with shape (number of realizations, 3). Defaults to
+        ten realizations of k = 1.
+    seed : int
+        Random number seed recorded in the file
+
+    """
+
+    if k_samples is None:
+        k_samples = np.ones((10, 3))
+    n = len(k_samples)
+    tallies = list(tallies)
+
+    with h5py.File(filename, 'w') as f:
+        f.attrs['filetype'] = np.string_('statepoint')
+        f.attrs['version'] = [16, 0]
+        f.attrs['openmc_version'] = [0, 8, 0]
+        f.attrs['date_and_time'] = np.string_('2017-01-01 00:00:00')
+        f.attrs['path'] = np.string_('.')
+        f.attrs['cmfd_on'] = 0
+        f.attrs['tallies_present'] = 1 if tallies else 0
+        f.attrs['source_present'] = 0
+
+        f['seed'] = seed
+        f['energy_mode'] = np.string_('continuous-energy')
+        f['run_mode'] = np.string_('eigenvalue')
+        f['n_particles'] = 1000
+        f['n_batches'] = n
+        f['current_batch'] = n
+        f['n_inactive'] = 0
+        f['generations_per_batch'] = 1
+        f['k_generation'] = k_samples[:, 2]
+        f['entropy'] = np.zeros(n)
+
+        # Cross products and combined estimate of k-effective
+        f['k_col_abs'] = np.sum(k_samples[:, 0]*k_samples[:, 1])
+        f['k_col_tra'] = np.sum(k_samples[:, 0]*k_samples[:, 2])
+        f['k_abs_tra'] = np.sum(k_samples[:, 1]*k_samples[:, 2])
+        mean = k_samples.mean(axis=0)
+        f['k_combined'] = [mean.mean(), k_samples.std() / np.sqrt(n)]
+
+        # Global tallies with columns for the value, sum and sum of squares
+        global_tallies = np.zeros((4, 3))
+        global_tallies[:3, 1] = k_samples.sum(axis=0)
+        global_tallies[:3, 2] = (k_samples**2).sum(axis=0)
+        f['n_realizations'] = n
+        f['global_tallies'] = global_tallies
+
+        tallies_group = f.create_group('tallies')
+        tallies_group.attrs['n_tallies'] = len(tallies)
+        if tallies:
+            tallies_group.attrs['ids'] = [t['id'] for t in tallies]
+        meshes_group = tallies_group.create_group('meshes')
+        meshes_group.attrs['n_meshes'] = 0
+
+        for tally in tallies:
+            group = tallies_group.create_group('tally {}'.format(tally['id']))
+            group['name'] = np.string_(tally.get('name', ''))
+            group['estimator'] = np.string_('tracklength')
+            group['n_realizations'] = tally.get('n_realizations', n)
+            group['n_filters'] = len(tally['filters'])
+            for j, (filter_type, bins, n_bins) in enumerate(tally['filters']):
+                filter_group = group.create_group('filter {}'.format(j + 1))
+                filter_group['type'] = np.string_(filter_type)
+                filter_group['n_bins'] = n_bins
+                filter_group['bins'] = bins
+            group['nuclides'] = _strings(tally['nuclides'])
+            group['n_score_bins'] = len(tally['scores'])
+            group['score_bins'] = _strings(tally['scores'])
+            group['n_user_scores'] = len(tally['scores'])
+            group['moment_orders'] = _strings([''] * len(tally['scores']))
+            group['results'] = tally['results']
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import sys
+from xml.etree import ElementTree as ET
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import h5py
+import openmc.data
+import openmc.data.conversion
+from openmc.data.ace import Library, ascii_to_binary, _read_headers, \
+    _read_table
+
+
+def thermal_table(name, temperature, zaid, rng):
+    """Return the lines of an ASCII ACE thermal scattering table with equally
+    probable outgoing energies and cosines and no elastic scattering."""
+    n_energy, n_energy_out, n_mu = 3, 2, 2
+    energy = [1.e-11, 1.e-8, 4.e-6]
+    xs = rng.uniform(1., 10., n_energy)
+    itie = [n_energy] + energy + list(xs)
+    itxe = []
+    for i in range(n_energy):
+        for j in range(n_energy_out):
+            itxe.append(energy[i]*(j + 0.5))
+            itxe.extend(np.linspace(-1., 1., n_mu + 1))
+    xss = itie + itxe
+
+    nxs = [len(xss), 1, n_mu, n_energy_out] + [0]*12
+    jxs = [1, 0, len(itie) + 1] + [0]*29
+    pairs = [(zaid, 0.)] + [(0, 0.)]*15
+
+    lines = ['{:>10}{:12.6f}{:12.4E} {:>10}\n'.format(
+                 name, 0.99917, temperature, '01/01/17'),
+             '{:<70}{:>10}\n'.format('synthetic thermal table', 'mat1')]
+    for k in range(0, 16, 4):
+        lines.append(''.join('{:7d}{:11.0f}'.format(*p)
+                             for p in pairs[k:k+4]) + '\n')
+    for values in (nxs, jxs):
+        for k in range(0, len(values), 8):
+            lines.append(''.join('{:9d}'.format(v)
+                                 for v in values[k:k+8]) + '\n')
+    for k in range(0, len(xss), 4):
+        lines.append(''.join('{:20.11E}'.format(v)
+                             for v in xss[k:k+4]) + '\n')
+    return lines
+
+
+class AceToHdf5TestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+        rng = np.random.RandomState(1)
+
+        # Two temperatures of water separated by graphite in one library
+        tables = [('lwtr.10t', 2.53e-8, 1001), ('grph.10t', 2.53e-8, 6000),
+                  ('lwtr.11t', 5.1704e-8, 1001)]
+        with open('thermal.ace', 'w') as fh:
+            for name, temperature, zaid in tables:
+                fh.writelines(thermal_table(name, temperature, zaid, rng))
+        ascii_to_binary('thermal.ace', 'thermal.bin')
+
+        # Tables read from the positions of their headers are the same as
+        # tables found by scanning the library
+        for filename in ('thermal.ace', 'thermal.bin'):
+            headers = _read_headers(filename)
+            assert [h[0] for h in headers] == [t[0] for t in tables]
+            assert headers[0][2] == 0
+            for name, temperature, position in headers:
+                table = _read_table(filename, name, position)
+                reference = Library(filename, name).tables[0]
+                assert table.name == name
+                assert table.temperature == temperature
+                assert np.array_equal(table.xss, reference.xss)
+
+        # Convert the library and count the conversions of each material
+        converted = []
+        convert_tables = openmc.data.conversion._convert_tables
+
+        def counting_convert(args):
+            converted.append(args[0])
+            return convert_tables(args)
+
+        openmc.data.conversion._convert_tables = counting_convert
+        try:
+            library = openmc.data.ace_to_hdf5(
+                'thermal.ace', 'library', processes=1, verbose=False)
+            assert converted == ['c_H_in_H2O', 'c_Graphite']
+
+            # Both temperatures of water are written to one file
+            with h5py.File(os.path.join('library', 'c_H_in_H2O.h5'),
+                           'r') as f:
+                kTs = sorted(f['c_H_in_H2O']['kTs'])
+                assert kTs == ['294K', '600K']
+            water = openmc.data.ThermalScattering.from_hdf5(
+                os.path.join('library', 'c_H_in_H2O.h5'))
+            for name, temperature in (('lwtr.10t', '294K'),
+                                      ('lwtr.11t', '600K')):
+                reference = openmc.data.ThermalScattering.from_ace(
+                    Library('thermal.ace', name).tables[0])
+                assert np.allclose(water.inelastic_xs[temperature].y,
+                                   reference.inelastic_xs[temperature].y)
+                outstr += ' '.join('{:.6e}'.format(x) for x in
+                                   water.inelastic_xs[temperature].y) + '\n'
+
+            # The cross_sections.xml file lists each material once
+            root = ET.parse(os.path.join('library',
+                                         'cross_sections.xml')).getroot()
+            for element in root.findall('library'):
+                outstr += '{} {} {}\n'.format(
+                    element.get('materials'), element.get('path'),
+                    element.get('type'))
+            assert len(library.libraries) == 2
+
+            # A resumed conversion skips materials that were converted
+            os.remove(os.path.join('library', 'c_Graphite.h5'))
+            del converted[:]
+            openmc.data.ace_to_hdf5('thermal.ace', 'library', processes=1,
+                                    verbose=False)
+            assert converted == ['c_Graphite']
+
+            # Materials missing a temperature are converted again
+            del converted[:]
+            shutil.copy('thermal.ace', 'hot.ace')
+            with open('hot.ace', 'a') as fh:
+                fh.writelines(thermal_table('lwtr.12t', 8.6173e-8, 1001, rng))
+            openmc.data.ace_to_hdf5('hot.ace', 'library', processes=1,
+                                    verbose=False)
+            assert converted == ['c_H_in_H2O']
+
+            # Everything is converted again when overwriting
+            del converted[:]
+            openmc.data.ace_to_hdf5('thermal.ace', 'library', processes=1,
+                                    overwrite=True, verbose=False)
+            assert converted == ['c_H_in_H2O', 'c_Graphite']
+        finally:
+            openmc.data.conversion._convert_tables = convert_tables
+
+        return outstr
+
+    def _cleanup(self):
+        super(AceToHdf5TestHarness, self)._cleanup()
+        for f in ('thermal.ace', 'thermal.bin', 'hot.ace'):
+            if os.path.exists(f):
+                os.remove(f)
+        if os.path.isdir('library'):
+            shutil.rmtree('library')
+
+
+if __name__ == '__main__':
+    harness = AceToHdf5TestHarness()
+    harness.main()
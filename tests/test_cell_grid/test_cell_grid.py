@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc
+
+
+def linear_search(universe, points):
+    """Find the first cell of a universe containing each point."""
+    cell_ids = np.full(len(points), -1, dtype=int)
+    for k, point in enumerate(points):
+        for cell in universe.cells.values():
+            if tuple(point) in cell:
+                cell_ids[k] = cell.id
+                break
+    return cell_ids
+
+
+class CellGridTestHarness(PyAPIUnitTestHarness):
+    def _check(self, universe, points):
+        """Compare the grid searches of a universe with a linear search."""
+        expected = linear_search(universe, points)
+        found = np.array([universe.find(p)[-1].id if universe.find(p)
+                          else -1 for p in points])
+        assert np.array_equal(found, expected)
+        cell_ids, _ = universe.find_many(points)
+        assert np.array_equal(cell_ids, expected)
+        ids, counts = np.unique(expected, return_counts=True)
+        return ' '.join('{}:{}'.format(*c) for c in zip(ids, counts)) + '\n'
+
+    def _get_results(self):
+        water = openmc.Material(material_id=1)
+
+        # Boxes of a 6 x 6 grid, a few spheres, and a cell for the remainder
+        x = [openmc.XPlane(surface_id=1 + i, x0=float(i)) for i in range(7)]
+        y = [openmc.YPlane(surface_id=11 + i, y0=float(i)) for i in range(7)]
+        boxes = []
+        for j in range(6):
+            for i in range(6):
+                boxes.append(openmc.Cell(
+                    cell_id=100 + 6*j + i, fill=water,
+                    region=+x[i] & -x[i+1] & +y[j] & -y[j+1]))
+        s = [openmc.Sphere(surface_id=21 + i, x0=2.*i, y0=-2., R=0.9)
+             for i in range(4)]
+        spheres = [openmc.Cell(cell_id=200 + i, fill=water, region=-s[i])
+                   for i in range(4)]
+        outside = openmc.Cell(cell_id=300, fill=water,
+                              region=~(+x[0] & -x[6] & +y[0] & -y[6]))
+        universe = openmc.Universe(universe_id=1,
+                                   cells=spheres + boxes + [outside])
+
+        rng = np.random.RandomState(1)
+        points = rng.uniform(-4., 9., (2000, 3))
+        points[:, 2] = 0.
+
+        outstr = self._check(universe, points)
+        grid = universe._cell_grid()
+        assert grid is not None
+
+        # Other geometry and the fills of the cells do not affect the grid
+        other = openmc.Sphere(R=1.)
+        openmc.Universe(cells=[openmc.Cell(fill=water, region=-other)])
+        other.r = 2.
+        boxes[1].fill = openmc.Material(material_id=2)
+        assert universe._cell_grid() is grid
+
+        # Move a surface
+        x[3].x0 = 4.5
+        s[1].r = 2.5
+        outstr += self._check(universe, points)
+
+        # Replace the region of a cell
+        boxes[0].region = +x[0] & -x[2] & -y[6] & +y[4]
+        outstr += self._check(universe, points)
+
+        # Restrict the region of a cell by adding a surface
+        boxes[7].add_surface(x[6], -1)
+        boxes[8].add_surface(openmc.YPlane(surface_id=31, y0=1.5), -1)
+        outstr += self._check(universe, points)
+
+        # Modify the nodes of a region in place
+        boxes[9].region.nodes[0] = +x[2]
+        outstr += self._check(universe, points)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = CellGridTestHarness()
+    harness.main()
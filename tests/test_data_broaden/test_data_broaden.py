@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc.data
+from openmc.data import Tabulated1D
+
+
+def reference_xs(energy, xs, awr, kT, E):
+    """Broaden by direct quadrature of the free-gas kernel."""
+    alpha = awr/kT
+    y = np.sqrt(E)
+    x = np.linspace(max(y - 6./np.sqrt(alpha), 1e-12),
+                    y + 6./np.sqrt(alpha), 400001)
+    sigma = np.interp(x**2, energy, xs)
+    kernel = x**2*sigma*(np.exp(-alpha*(x - y)**2) -
+                         np.exp(-alpha*(x + y)**2))
+    return np.sqrt(alpha/np.pi)/y**2*np.trapz(kernel, x)
+
+
+class BroadenTestHarness(PyAPIUnitTestHarness):
+    # Energies at which the broadened cross sections are checked
+    _energies = np.array([0.0253, 1., 6.6, 6.7, 6.75, 1.e3, 1.e6])
+
+    def _build_nuclide(self):
+        # Resolve the resonance and include the energies that are checked
+        energy = np.union1d(np.logspace(-3, 7, 2000),
+                            np.linspace(6., 7.4, 1401))
+        energy = np.union1d(energy, self._energies)
+        kT = 293.6*openmc.data.K_BOLTZMANN
+        data = openmc.data.IncidentNeutron('Xx100', 50, 100, 0, 99., [kT])
+        data.energy['294K'] = energy
+
+        def reaction(mt, threshold_idx, xs):
+            rx = openmc.data.Reaction(mt)
+            E = energy[threshold_idx:]
+            rx.xs['294K'] = Tabulated1D(E, xs(E))
+            rx.xs['294K']._threshold_idx = threshold_idx
+            data.reactions[mt] = rx
+
+        reaction(2, 0, lambda E: 4. + 0.*E)
+        reaction(51, 2000, lambda E: 0.5 + 0.*E)
+        reaction(102, 0, lambda E: 1./np.sqrt(E) +
+                 30.*np.exp(-((E - 6.7)/0.05)**2))
+        return data
+
+    def _get_results(self):
+        self._build_nuclide().export_to_hdf5('Xx100.h5', 'w')
+
+        energies = self._energies
+        outstr = ''
+        for lazy in (False, True):
+            data = openmc.data.IncidentNeutron.from_hdf5('Xx100.h5',
+                                                         lazy=lazy)
+            data.broaden(600.)
+            assert data.temperatures == ['294K', '600K']
+
+            # Summed reactions are rebuilt from the broadened components
+            total = data[1].xs['600K'](energies)
+            parts = sum(data[mt].xs['600K'](energies) for mt in (2, 51, 102))
+            assert np.allclose(total, parts, rtol=1e-12)
+
+            outstr += 'lazy={}\n'.format(lazy)
+            kT = data.kTs[1] - data.kTs[0]
+            for mt in (2, 51, 102):
+                xs = data[mt].xs['600K'](energies)
+                source = data[mt].xs['294K']
+                energy = data.energy['294K']
+                reference = [reference_xs(energy, np.interp(
+                    energy, source.x, source.y, left=0.), data.atomic_weight_ratio,
+                    kT, E) for E in energies]
+                assert np.allclose(xs, reference, rtol=1e-4, atol=1e-8), mt
+                outstr += 'MT{}\n'.format(mt)
+                outstr += '\n'.join('{:12.6E}'.format(x) for x in xs) + '\n'
+        return outstr
+
+    def _cleanup(self):
+        super(BroadenTestHarness, self)._cleanup()
+        if os.path.exists('Xx100.h5'):
+            os.remove('Xx100.h5')
+
+
+if __name__ == '__main__':
+    harness = BroadenTestHarness()
+    harness.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import glob
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import openmc.data
+
+
+def write_library(path, nuclides):
+    """Write a cross_sections.xml file listing neutron data files."""
+    with open(path, 'w') as fh:
+        fh.write('<?xml version="1.0"?>\n<cross_sections>\n')
+        for nuclide in nuclides:
+            fh.write('  <library materials="{0}" path="{0}.h5" '
+                     'type="neutron" />\n'.format(nuclide))
+        fh.write('</cross_sections>\n')
+
+
+class DataCacheTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        write_library('library_a.xml', ['H1', 'O16'])
+        write_library('library_b.xml', ['U235', 'U238', 'Pu239'])
+        size_a = os.path.getsize('library_a.xml')
+        size_b = os.path.getsize('library_b.xml')
+
+        # Libraries count towards the size of the cache
+        cache = openmc.data.DataCache(size_a + size_b)
+        a = cache.get_library('library_a.xml')
+        b = cache.get_library('library_b.xml')
+        assert cache.get_library('library_a.xml') is a
+        assert len(cache) == 2
+        assert cache.size == size_a + size_b
+        for library in (a, b):
+            outstr += ' '.join(library.libraries[i]['materials'][0]
+                               for i in range(len(library.libraries))) + '\n'
+
+        # The least recently used library is evicted once the budget is
+        # exceeded
+        cache.memory_budget = size_a
+        assert len(cache) == 1
+        assert cache.size == size_a
+        assert cache.get_library('library_a.xml') is a
+        assert cache.get_library('library_b.xml') is not b
+        assert len(cache) == 1
+        assert cache.size == size_b
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+        outstr += '{} {}\n'.format(len(cache), cache.size)
+
+        return outstr
+
+    def _cleanup(self):
+        super(DataCacheTestHarness, self)._cleanup()
+        for f in glob.glob('library_*.xml'):
+            os.remove(f)
+
+
+if __name__ == '__main__':
+    harness = DataCacheTestHarness()
+    harness.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+
+
+def summary(cells):
+    """Return a Summary holding a geometry with the given cells."""
+    universe = openmc.Universe(universe_id=0, cells=cells)
+    s = object.__new__(openmc.Summary)
+    s._geometry = openmc.Geometry(universe)
+    return s
+
+
+class DistribcellLinkTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        # Cell 1 is reached both directly and through a lattice, so its
+        # paths traverse different levels of the CSG tree. Cell 2 has paths
+        # of a single structure.
+        cell1 = openmc.Cell(cell_id=1)
+        cell1.distribcell_paths = ['0->1', '0->3->100(1,1,1)->10->1',
+                                   '0->3->100(2,1,1)->10->1']
+        cell2 = openmc.Cell(cell_id=2)
+        cell2.distribcell_paths = ['0->3->100(1,1,1)->10->2',
+                                   '0->3->100(2,1,1)->10->2']
+
+        data = np.zeros((3, 1, 2))
+        data[:, 0, 0] = [1., 2., 3.]
+        data[:, 0, 1] = [1., 4., 9.]
+        tallies = [
+            {'id': 1, 'filters': [('distribcell', [1], 3)],
+             'nuclides': ['total'], 'scores': ['flux'], 'results': data},
+            {'id': 2, 'filters': [('distribcell', [2], 2)],
+             'nuclides': ['total'], 'scores': ['flux'],
+             'results': data[:2]}]
+        write_statepoint('statepoint.10.h5', tallies)
+
+        # Linking succeeds regardless of how the paths are structured
+        sp = openmc.StatePoint('statepoint.10.h5')
+        sp.link_with_summary(summary([cell1, cell2]))
+
+        # Paths of different structure are only rejected when parsed
+        filter1 = sp.get_tally(id=1).filters[0]
+        assert filter1.distribcell_paths == cell1.distribcell_paths
+        try:
+            filter1.levels
+        except ValueError:
+            outstr += 'mixed paths rejected\n'
+        df = sp.get_tally(id=1).get_pandas_dataframe(distribcell_paths=False)
+        outstr += ' '.join('{:.6e}'.format(x) for x in
+                           df['mean'].values.ravel()) + '\n'
+
+        df = sp.get_tally(id=2).get_pandas_dataframe()
+        for column in df.columns:
+            if column[0] in ('nuclide', 'score'):
+                continue
+            outstr += '{} {}\n'.format(column, ' '.join(
+                '{:.6e}'.format(x) for x in df[column].values.ravel()))
+        sp.close()
+
+        # Paths with the same number of tokens but different levels are
+        # rejected rather than misread
+        try:
+            openmc.filter._parse_distribcell_paths(
+                ['0->1->2->3->4->5', '0->1->2(1,1,1)->5'])
+        except ValueError:
+            outstr += 'mismatched levels rejected\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = DistribcellLinkTestHarness()
+    harness.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+from collections import OrderedDict
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc
+
+
+def lattice_elements(lattice):
+    """Yield the offset array indices, path indices, and universe of each
+    element of a lattice in the order in which OpenMC assigns offsets."""
+    if isinstance(lattice, openmc.HexLattice):
+        n = lattice.num_rings
+        for l in range(2*n - 1):
+            for k in range(2*n - 1):
+                idx = (k - n + 1, l - n + 1)
+                if lattice.is_valid_index(idx):
+                    yield (0, l, k), idx + (1,), lattice._get_universe(idx)
+    else:
+        ny, nx = lattice.universes.shape
+        for l in range(ny):
+            for k in range(nx):
+                yield (0, l, k), (k + 1, l + 1, 1), lattice.universes[l][k]
+
+
+def assign_offsets(universe, targets, counts):
+    """Assign distribcell offsets below a universe and return the number of
+    instances of each target in it."""
+    if universe.id in counts:
+        return counts[universe.id]
+    total = np.zeros(len(targets), dtype=int)
+    for cell in universe.cells.values():
+        if cell.fill_type == 'universe':
+            cell.offsets = total.copy()
+            total += assign_offsets(cell.fill, targets, counts)
+        elif cell.fill_type == 'lattice':
+            # Lattice offsets continue from the count in the universe
+            lattice = cell.fill
+            shape = (1,) + (2*lattice.num_rings - 1,)*2 if \
+                isinstance(lattice, openmc.HexLattice) else \
+                (1,) + lattice.universes.shape
+            offsets = np.zeros(shape + (len(targets),), dtype=int)
+            for idx, _, u in lattice_elements(lattice):
+                offsets[idx] = total
+                total += assign_offsets(u, targets, counts)
+            lattice.offsets = offsets
+        else:
+            total += [cell is t for t in targets]
+    counts[universe.id] = total
+    return total
+
+
+def enumerate_paths(universe, target, prefix=''):
+    """Return the paths to every instance of a target cell in order."""
+    paths = []
+    for cell in universe.cells.values():
+        path = '{}{}->{}'.format(prefix, universe.id, cell.id)
+        if cell is target:
+            paths.append(path)
+        elif cell.fill_type == 'universe':
+            paths += enumerate_paths(cell.fill, target, path + '->')
+        elif cell.fill_type == 'lattice':
+            for _, idx, u in lattice_elements(cell.fill):
+                paths += enumerate_paths(
+                    u, target, '{}->{}({},{},{})->'.format(
+                        path, cell.fill.id, *idx))
+    return paths
+
+
+class DistribcellOffsetsTestHarness(PyAPIUnitTestHarness):
+    def _build_geometry(self):
+        fuel = openmc.Material(material_id=1)
+        water = openmc.Material(material_id=2)
+
+        r = openmc.ZCylinder(surface_id=1, R=0.3)
+        c10 = openmc.Cell(cell_id=10, fill=fuel, region=-r)
+        c11 = openmc.Cell(cell_id=11, fill=water, region=+r)
+        pin = openmc.Universe(universe_id=5, cells=(c10, c11))
+
+        c20 = openmc.Cell(cell_id=20, fill=pin)
+        wrapper = openmc.Universe(universe_id=6, cells=(c20,))
+
+        c30 = openmc.Cell(cell_id=30, fill=water)
+        moderator = openmc.Universe(universe_id=7, cells=(c30,))
+
+        rect = openmc.RectLattice(lattice_id=100)
+        rect.lower_left = (-1.5, -1.5)
+        rect.pitch = (1., 1.)
+        rect.universes = [[wrapper]*3]*3
+
+        hexagonal = openmc.HexLattice(lattice_id=200)
+        hexagonal.center = (0., 0.)
+        hexagonal.pitch = (1.,)
+        hexagonal.universes = [[pin, moderator]*6, [wrapper, pin, pin]*2,
+                               [moderator]]
+
+        x = openmc.XPlane(surface_id=2, x0=2.)
+        c1 = openmc.Cell(cell_id=1, fill=rect, region=-x)
+        c2 = openmc.Cell(cell_id=2, fill=hexagonal, region=+x)
+        root = openmc.Universe(universe_id=0, cells=(c1, c2))
+
+        c10.distribcell_index = 1
+        c11.distribcell_index = 2
+        assign_offsets(root, [c10, c11], {})
+        return openmc.Geometry(root), [c10, c11]
+
+    def _get_results(self):
+        geometry, targets = self._build_geometry()
+        root = geometry.root_universe
+
+        outstr = ''
+        for target in targets:
+            paths = enumerate_paths(root, target)
+
+            # Paths through different lattice elements may traverse
+            # different numbers of CSG levels
+            groups = OrderedDict()
+            for n, path in enumerate(paths):
+                groups.setdefault(path.count('->'), []).append(n)
+
+            instances = np.empty(len(paths), dtype=int)
+            for group in groups.values():
+                group_paths = [paths[n] for n in group]
+                instances[group] = geometry.get_cell_instances(group_paths)
+                instances_single = [geometry.get_cell_instance(p)
+                                    for p in group_paths]
+                instances_recursive = [root.get_cell_instance(
+                    p, target.distribcell_index) for p in group_paths]
+                assert instances_single == instances_recursive
+                assert list(instances[group]) == instances_single
+
+            assert list(instances) == list(range(len(paths)))
+            outstr += 'cell {}\n'.format(target.id)
+            for path, instance in zip(paths, instances):
+                outstr += '{} {}\n'.format(path, instance)
+
+        # Paths must end at cells filled with materials
+        try:
+            geometry.get_cell_instance('0->1->100(1,1,1)->6->20')
+        except ValueError:
+            outstr += 'fill cell rejected\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = DistribcellOffsetsTestHarness()
+    harness.main()
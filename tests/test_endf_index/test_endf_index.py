@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+import glob
+import os
+import resource
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import openmc.data
+from openmc.data.endf import get_evaluations, get_section_index
+
+
+def record(fields, mat, mf, mt):
+    """Return a line of an ENDF file with six 11-character fields."""
+    text = ''.join('{:>11}'.format(x) for x in fields)
+    return '{:<66}{:4d}{:2d}{:3d}{:5d}\n'.format(text, mat, mf, mt, 0)
+
+
+def material(mat, za, awr):
+    """Return the lines of a material with a header and one cross section."""
+    lines = [
+        record([za, awr, 0, 0, 0, 0], mat, 1, 451),
+        record(['0.000000+0', '0.000000+0', 0, 0, 0, 6], mat, 1, 451),
+        record(['1.000000+0', '2.000000+7', 0, 0, 10, 8], mat, 1, 451),
+        record(['0.000000+0', '0.000000+0', 0, 0, 0, 3], mat, 1, 451),
+        record(['', '', 1, 451, 6, 0], mat, 1, 451),
+        record(['', '', 3, 1, 4, 0], mat, 1, 451),
+        record(['', '', 3, 2, 4, 0], mat, 1, 451),
+        record([], mat, 1, 0),
+        record([], mat, 0, 0),
+        record([za, awr, 0, 0, 0, 0], mat, 3, 1),
+        record(['0.000000+0', '0.000000+0', 0, 0, 1, 2], mat, 3, 1),
+        record([2, 2, '', '', '', ''], mat, 3, 1),
+        record(['1.000000-5', '2.000000+1', '2.000000+7', '1.000000+0',
+                '', ''], mat, 3, 1),
+        record([za, awr, 0, 0, 0, 0], mat, 3, 2),
+        record(['0.000000+0', '0.000000+0', 0, 0, 1, 2], mat, 3, 2),
+        record([2, 2, '', '', '', ''], mat, 3, 2),
+        record(['1.000000-5', '2.000000+1', '2.000000+7', '1.000000+0',
+                '', ''], mat, 3, 2),
+        record([], mat, 3, 0),
+        record([], mat, 0, 0),
+        record([], 0, 0, 0)]
+    return ''.join(lines)
+
+
+class EndfIndexTestHarness(PyAPIUnitTestHarness):
+    _filename = 'tape.endf'
+
+    def _get_results(self):
+        outstr = ''
+
+        with open(self._filename, 'w') as fh:
+            fh.write('{:<66}{:4d}{:2d}{:3d}{:5d}\n'.format(
+                ' Test tape', 1, 0, 0, 0))
+            fh.write(material(125, '1.001000+3', '9.991673-1'))
+            fh.write(material(825, '8.016000+3', '1.586751+1'))
+            fh.write(record([], -1, 0, 0))
+        index_file = self._filename + '.idx'
+
+        # The cache is written in place of a temporary file with the same
+        # permissions as the ENDF file
+        os.chmod(self._filename, 0o640)
+        index = get_section_index(self._filename)
+        assert os.path.isfile(index_file)
+        assert os.stat(index_file).st_mode & 0o777 == 0o640
+        assert glob.glob('*.idx') == [index_file]
+        for entry in index:
+            outstr += ' '.join(str(x) for x in entry) + '\n'
+
+        # Unreadable caches are rebuilt
+        with open(index_file, 'rb') as fh:
+            contents = fh.read()
+        for corrupt in (contents[:len(contents)//2], b'', b'not an index'):
+            with open(index_file, 'wb') as fh:
+                fh.write(corrupt)
+            assert (get_section_index(self._filename) == index).all()
+            with open(index_file, 'rb') as fh:
+                assert fh.read() == contents
+
+        # Sections that were read remain available after the file is closed
+        # while others can no longer be read
+        evaluations = get_evaluations(self._filename)
+        for ev in evaluations:
+            outstr += '{} {} {}\n'.format(ev.gnd_name, ev.material,
+                                          ev.reaction_list)
+        xs = evaluations[0].section[3, 1]
+        evaluations[0].close()
+        assert evaluations[0].section[3, 1] == xs
+        outstr += xs
+        try:
+            evaluations[0].section[3, 2]
+        except ValueError:
+            outstr += 'closed section rejected\n'
+
+        # Closing one evaluation leaves the others readable, and the shared
+        # mapping is released with the last of them
+        mapped = evaluations[1].section._mapped
+        assert evaluations[0].section._mapped is mapped
+        outstr += evaluations[1].section[3, 1]
+        assert mapped.data is not None
+        evaluations[1].close()
+        assert mapped.data is None
+
+        with openmc.data.endf.Evaluation(self._filename) as ev:
+            outstr += '{} {}\n'.format(ev.gnd_name, ev.target['mass'])
+        assert ev.section._data is None
+
+        # Materials of a tape share one file descriptor, so tapes with more
+        # materials than the limit of open files can be read
+        n_materials = 400
+        with open(self._filename, 'w') as fh:
+            fh.write('{:<66}{:4d}{:2d}{:3d}{:5d}\n'.format(
+                ' Test tape', 1, 0, 0, 0))
+            for i in range(n_materials):
+                fh.write(material(1000 + i, '1.001000+3', '9.991673-1'))
+            fh.write(record([], -1, 0, 0))
+
+        limits = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (256, limits[1]))
+        try:
+            evaluations = get_evaluations(self._filename)
+            assert len(evaluations) == n_materials
+            outstr += evaluations[-1].section[3, 2]
+            for ev in evaluations:
+                ev.close()
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, limits)
+        assert evaluations[0].section._mapped.data is None
+
+        return outstr
+
+    def _cleanup(self):
+        super(EndfIndexTestHarness, self)._cleanup()
+        for f in [self._filename] + glob.glob('*.idx'):
+            if os.path.exists(f):
+                os.remove(f)
+
+
+if __name__ == '__main__':
+    harness = EndfIndexTestHarness()
+    harness.main()
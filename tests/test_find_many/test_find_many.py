@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc
+
+
+class FindManyTestHarness(PyAPIUnitTestHarness):
+    def _build_geometry(self):
+        fuel = openmc.Material(material_id=1)
+        clad = openmc.Material(material_id=2)
+        water = openmc.Material(material_id=3)
+
+        # Pin and guide tube universes
+        r1 = openmc.ZCylinder(surface_id=1, R=0.4)
+        r2 = openmc.ZCylinder(surface_id=2, R=0.45)
+        c1 = openmc.Cell(cell_id=1, fill=fuel, region=-r1)
+        c2 = openmc.Cell(cell_id=2, fill=clad, region=+r1 & -r2)
+        c3 = openmc.Cell(cell_id=3, fill=water, region=+r2)
+        pin = openmc.Universe(universe_id=1, cells=(c1, c2, c3))
+
+        s = openmc.Sphere(surface_id=3, R=0.3)
+        c4 = openmc.Cell(cell_id=4, region=-s)
+        c5 = openmc.Cell(cell_id=5, fill=water, region=+s)
+        tube = openmc.Universe(universe_id=2, cells=(c4, c5))
+
+        c6 = openmc.Cell(cell_id=6, fill=water)
+        outer = openmc.Universe(universe_id=3, cells=(c6,))
+
+        # Rectangular lattice
+        rect = openmc.RectLattice(lattice_id=1)
+        rect.lower_left = (-1.5, -1.5)
+        rect.pitch = (1., 1.)
+        rect.universes = [[pin, tube, pin], [tube, pin, pin], [pin, pin, tube]]
+        rect.outer = outer
+
+        # Hexagonal lattice in a translated and rotated universe
+        hexagonal = openmc.HexLattice(lattice_id=2)
+        hexagonal.center = (0., 0.)
+        hexagonal.pitch = (1.,)
+        hexagonal.universes = [[pin]*12, [tube]*6, [pin]]
+        hexagonal.outer = outer
+        c7 = openmc.Cell(cell_id=7, fill=hexagonal)
+        hex_univ = openmc.Universe(universe_id=4, cells=(c7,))
+
+        x0 = openmc.XPlane(surface_id=4, x0=-1.5)
+        x1 = openmc.XPlane(surface_id=5, x0=1.5)
+        x2 = openmc.XPlane(surface_id=6, x0=6.)
+        y0 = openmc.YPlane(surface_id=7, y0=-3.5)
+        y1 = openmc.YPlane(surface_id=8, y0=3.5)
+        q = openmc.Quadric(surface_id=9, a=1., b=1., k=-0.1)
+        c8 = openmc.Cell(cell_id=8, fill=rect,
+                         region=+x0 & -x1 & +y0 & -y1 & ~(-q))
+        c9 = openmc.Cell(cell_id=9, fill=hex_univ,
+                         region=+x1 & -x2 & +y0 & -y1)
+        c9.translation = (3.75, 0., 0.)
+        c9.rotation = (0., 0., 30.)
+        c10 = openmc.Cell(cell_id=10, fill=fuel, region=-q)
+        root = openmc.Universe(universe_id=0, cells=(c8, c9, c10))
+
+        return openmc.Geometry(root)
+
+    def _get_results(self):
+        geometry = self._build_geometry()
+
+        prng = np.random.RandomState(1)
+        points = np.column_stack((prng.uniform(-2., 6.5, 5000),
+                                  prng.uniform(-4., 4., 5000),
+                                  prng.uniform(-1., 1., 5000)))
+        cell_ids, material_ids = geometry.find_many(points)
+
+        # Check the batched results against the location of single points
+        for point, cell_id, material_id in zip(points, cell_ids,
+                                               material_ids):
+            path = geometry.find(point.copy())
+            cell = path[-1] if path else None
+            expected_cell = cell.id if cell is not None else -1
+            expected_material = cell.fill.id if cell is not None and \
+                cell.fill_type == 'material' else -1
+            assert cell_id == expected_cell, point
+            assert material_id == expected_material, point
+
+        empty = geometry.find_many(np.zeros((0, 3)))
+        assert empty[0].size == 0 and empty[1].size == 0
+
+        outstr = 'cell counts:\n'
+        ids, counts = np.unique(cell_ids, return_counts=True)
+        for i, n in zip(ids, counts):
+            outstr += '{} {}\n'.format(i, n)
+        outstr += 'material counts:\n'
+        ids, counts = np.unique(material_ids, return_counts=True)
+        for i, n in zip(ids, counts):
+            outstr += '{} {}\n'.format(i, n)
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = FindManyTestHarness()
+    harness.main()
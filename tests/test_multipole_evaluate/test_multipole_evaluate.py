@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+from scipy.special import erf, wofz
+import openmc.data
+from openmc.data.multipole import _broaden_wmp_polynomials
+
+
+def broadened_term(E, dopp, k):
+    """Doppler broaden the term E**((k - 2)/2) by quadrature of the free-gas
+    kernel."""
+    alpha = dopp**2
+    y = np.sqrt(E)
+    x = np.linspace(max(y - 8./dopp, 1e-12), y + 8./dopp, 200001)
+    kernel = x**k*(np.exp(-alpha*(x - y)**2) - np.exp(-alpha*(x + y)**2))
+    return np.sqrt(alpha/np.pi)/y**2*np.trapz(kernel, x)
+
+
+def make_multipole(formalism, rng):
+    """Return a multipole library with random poles and curvefits."""
+    wmp = openmc.data.WindowedMultipole()
+    n_windows = 20
+    n_residues = 4 if formalism == 'MLBW' else 3
+    wmp.num_l = 3
+    wmp.fit_order = 5
+    wmp.fissionable = True
+    wmp.formalism = formalism
+    wmp.spacing = 0.5
+    wmp.start_E = 1.0
+    wmp.end_E = (1.0 + n_windows*wmp.spacing)**2
+    wmp.sqrtAWR = np.sqrt(235.)
+
+    n_poles = 100
+    data = np.empty((n_poles, n_residues + 1), dtype=complex)
+    data[:, 0] = np.sort(rng.uniform(1., 1. + n_windows*wmp.spacing,
+                                     n_poles)) + 0.02j*rng.uniform(-1, 1,
+                                                                   n_poles)
+    data[:, 1:] = (rng.normal(size=(n_poles, n_residues)) +
+                   1j*rng.normal(size=(n_poles, n_residues)))
+    wmp.data = data
+    wmp.pseudo_k0RS = rng.uniform(0.001, 0.003, wmp.num_l)
+    wmp.l_value = rng.randint(1, wmp.num_l + 1, n_poles)
+
+    # Each window holds the poles near it and every fifth window is empty
+    w_start = np.zeros(n_windows, dtype=int)
+    w_end = np.zeros(n_windows, dtype=int)
+    for i in range(n_windows):
+        lo = 1. + (i - 1)*wmp.spacing
+        hi = 1. + (i + 2)*wmp.spacing
+        poles = np.flatnonzero((data[:, 0].real >= lo) &
+                               (data[:, 0].real < hi))
+        if i % 5 == 3 or poles.size == 0:
+            w_start[i], w_end[i] = 0, -1
+        else:
+            w_start[i], w_end[i] = poles[0] + 1, poles[-1] + 1
+    wmp.w_start = w_start
+    wmp.w_end = w_end
+    wmp.broaden_poly = np.arange(n_windows) % 2 == 0
+    wmp.curvefit = rng.normal(size=(n_windows, wmp.fit_order + 1, 3))
+    return wmp
+
+
+def reference_xs(wmp, E, T):
+    """Evaluate the cross sections at one energy term by term."""
+    if E < wmp.start_E or E >= wmp.end_E:
+        return np.zeros(3)
+
+    sqrtkT = np.sqrt(openmc.data.K_BOLTZMANN*T)
+    sqrtE = np.sqrt(E)
+    i_window = int((sqrtE - np.sqrt(wmp.start_E)) // wmp.spacing)
+
+    # Phase shifts of the hard-sphere potential scattering
+    rho = wmp.pseudo_k0RS*sqrtE
+    phi = rho.copy()
+    phi[1] = rho[1] - np.arctan(rho[1])
+    phi[2] = rho[2] - np.arctan(3.*rho[2]/(3. - rho[2]**2))
+    factor = np.exp(-2j*phi)
+
+    xs = np.zeros(3)
+    for k in range(wmp.fit_order + 1):
+        if T > 0 and wmp.broaden_poly[i_window]:
+            term = broadened_term(E, wmp.sqrtAWR/sqrtkT, k)
+        else:
+            term = E**((k - 2.)/2.)
+        xs += wmp.curvefit[i_window, k]*term
+
+    for i in range(wmp.w_start[i_window] - 1, wmp.w_end[i_window]):
+        pole = wmp.data[i, 0]
+        if T == 0:
+            w = -1j/(pole - sqrtE)/E
+        else:
+            dopp = wmp.sqrtAWR/sqrtkT
+            z = (sqrtE - pole)*dopp
+            w = (wofz(z) if z.imag > 0 else -np.conj(wofz(np.conj(z))))
+            w *= dopp/E*np.sqrt(np.pi)
+        residues = wmp.data[i, 1:]
+        f = factor[wmp.l_value[i] - 1]
+        if wmp.formalism == 'MLBW':
+            total = (residues[0]*f + residues[1])*w
+            residues = residues[2:]
+        else:
+            total = residues[0]*f*w
+            residues = residues[1:]
+        xs += [total.real, (residues[0]*w).real, (residues[1]*w).real]
+    return xs
+
+
+class MultipoleEvaluateTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+        rng = np.random.RandomState(2)
+
+        # Broadened curvefit terms match quadrature of the free-gas kernel,
+        # including the highest order terms
+        for E, dopp in ((1.0, 3.0), (0.04, 5.0), (30.0, 2.0)):
+            factors = _broaden_wmp_polynomials(E, dopp, 8)
+            reference = [broadened_term(E, dopp, k) for k in range(8)]
+            assert np.allclose(factors, reference, rtol=1e-8)
+            outstr += ' '.join('{:.8e}'.format(x) for x in factors) + '\n'
+
+        for formalism in ('MLBW', 'RM'):
+            wmp = make_multipole(formalism, rng)
+            E = np.concatenate(([0.5, wmp.start_E, wmp.end_E, 200.],
+                                rng.uniform(wmp.start_E, wmp.end_E, 40)))
+
+            for T in (0., 300., 1200.):
+                xs = np.array(wmp(E, T))
+                reference = np.array([reference_xs(wmp, e, T) for e in E]).T
+                assert np.allclose(xs, reference, rtol=1e-7, atol=1e-10)
+                for x in xs:
+                    outstr += ' '.join('{:.6e}'.format(v) for v in x[:6])
+                    outstr += '\n'
+
+            # Broadening vanishes as the temperature goes to zero
+            E_far = E[np.all(np.abs(np.sqrt(E)[:, np.newaxis] -
+                                    wmp.data[:, 0].real) > 0.05, axis=1)]
+            hot = np.array(wmp(E_far, 1e-4))
+            cold = np.array(wmp(E_far, 0.))
+            assert np.allclose(hot, cold, rtol=1e-6, atol=1e-8)
+
+            # Scalars give scalars and temperatures broadcast over energies
+            scalar = wmp(E[5], 300.)
+            assert all(np.ndim(x) == 0 for x in scalar)
+            table = wmp(E[np.newaxis, :10], np.array([[0.], [300.]]))
+            assert table[1].shape == (2, 10)
+            assert np.allclose(table[1][1], wmp(E[:10], 300.)[1])
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = MultipoleEvaluateTestHarness()
+    harness.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc
+
+
+class PlotRasterTestHarness(PyAPIUnitTestHarness):
+    def _check(self, universe):
+        """Compare the cached raster of a universe with a fresh one."""
+        view = ((0., 0., 0.), (-2., 2., -2., 2.), (40, 40), 'xy', 1)
+        cell_ids, material_ids = universe._cached_raster(*view)
+
+        # The raster is reused as long as the geometry is unchanged
+        cached = universe._cached_raster(*view)
+        assert cached[0] is cell_ids and cached[1] is material_ids
+
+        expected = universe._rasterize(*view)
+        assert np.array_equal(cell_ids, expected[0])
+        assert np.array_equal(material_ids, expected[1])
+
+        ids, counts = np.unique(material_ids, return_counts=True)
+        return ' '.join('{}:{}'.format(*c) for c in zip(ids, counts)) + '\n'
+
+    def _get_results(self):
+        fuel = openmc.Material(material_id=1)
+        clad = openmc.Material(material_id=2)
+        water = openmc.Material(material_id=3)
+
+        r = openmc.ZCylinder(surface_id=1, R=0.4)
+        c1 = openmc.Cell(cell_id=1, fill=fuel, region=-r)
+        c2 = openmc.Cell(cell_id=2, fill=water, region=+r)
+        pin = openmc.Universe(universe_id=1, cells=(c1, c2))
+        c3 = openmc.Cell(cell_id=3, fill=water)
+        moderator = openmc.Universe(universe_id=2, cells=(c3,))
+
+        lattice = openmc.RectLattice(lattice_id=10)
+        lattice.lower_left = (-2., -2.)
+        lattice.pitch = (1., 1.)
+        lattice.universes = [[pin, moderator]*2, [moderator, pin]*2]*2
+        c4 = openmc.Cell(cell_id=4, fill=lattice)
+        core = openmc.Universe(universe_id=3, cells=(c4,))
+        c6 = openmc.Cell(cell_id=6, fill=core)
+        root = openmc.Universe(universe_id=0, cells=(c6,))
+
+        # Check the raster against the cells found at each pixel
+        outstr = self._check(root)
+        cell_ids, _ = root._cached_raster((0., 0., 0.), (-2., 2., -2., 2.),
+                                          (40, 40), 'xy', 1)
+        x = np.linspace(-2., 2., 40, endpoint=False) + 0.05
+        for j, y in enumerate(x[::-1]):
+            for i, xi in enumerate(x):
+                assert root.find((xi, y, 0.))[-1].id == cell_ids[j, i]
+
+        # Constructing and modifying other geometry keeps the raster
+        other = openmc.ZCylinder(R=1.)
+        openmc.Universe(cells=[openmc.Cell(fill=fuel, region=-other)])
+        other.r = 2.
+        cached, _ = root._cached_raster((0., 0., 0.), (-2., 2., -2., 2.),
+                                        (40, 40), 'xy', 1)
+        assert cached is cell_ids
+
+        # Modify each kind of object in the geometry
+        c2.fill = clad
+        outstr += self._check(root)
+        r.r = 0.3
+        outstr += self._check(root)
+        c1.region = -openmc.ZCylinder(surface_id=2, R=0.2)
+        outstr += self._check(root)
+        lattice.universes = [[pin]*4]*4
+        outstr += self._check(root)
+        c5 = openmc.Cell(cell_id=5, fill=fuel, region=-openmc.ZCylinder(
+            surface_id=3, R=0.1))
+        moderator.clear_cells()
+        moderator.add_cells((c5, c3))
+        lattice.universes = [[moderator]*4]*4
+        outstr += self._check(root)
+        c6.translation = (0.5, 0.5, 0.)
+        outstr += self._check(root)
+        c5.region.surface.r = 0.3
+        outstr += self._check(root)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = PlotRasterTestHarness()
+    harness.main()
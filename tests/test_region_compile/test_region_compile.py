@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import copy
+import os
+import pickle
+import sys
+import timeit
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+import openmc
+
+
+def random_region(surfaces, rng, depth):
+    """Build a random region from the half-spaces of a set of surfaces."""
+    if depth == 0 or rng.rand() < 0.2:
+        surface = surfaces[rng.randint(len(surfaces))]
+        return +surface if rng.rand() < 0.5 else -surface
+    kind = rng.randint(3)
+    if kind == 2:
+        return ~random_region(surfaces, rng, depth - 1)
+    nodes = [random_region(surfaces, rng, depth - 1)
+             for _ in range(rng.randint(1, 4))]
+    return openmc.Intersection(*nodes) if kind == 0 else openmc.Union(*nodes)
+
+
+class RegionCompileTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        rng = np.random.RandomState(1)
+        surfaces = [
+            openmc.XPlane(surface_id=1, x0=0.2),
+            openmc.YPlane(surface_id=2, y0=-0.3),
+            openmc.ZPlane(surface_id=3, z0=0.1),
+            openmc.Plane(surface_id=4, A=1., B=1., C=0., D=0.5),
+            openmc.ZCylinder(surface_id=5, x0=0.1, R=0.6),
+            openmc.Sphere(surface_id=6, y0=0.2, R=0.8),
+            openmc.Quadric(surface_id=7, a=1., b=-1., k=-0.1)
+        ]
+        points = rng.uniform(-1., 1., (500, 3))
+
+        outstr = ''
+        for n in range(50):
+            region = random_region(surfaces, rng, 4)
+            program = region.compile()
+            expected = np.array([tuple(p) in region for p in points])
+
+            # Evaluate all points at once and each point on its own
+            assert np.array_equal(program.evaluate(points), expected)
+            assert [tuple(p) in program for p in points] == list(expected)
+
+            # Evaluating with shared surface senses gives the same result
+            senses = {}
+            random_region(surfaces, rng, 2).compile().evaluate(points, senses)
+            assert np.array_equal(program.evaluate(points, senses), expected)
+
+            outstr += '{} {} {}\n'.format(n, len(program.instructions),
+                                          expected.sum())
+
+        # A cell recompiles its region when it is modified in place
+        cell = openmc.Cell(cell_id=1, region=-surfaces[5])
+        cell.region &= +surfaces[4]
+        assert (0.1, 0., 0.) not in cell
+        assert (0.1, 0.75, 0.) in cell
+        cell.region.nodes.append(-surfaces[1])
+        assert (0.1, 0.75, 0.) not in cell
+        cell.region.nodes[0] = +surfaces[5]
+        assert (0.1, -0.5, 0.) not in cell
+        assert (0.1, -1., 0.) in cell
+        outstr += str(cell.region) + '\n'
+
+        # The program is reused until a node of the region is modified
+        program = cell._compiled_region()
+        assert (0.1, -1., 0.) in cell
+        assert cell._compiled_region() is program
+        cell.region.nodes[1].side = '-'
+        assert cell._compiled_region() is not program
+        assert (0.1, -1., 0.) not in cell
+        del cell.region.nodes[1]
+        assert (0.1, -1., 0.) in cell
+        outstr += str(cell.region) + '\n'
+
+        # Copies keep track of modifications to their own regions
+        for clone in (copy.deepcopy(cell), pickle.loads(pickle.dumps(cell))):
+            assert (0.1, -1., 0.) in clone
+            clone.region.nodes.append(-surfaces[5])
+            assert (0.1, -1., 0.) not in clone
+            assert (0.1, -1., 0.) in cell
+
+        # Locating points with compiled regions is not slower than testing
+        # each point against the regions of the cells in turn
+        region = +openmc.XPlane(x0=-10.) & -openmc.XPlane(x0=10.)
+        for i in range(300):
+            region &= +openmc.Sphere(x0=50. + i, R=0.001)
+        cells = [openmc.Cell(region=-openmc.Sphere(x0=100. + i, R=0.5))
+                 for i in range(5)] + [openmc.Cell(region=region)]
+        universe = openmc.Universe(cells=cells)
+        points = [tuple(p) for p in rng.uniform(-5., 5., (200, 3))]
+
+        def linear_search():
+            return [next(c for c in cells if p in c.region) for p in points]
+
+        def find():
+            return [universe.find(p)[-1] for p in points]
+
+        assert find() == linear_search()
+        t_linear = min(timeit.repeat(linear_search, number=1, repeat=3))
+        t_find = min(timeit.repeat(find, number=1, repeat=3))
+        assert t_find < 1.2*t_linear
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = RegionCompileTestHarness()
+    harness.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+from numpy.polynomial import Polynomial
+import pandas as pd
+import openmc.data
+from openmc.data import resonance
+
+
+COLUMNS = ['energy', 'L', 'J', 'totalWidth', 'neutronWidth', 'captureWidth',
+           'fissionWidth', 'competitiveWidth']
+
+
+def make_range(cls, records, energy_min=1.0, energy_max=1000.0):
+    """Return resolved resonance data for s- and p-wave resonances."""
+    channel = {0: Polynomial((0.60,)), 1: Polynomial((0.62,))}
+    scattering = {0: Polynomial((0.65,)), 1: Polynomial((0.64,))}
+    rrr = cls(0.5, energy_min, energy_max, channel, scattering)
+    rrr.atomic_weight_ratio = 233.0248
+    rrr.q_value = {0: 0.0, 1: 0.0}
+    rrr.parameters = pd.DataFrame.from_records(records, columns=COLUMNS)
+    return rrr
+
+
+def random_records(rng):
+    """Return parameters of random s- and p-wave resonances."""
+    records = []
+    for l, n_res in ((0, 10), (1, 6)):
+        for E in np.exp(rng.uniform(np.log(2.0), np.log(900.0), n_res)):
+            J = float(rng.randint(0, 2 + l))
+            gn = 1e-3*E**0.5*rng.uniform(0.5, 2.0)
+            gg = rng.uniform(0.02, 0.05)
+            gf = rng.uniform(0.0, 0.2)
+            records.append([E, l, J, gn + gg + gf, gn, gg, gf, 0.0])
+    return records
+
+
+class ResonanceLinearizeTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+        rng = np.random.RandomState(3)
+
+        # At the peak of an isolated s-wave resonance, the capture and fission
+        # cross sections are 4*pi*g*gn*gx/(k*gt)**2
+        E_r, J, gn, gg, gf = 6.67, 1.0, 1.5e-3, 0.023, 0.01
+        gt = gn + gg + gf
+        for cls in (openmc.data.SingleLevelBreitWigner,
+                    openmc.data.MultiLevelBreitWigner):
+            rrr = make_range(cls, [[E_r, 0, J, gt, gn, gg, gf, 0.0]],
+                             1.0, 20.0)
+            x, xs = rrr.linearize(1e-3)
+            peak = np.flatnonzero(x == E_r)
+            assert peak.size == 1
+
+            k = resonance.wave_number(rrr.atomic_weight_ratio, E_r)
+            g = (2*J + 1)/(4*rrr.target_spin + 2)
+            for mt, width in ((102, gg), (18, gf)):
+                reference = 4*np.pi*g*gn*width/(k*gt)**2
+                assert np.isclose(xs[mt][peak[0]], reference, rtol=1e-12)
+                outstr += '{:.6e}\n'.format(xs[mt][peak[0]])
+
+        records = random_records(rng)
+        E_test = np.exp(rng.uniform(0., np.log(1000.), 100000))
+        for cls in (openmc.data.SingleLevelBreitWigner,
+                    openmc.data.MultiLevelBreitWigner):
+            rrr = make_range(cls, records)
+            reference = rrr.reconstruct(E_test)
+
+            n_points = []
+            for tolerance in (1e-2, 1e-3):
+                x, xs = rrr.linearize(tolerance)
+                n_points.append(x.size)
+
+                # The grid is increasing and spans the range, including the
+                # energy of every resonance
+                assert np.all(np.diff(x) > 0)
+                assert x[0] == rrr.energy_min and x[-1] == rrr.energy_max
+                assert np.all(np.in1d(rrr.parameters['energy'], x))
+
+                # Cross sections on the grid are the reconstructed ones
+                for mt, y in rrr.reconstruct(x).items():
+                    assert np.array_equal(xs[mt], y)
+
+                # Linear interpolation between grid points reproduces the
+                # cross sections within the tolerance. Only midpoints are
+                # checked during refinement, so allow a small margin.
+                for mt in (2, 102, 18):
+                    error = np.abs(np.interp(E_test, x, xs[mt]) -
+                                   reference[mt])
+                    assert np.all(error <= 1.1*tolerance*np.abs(reference[mt])
+                                  + 1e-4)
+
+            assert n_points[0] < n_points[1]
+
+            # Requested energies are kept if they lie within the range
+            x, xs = rrr.linearize(1e-2, energies=[0.5, 3.3, 500.0, 2000.0])
+            assert np.all(np.in1d([1.0, 3.3, 500.0, 1000.0], x))
+            assert x[0] == 1.0 and x[-1] == 1000.0
+
+            E = rrr.parameters['energy'].values[:4]
+            x, xs = rrr.linearize(1e-3)
+            for mt in (2, 102, 18):
+                outstr += ' '.join('{:.6e}'.format(xs[mt][x == e][0])
+                                   for e in E) + '\n'
+
+        # Tolerances must be positive
+        try:
+            rrr.linearize(0.0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('linearize accepted a zero tolerance')
+
+        return outstr
+
+
+if __name__ == '__main__':
+    # Without the compiled extension, resonances cannot be reconstructed
+    if not resonance._reconstruct:
+        print('----------------Skipping test-------------')
+        shutil.copy('results_true.dat', 'results_test.dat')
+        exit()
+    harness = ResonanceLinearizeTestHarness()
+    harness.main()
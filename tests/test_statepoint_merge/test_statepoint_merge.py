@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+import glob
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+from openmc.statepoint import _combined_keff
+
+
+def k_samples(n, rng):
+    """Return correlated collision, absorption and track-length estimates."""
+    common = rng.normal(size=(n, 1))
+    return 1. + 0.01*common + 0.005*rng.normal(size=(n, 3))
+
+
+def gls_keff(samples):
+    """Return the minimum variance combination of the estimates and its
+    standard deviation."""
+    cov = np.cov(samples.T)
+    weights = np.linalg.solve(cov, np.ones(cov.shape[0]))
+    std_dev = np.sqrt(1. / weights.sum() / len(samples))
+    weights /= weights.sum()
+    return weights.dot(samples.mean(axis=0)), std_dev
+
+
+def combined(samples):
+    """Return the combined estimate computed from the sums of samples."""
+    return _combined_keff(
+        len(samples), samples.sum(axis=0), (samples**2).sum(axis=0),
+        np.sum(samples[:, 0]*samples[:, 1]),
+        np.sum(samples[:, 0]*samples[:, 2]),
+        np.sum(samples[:, 1]*samples[:, 2]))
+
+
+class StatePointMergeTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+        rng = np.random.RandomState(1)
+
+        # Three simulations with different numbers of realizations
+        samples = [k_samples(n, rng) for n in (8, 12, 10)]
+        results = []
+        for i, k in enumerate(samples):
+            data = [rng.uniform(size=(5, 2, 2)), rng.uniform(size=(3, 1, 2))]
+            results.append(data)
+            tallies = [
+                {'id': 1, 'filters': [('cell', [1, 2, 3, 4, 5], 5)],
+                 'nuclides': ['total'], 'scores': ['flux', 'total'],
+                 'results': data[0]},
+                {'id': 7, 'filters': [('cell', [1, 2, 3], 3)],
+                 'nuclides': ['total'], 'scores': ['fission'],
+                 'results': data[1]}]
+            write_statepoint('statepoint.{}.h5'.format(i), tallies, k,
+                             seed=i + 1)
+        filenames = ['statepoint.{}.h5'.format(i) for i in range(3)]
+        all_samples = np.concatenate(samples)
+
+        for processes in (1, 2):
+            merger = openmc.StatePointMerger(filenames, chunk_size=2,
+                                             processes=processes)
+            assert list(merger.tally_ids) == [1, 7]
+            merger.merge('statepoint.merged.h5')
+
+            with openmc.StatePoint('statepoint.merged.h5') as sp:
+                assert sp.n_realizations == 30
+                for j, tally_id in enumerate((1, 7)):
+                    tally = sp.get_tally(id=tally_id)
+                    assert tally.num_realizations == 30
+                    expected = sum(r[j] for r in results)
+                    assert np.allclose(tally.sum.ravel(),
+                                       expected[..., 0].ravel())
+                    assert np.allclose(tally.sum_sq.ravel(),
+                                       expected[..., 1].ravel())
+
+                # Global tallies and products of estimates are added
+                gt = sp.global_tallies
+                assert np.allclose(gt['mean'][:3], all_samples.mean(axis=0))
+                assert np.allclose(sp.k_col_abs, np.sum(
+                    all_samples[:, 0]*all_samples[:, 1]))
+
+                # The combined estimate is that of all the realizations
+                k_combined = sp.k_combined
+                mean, std_dev = gls_keff(all_samples)
+                assert np.allclose(k_combined[0], mean)
+                assert np.isclose(k_combined[1], std_dev, rtol=0.1)
+                assert np.allclose(k_combined, combined(all_samples))
+                assert sp.k_generation is None
+                assert sp.entropy is None
+                assert not sp.cmfd_on
+
+        outstr += ' '.join('{:.6e}'.format(x) for x in k_combined) + '\n'
+        outstr += ' '.join('{:.6e}'.format(x) for x in gt['mean']) + '\n'
+        outstr += ' '.join('{:.6e}'.format(x) for x in
+                           tally.mean.ravel()) + '\n'
+
+        # If two estimators are the same, the other two are combined
+        same = all_samples.copy()
+        same[:, 1] = same[:, 0]
+        k = combined(same)
+        assert np.allclose(k[0], gls_keff(same[:, [0, 2]])[0])
+        outstr += ' '.join('{:.6e}'.format(x) for x in k) + '\n'
+
+        # Too few realizations give no estimate
+        assert np.all(np.isnan(combined(all_samples[:3])))
+
+        return outstr
+
+    def _cleanup(self):
+        super(StatePointMergeTestHarness, self)._cleanup()
+        for f in glob.glob('statepoint.*.h5'):
+            os.remove(f)
+
+
+if __name__ == '__main__':
+    harness = StatePointMergeTestHarness()
+    harness.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+
+
+def results(value):
+    """Return the results of a tally over two cells with a given mean."""
+    data = np.zeros((2, 1, 2))
+    data[:, 0, 0] = [10.*value, 20.*value]
+    data[:, 0, 1] = [10.*value**2, 40.*value**2]
+    return data
+
+
+def write(filename, value):
+    """Write a statepoint by replacing the file, as a new run would."""
+    tally = {'id': 1, 'filters': [('cell', [1, 2], 2)], 'nuclides': ['total'],
+             'scores': ['flux'], 'results': results(value)}
+    write_statepoint(filename + '.tmp', [tally])
+    os.rename(filename + '.tmp', filename)
+
+
+class StatePointReopenTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        # A statepoint rewritten while another statepoint still has it open
+        # is read again
+        write('statepoint.10.h5', 1.)
+        sp1 = openmc.StatePoint('statepoint.10.h5')
+        mean1 = sp1.get_tally(id=1).mean.ravel()
+        write('statepoint.10.h5', 2.)
+        sp2 = openmc.StatePoint('statepoint.10.h5')
+        mean2 = sp2.get_tally(id=1).mean.ravel()
+        assert np.allclose(mean2, 2.*mean1)
+        outstr += ' '.join('{:.6e}'.format(x) for x in
+                           np.concatenate((mean1, mean2))) + '\n'
+        sp1.close()
+        sp2.close()
+        assert not openmc.statepoint._OPEN_FILES
+
+        # Results are read lazily from the same file after changing the
+        # working directory
+        sp = openmc.StatePoint('statepoint.10.h5')
+        tally = sp.get_tally(id=1)
+        cwd = os.getcwd()
+        os.chdir(os.pardir)
+        try:
+            mean = tally.mean.ravel()
+            sp.close()
+        finally:
+            os.chdir(cwd)
+        assert not openmc.statepoint._OPEN_FILES
+        outstr += ' '.join('{:.6e}'.format(x) for x in mean) + '\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = StatePointReopenTestHarness()
+    harness.main()
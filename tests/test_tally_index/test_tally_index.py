@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+import copy
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+
+
+def tally(tally_id, name, scores, cells):
+    """Return a tally over cells for the statepoint writer."""
+    return {'id': tally_id, 'name': name, 'nuclides': ['total'],
+            'filters': [('cell', cells, len(cells))], 'scores': scores,
+            'results': np.ones((len(cells), len(scores), 2))}
+
+
+def energy_tally(tally_id, energies):
+    """Return a tally over energy groups for the statepoint writer."""
+    n = len(energies) - 1
+    return {'id': tally_id, 'name': 'energy', 'nuclides': ['total'],
+            'filters': [('energy', energies, n)], 'scores': ['flux'],
+            'results': np.ones((n, 1, 2))}
+
+
+class TallyIndexTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        write_statepoint('statepoint.10.h5', [
+            tally(1, 'flux', ['flux'], [1, 2]),
+            tally(2, 'rates', ['total', 'absorption'], [1, 2]),
+            tally(3, 'fission', ['fission'], [3]),
+            energy_tally(5, [0., 0.625, 2.e7]),
+            energy_tally(6, [0., 0.645000001, 2.e7]),
+            energy_tally(7, [0., 1., 2.e7]),
+            energy_tally(8, [0., 1., 1.e3, 2.e7])])
+
+        def query(**kwargs):
+            try:
+                return str(sp.get_tally(**kwargs).id)
+            except LookupError:
+                return 'none'
+
+        with openmc.StatePoint('statepoint.10.h5') as sp:
+            outstr += ' '.join([query(name='flux'), query(scores=['fission']),
+                                query(name='renamed')]) + '\n'
+
+            # Renaming a tally and reassigning its scores are seen by the
+            # next lookup
+            sp.tallies[1].name = 'renamed'
+            sp.tallies[3].scores = ['nu-fission']
+            outstr += ' '.join([query(name='flux'), query(name='renamed'),
+                                query(scores=['fission']),
+                                query(scores=['nu-fission'])]) + '\n'
+
+            # So are tallies added to and removed from the statepoint
+            new = copy.deepcopy(sp.tallies[2])
+            new.id = 4
+            new.name = 'added'
+            sp.tallies[4] = new
+            outstr += ' '.join([query(name='added'), query(name='rates'),
+                                query(scores=['absorption'],
+                                      name='added')]) + '\n'
+            del sp.tallies[2]
+            outstr += ' '.join([query(name='rates'),
+                                query(scores=['absorption'])]) + '\n'
+            sp.tallies[2] = openmc.Tally(2, 'replaced')
+            sp.tallies[2].estimator = 'analog'
+            outstr += ' '.join([query(name='replaced'),
+                                query(estimator='analog')]) + '\n'
+
+            # Changes to copies of a tally do not invalidate the index
+            index = sp._tally_index
+            sliced = sp.tallies[1].get_slice(scores=['flux'])
+            sliced.name = 'slice'
+            outstr += query(name='slice') + '\n'
+            assert sp._tally_index is index
+
+            # Lists of filters, nuclides and scores modified in place and
+            # filter bins that are reassigned are seen by the next lookup
+            sp.tallies[1].scores.append('total')
+            outstr += query(scores=['total'], name='renamed') + '\n'
+            del sp.tallies[1].scores[0]
+            outstr += query(scores=['flux']) + '\n'
+            sp.tallies[3].filters[0].bins = [4]
+            outstr += ' '.join([query(filters=[openmc.CellFilter([3])]),
+                                query(filters=[openmc.CellFilter([4])])]) + '\n'
+            sp.tallies[4].nuclides[0] = 'U235'
+            outstr += query(nuclides=['U235']) + '\n'
+
+            # Copies of the lists are detached from the tally
+            index = sp._tally_index
+            scores = sp.tallies[4].scores + ['flux']
+            scores.append('fission')
+            query(name='added')
+            assert sp._tally_index is index
+
+            # Real-valued filters are indexed by their rounded bins, including
+            # bins within the tolerance of a rounding boundary
+            def candidates(energies):
+                return [t.id for t in sp._tally_candidates(
+                    [], [openmc.EnergyFilter(energies)], [], None, None, None)]
+
+            assert candidates([0., 0.625, 2.e7]) == [5]
+            assert candidates([0., 0.625*(1. + 1e-7), 2.e7]) == [5]
+            assert candidates([0., 0.644999999, 2.e7]) == [6]
+            assert candidates([1e-12, 1., 2.e7]) == [7]
+            assert candidates([0., 1., 1.e3, 2.e7]) == [8]
+            assert candidates([0., 0.7, 2.e7]) == []
+            for energies in ([0., 0.625, 2.e7], [0., 0.644999999, 2.e7],
+                             [0., 1., 1.e3, 2.e7], [0., 0.7, 2.e7]):
+                outstr += query(filters=[openmc.EnergyFilter(energies)]) + ' '
+            outstr += '\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = TallyIndexTestHarness()
+    harness.main()
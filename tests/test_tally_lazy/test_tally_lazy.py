@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+import openmc.statepoint
+
+
+class CountingOpen(object):
+    """Count how often the results of a statepoint file are opened."""
+    def __init__(self, shared_file):
+        self._shared_file = shared_file
+        self.count = 0
+
+    def __call__(self, filename):
+        self.count += 1
+        return self._shared_file(filename)
+
+
+class TallyLazyTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        # A tally over eight cells with two scores
+        n = 10
+        x = np.arange(1., 17.).reshape(8, 2)
+        results = np.empty((8, 2, 2))
+        results[..., 0] = n*x
+        results[..., 1] = n*x**2 + x
+        tally = {'id': 1, 'filters': [('cell', list(range(1, 9)), 8)],
+                 'nuclides': ['total'], 'scores': ['flux', 'total'],
+                 'results': results}
+        write_statepoint('statepoint.10.h5', [tally], np.ones((n, 3)))
+
+        with openmc.StatePoint('statepoint.10.h5') as sp:
+            reference = sp.get_tally(id=1)
+            values = {v: getattr(reference, v) for v in
+                      ('mean', 'std_dev', 'sum', 'sum_sq')}
+            values['rel_err'] = values['std_dev'] / values['mean']
+
+        shared_file = openmc.statepoint._shared_file
+        counter = CountingOpen(shared_file)
+        openmc.statepoint._shared_file = counter
+        try:
+            sp = openmc.StatePoint('statepoint.10.h5')
+            tally = sp.get_tally(id=1)
+            cells = [7, 2, 7, 5]
+            bins = [c - 1 for c in cells]
+
+            # Values are read on demand for the requested bins
+            for value in ('mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'):
+                data = tally.get_values(filters=[openmc.CellFilter],
+                                        filter_bins=[tuple(cells)],
+                                        value=value)
+                assert np.allclose(data, values[value][bins])
+                outstr += value + ' ' + ' '.join(
+                    '{:.6e}'.format(v) for v in data.ravel()) + '\n'
+            assert counter.count == 1
+            assert tally._lazy_results._rows.tolist() == [1, 4, 6]
+
+            # Bins that were already read are not read again
+            tally.get_values(filters=[openmc.CellFilter],
+                             filter_bins=[(2, 5)])
+            sliced = tally.get_slice(filters=[openmc.CellFilter],
+                                     filter_bins=[(5, 7)])
+            assert counter.count == 1
+            assert np.allclose(sliced.mean, values['mean'][[4, 6]])
+
+            # Only the missing bins are read
+            data = tally.get_values(filters=[openmc.CellFilter],
+                                    filter_bins=[(8, 2, 1)], scores=['total'])
+            assert counter.count == 2
+            assert tally._lazy_results._rows.tolist() == [0, 1, 4, 6, 7]
+            assert np.allclose(data, values['mean'][[7, 1, 0]][..., 1:])
+
+            # Reading the full results releases the rows read on demand
+            assert np.allclose(tally.mean, values['mean'])
+            assert tally._lazy_results is None
+            data = tally.get_values(filters=[openmc.CellFilter],
+                                    filter_bins=[tuple(cells)])
+            assert np.allclose(data, values['mean'][bins])
+            sp.close()
+        finally:
+            openmc.statepoint._shared_file = shared_file
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = TallyLazyTestHarness()
+    harness.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+import copy
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+
+
+class TallySparseTestHarness(PyAPIUnitTestHarness):
+    def _build_tally(self):
+        """Build a tally with mostly zero data."""
+        tally = openmc.Tally(tally_id=1)
+        tally.filters = [openmc.EnergyFilter([0., 1., 2., 3.]),
+                         openmc.CellFilter([1, 2])]
+        tally.nuclides = ['U235', 'U238']
+        tally.scores = ['total', 'fission', 'absorption']
+
+        rng = np.random.RandomState(1)
+        mean = rng.uniform(1., 2., tally.shape)
+        mean[rng.uniform(size=tally.shape) < 0.6] = 0.
+        tally._mean = mean
+        tally._std_dev = 0.1*mean
+        tally._derived = True
+        tally._num_realizations = 10
+        tally._update_filter_strides()
+        return tally
+
+    def _check_dataframe(self, sparse, dense):
+        """Compare the DataFrames of a sparse tally and a dense tally."""
+        df_sparse = sparse.get_pandas_dataframe()
+        df_dense = dense.get_pandas_dataframe()
+
+        # DataFrames of sparse tallies have a row for every bin, but only
+        # store the nonzero results
+        assert len(df_sparse) == dense.num_bins
+        assert df_sparse.columns.equals(df_dense.columns)
+        for column in df_dense.columns:
+            values = df_dense[column].values
+            if column[0] in ('mean', 'std. dev.'):
+                assert df_sparse[column].sparse.npoints == \
+                    np.count_nonzero(values)
+                assert np.array_equal(np.asarray(df_sparse[column]), values)
+            else:
+                assert df_sparse[column].equals(df_dense[column])
+
+    def _get_results(self):
+        dense = self._build_tally()
+        sparse = self._build_tally()
+        sparse.sparse = True
+        self._check_dataframe(sparse, dense)
+
+        outstr = ''
+        sums = [
+            {'filter_type': openmc.EnergyFilter},
+            {'filter_type': openmc.EnergyFilter, 'filter_bins': [(0., 1.),
+                                                                 (1., 2.)]},
+            {'filter_type': openmc.CellFilter, 'filter_bins': [2],
+             'remove_filter': True},
+            {'nuclides': ['U235', 'U238']},
+            {'scores': ['fission', 'absorption']},
+            {'filter_type': openmc.CellFilter, 'nuclides': ['U238'],
+             'scores': ['total', 'fission']}
+        ]
+        for kwargs in sums:
+            sum_dense = dense.summation(**kwargs)
+            sum_sparse = sparse.summation(**kwargs)
+            assert sum_sparse.sparse
+            assert sum_sparse.shape == sum_dense.shape
+            assert np.allclose(sum_sparse.mean, sum_dense.mean)
+            assert np.allclose(sum_sparse.std_dev, sum_dense.std_dev)
+            self._check_dataframe(sum_sparse, sum_dense)
+            outstr += ' '.join('{:.6e}'.format(x) for x in
+                               sum_sparse.mean.ravel()) + '\n'
+
+        # Results of sparse tallies are read a block of filter bins at a time
+        results = np.zeros((100, 2, 2))
+        results[::7, 1] = [10., 12.]
+        tally = {'id': 2, 'filters': [('cell', list(range(1, 101)), 100)],
+                 'nuclides': ['total'], 'scores': ['flux', 'total'],
+                 'results': results}
+        write_statepoint('statepoint.10.h5', [tally])
+
+        read_size = openmc.tallies._SPARSE_READ_SIZE
+        openmc.tallies._SPARSE_READ_SIZE = 80
+        try:
+            with openmc.StatePoint('statepoint.10.h5') as sp:
+                dense = sp.get_tally(id=2)
+                sparse = copy.deepcopy(dense)
+                sparse.sparse = True
+                blocks = []
+                to_sparse = sparse._to_sparse
+                sparse._to_sparse = lambda data: blocks.append(
+                    len(data)) or to_sparse(data)
+                assert sparse.sparse and not sparse._results_read
+                assert sparse._get_results('sum').nnz == 15
+                assert blocks == [20]*10
+                assert np.array_equal(sparse.mean, dense.mean)
+                self._check_dataframe(sparse, dense)
+        finally:
+            openmc.tallies._SPARSE_READ_SIZE = read_size
+
+        return outstr
+
+    def _cleanup(self):
+        super(TallySparseTestHarness, self)._cleanup()
+        if os.path.exists('statepoint.10.h5'):
+            os.remove('statepoint.10.h5')
+
+
+if __name__ == '__main__':
+    harness = TallySparseTestHarness()
+    harness.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPIUnitTestHarness
+from statepoint_writer import write_statepoint
+import numpy as np
+import openmc
+import openmc.statepoint
+
+
+class CountingOpen(object):
+    """Count how often the results of a statepoint file are opened."""
+    def __init__(self, shared_file):
+        self._shared_file = shared_file
+        self.count = 0
+
+    def __call__(self, filename):
+        self.count += 1
+        return self._shared_file(filename)
+
+
+class TallyStreamTestHarness(PyAPIUnitTestHarness):
+    def _get_results(self):
+        outstr = ''
+
+        # A tally over 1000 cells with two nuclides and two scores
+        n = 10
+        n_cells = 1000
+        rng = np.random.RandomState(1)
+        x = rng.uniform(0., 1., (n_cells, 4))
+        x[rng.uniform(0., 1., x.shape) < 0.5] = 0.
+        results = np.empty((n_cells, 4, 2))
+        results[..., 0] = n*x
+        results[..., 1] = n*x**2 + x
+        tally = {'id': 1,
+                 'filters': [('cell', list(range(1, n_cells + 1)), n_cells)],
+                 'nuclides': ['U235', 'total'], 'scores': ['flux', 'total'],
+                 'results': results}
+        write_statepoint('statepoint.10.h5', [tally], np.ones((n, 3)))
+
+        with openmc.StatePoint('statepoint.10.h5') as sp:
+            df = sp.get_tally(id=1).get_pandas_dataframe()
+
+        shared_file = openmc.statepoint._shared_file
+        counter = CountingOpen(shared_file)
+        openmc.statepoint._shared_file = counter
+        try:
+            sp = openmc.StatePoint('statepoint.10.h5')
+            tally = sp.get_tally(id=1)
+
+            # Each batch is read with one access to the statepoint, and no
+            # rows are kept once the batch has been produced
+            batches = list(tally._iter_columns(100))
+            assert len(batches) == n_cells // 25
+            assert counter.count == len(batches)
+            assert tally._lazy_results is None
+            assert not tally._results_read
+
+            # The batches make up the rows of the full DataFrame
+            for name in ('mean', 'std. dev.'):
+                column = np.concatenate([b[name] for b in batches])
+                assert np.array_equal(column, df[name].values.ravel())
+            cells = np.concatenate([b['cell'] for b in batches])
+            assert np.array_equal(cells, df['cell'].values.ravel())
+
+            # Streaming a tally whose results were read uses them instead
+            tally.mean
+            count = counter.count
+            streamed = np.concatenate(
+                [b['mean'] for b in tally._iter_columns(300)])
+            assert counter.count == count
+            assert np.array_equal(streamed, df['mean'].values.ravel())
+            sp.close()
+        finally:
+            openmc.statepoint._shared_file = shared_file
+
+        for b in batches[:2]:
+            outstr += ' '.join('{:.6e}'.format(v) for v in b['mean'][:8])
+            outstr += '\n'
+            outstr += ' '.join('{:.6e}'.format(v)
+                               for v in b['std. dev.'][:8]) + '\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = TallyStreamTestHarness()
+    harness.main()
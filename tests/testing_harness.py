@@ -338,3 +338,33 @@ class HashedPyAPITestHarness(PyAPITestHarness):
     def _get_results(self):
         """Digest info in the statepoint and return as a string."""
         return super(HashedPyAPITestHarness, self)._get_results(True)
+
+
+class PyAPIUnitTestHarness(TestHarness):
+    """Specialized TestHarness for tests of the Python API alone.
+
+    OpenMC is not run. The results are produced entirely by
+    :meth:`_get_results`.
+
+    """
+
+    def __init__(self):
+        super(PyAPIUnitTestHarness, self).__init__(None)
+
+    def execute_test(self):
+        """Compute the results and check them against the _true standard."""
+        try:
+            results = self._get_results()
+            self._write_results(results)
+            self._compare_results()
+        finally:
+            self._cleanup()
+
+    def update_results(self):
+        """Update results_true.dat using the current Python API."""
+        try:
+            results = self._get_results()
+            self._write_results(results)
+            self._overwrite_results()
+        finally:
+            self._cleanup()